@@ -24,6 +24,10 @@
 #    image: "quay.io/kuadrant/grpcbin:latest"      # Grpcbin image for gRPC backend tests
 #  httpbin:
 #    image: "HTTPBIN_IMAGE"
+#  local_oidc:
+#    bind: "0.0.0.0"                            # Address of the in-process JWKS server used by the local OIDC provider
+#    port: 0                                    # Port of the JWKS server, 0 picks a random one
+#    issuer: "http://10.0.0.1:8080"             # URL under which the server is reachable from Authorino, required if bind is loopback or 0.0.0.0
 #  llm_sim:
 #    image: "ghcr.io/llm-d/llm-d-inference-sim:v0.1.1"   # LLM simulator image that mimics an LLM service for testing token rate limiting
 #  mockserver:
@@ -33,14 +37,25 @@
 #    url: "http://vault.example.com:8200"               # External Vault URL (auto-fetched from tools-vault namespace LoadBalancer)
 #    token: "root"                                      # Vault root token (defaults to dev mode token)
 #  tracing:
-#    backend: "jaeger"                          # Tracing backend
+#    backend: "jaeger"                          # Tracing backend, "jaeger", "tempo" or "local" (in-process OTLP receiver)
 #    collector_url: "rpc://jaeger-collector.com:4317"  # Tracing collector URL (may be internal)
 #    query_url: "http://jaeger-query.com"       # Tracing query URL
+#    local:                                     # Only for the "local" backend
+#      bind: "0.0.0.0"                          # Address on which the OTLP receivers listen
+#      grpc_port: 4317                          # OTLP/gRPC port, 0 picks a random one
+#      http_port: 4318                          # OTLP/HTTP port, 0 picks a random one
+#      host: "10.0.0.1"                         # Address under which the receivers are reachable from the cluster, required if bind is loopback or 0.0.0.0
 #  prometheus:
 #    url: "http://172.18.255.200:9090"            # Overrides pre-defined auto-discovery (OpenShift/Kind), use with care
 #    project: "openshift-monitoring"              # Project where Prometheus is deployed, default value for OpenShift, for Kind it will be "monitoring"
 #    service: "thanos-querier"                    # Service name of the Prometheus querier, default value for OpenShift, for Kind it will be "prometheus-kube-prometheus-prometheus"
 #  cfssl: "cfssl"  # Path to the CFSSL library for TLS tests
+#  certificates:
+#    signer: "cfssl"                            # How TLS certificates are generated, "cfssl" or "cryptography" (in-process)
+#    key_algorithm: "rsa"                       # "rsa" or "ecdsa", only for the "cryptography" signer
+#    key_size: 2048                             # RSA key size or ECDSA curve size (256, 384, 521)
+#    cache_dir: ""                              # Generated certificates are reused from this directory, empty disables the cache
+#    cache_authorities: false                   # Also store CA certificates with their private keys unencrypted in the cache_dir
 #  service_protection:
 #    system_project: "kuadrant-system"           # Namespace where Kuadrant resource resides
 #    project: "kuadrant"                         # Namespace where tests will run
@@ -62,6 +77,7 @@
 #        api_url: "https://api.kubernetes.com"     # Optional: Kubernetes API URL, if None it will use Kubernetes that you are logged in
 #        token: "KUADRANT_RULEZ"                   # Optional: Kubernetes Token, if None it will Kubernetes that you are logged in
 #        kubeconfig_path: "~/.kube/config"         # Optional: Kubeconfig to use, if None the default one is used
+#        backend: "oc"                             # Optional: "http" makes objects talk to the API server directly instead of spawning oc
 #    cluster2:                                     # Second cluster for the multicluster tests
 #        api_url: "https://api.kubernetes2.com"
 #        token: "KUADRANT_RULEZ"
@@ -83,7 +83,6 @@ class MockserverBackend(Backend):
             volume_mounts=self.config.volume_mounts if self.config else None,
             env=self.config.env if self.config else None,
         )
-        self.deployment.commit()
 
         self.service = Service.create_instance(
             self.cluster,
@@ -93,7 +92,7 @@ class MockserverBackend(Backend):
             labels={"app": self.label},
             service_type=self.service_type,
         )
-        self.service.commit()
+        self.cluster.apply_many([self.deployment, self.service])
 
     def delete(self):
         try:
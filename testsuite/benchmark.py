@@ -0,0 +1,71 @@
+"""Collection of benchmark results and their comparison with a stored baseline"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Metrics compared with the baseline, True if higher value is better
+COMPARED_METRICS = {
+    "latency_ms.p50": False,
+    "latency_ms.p99": False,
+    "throughput": True,
+}
+
+
+def _metric(summary: dict, path: str) -> Optional[float]:
+    """Returns value of the dotted path in the summary or None if it is missing"""
+    value = summary
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value  # type: ignore
+
+
+class BenchmarkReport:
+    """
+    Results of named benchmarks (e.g. summaries of LoadResult) saved as a single JSON file.
+    Previously saved file can be used as a baseline, results worse than the baseline by more than `tolerance`
+    (relative, 0.2 means 20 %) are reported as regressions.
+    """
+
+    def __init__(self, baseline: Optional[dict] = None, tolerance: float = 0.2):
+        self.baseline = baseline or {}
+        self.tolerance = tolerance
+        self.results: dict[str, dict] = {}
+
+    @classmethod
+    def from_baseline_file(cls, path: Optional[Path], tolerance: float = 0.2) -> "BenchmarkReport":
+        """Creates report with the baseline loaded from the results file of a previous run, if it exists"""
+        if path is None or not path.exists():
+            return cls(tolerance=tolerance)
+        return cls(json.loads(path.read_text())["results"], tolerance)
+
+    def record(self, name: str, summary: dict) -> list[str]:
+        """Stores results of the benchmark and returns list of regressions against the baseline"""
+        regressions = self.compare(name, summary)
+        self.results[name] = {**summary, "regressions": regressions}
+        logger.info("Benchmark %s: %s", name, json.dumps(summary))
+        return regressions
+
+    def compare(self, name: str, summary: dict) -> list[str]:
+        """Returns human-readable regressions of the benchmark against the baseline, empty if there is no baseline"""
+        if name not in self.baseline:
+            return []
+        regressions = []
+        for path, higher_is_better in COMPARED_METRICS.items():
+            current, baseline = _metric(summary, path), _metric(self.baseline[name], path)
+            if current is None or not baseline:
+                continue
+            change = (current - baseline) / baseline
+            if (-change if higher_is_better else change) > self.tolerance:
+                regressions.append(f"{path}: {current} vs baseline {baseline} ({change:+.1%})")
+        return regressions
+
+    def save(self, path: Path):
+        """Saves all results into JSON file, which can be used as a baseline for later runs"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"tolerance": self.tolerance, "results": self.results}, indent=2))
@@ -1,19 +1,27 @@
 """Module containing classes for working with TLS certificates"""
 
+import abc
 import base64
 import dataclasses
 import datetime
+import hashlib
+import ipaddress
 import json
+import os
 import shutil
 import subprocess
+import tempfile
 from functools import cached_property
 from importlib import resources
-from typing import Optional, List, Dict, Collection, Union
+from pathlib import Path
+from typing import Optional, List, Dict, Collection, Union, cast
 from urllib.parse import quote
 
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.types import CertificatePublicKeyTypes
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes, CertificatePublicKeyTypes
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
 
 
 class CFSSLException(Exception):
@@ -112,8 +120,75 @@ def build_cert_request_json(
     }
 
 
-class CFSSLClient:
-    """Client for working with CFSSL library"""
+class CertificateCache:
+    """
+    On-disk content-addressed cache of generated certificates, so repeated sessions reuse them.
+    Entries are keyed by hash of everything the certificate is generated from, including the parent certificate.
+    Entries which are about to expire or were not used for `max_unused` are evicted when the cache is opened.
+    Certificate authorities (and their private keys) are only stored if `include_authorities` is set,
+    otherwise only leaf certificates signed by a CA created earlier in the same session can be reused.
+    """
+
+    # Certificates expiring sooner than this are generated again
+    MIN_VALIDITY = datetime.timedelta(days=7)
+
+    def __init__(
+        self,
+        directory: Path,
+        include_authorities: bool = False,
+        max_unused: datetime.timedelta = datetime.timedelta(days=7),
+    ) -> None:
+        self.directory = directory
+        self.include_authorities = include_authorities
+        self.max_unused = max_unused
+        # Entries contain private keys
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.evict()
+
+    def _valid(self, certificate: Certificate) -> bool:
+        expires = certificate.decoded.not_valid_after_utc - datetime.datetime.now(datetime.timezone.utc)
+        return expires > self.MIN_VALIDITY
+
+    def evict(self):
+        """Removes entries which are about to expire or were not used for max_unused"""
+        unused_since = (datetime.datetime.now() - self.max_unused).timestamp()
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < unused_since or not self._valid(
+                    Certificate(**json.loads(path.read_text(encoding="utf-8")))
+                ):
+                    path.unlink()
+            except (OSError, ValueError, TypeError):
+                # Corrupted entries are removed too, another process might have removed it already
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Returns cache key for the parts, which need to be JSON serializable"""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Certificate]:
+        """Returns cached certificate or None if there is none or it is about to expire"""
+        path = self.directory / f"{key}.json"
+        try:
+            certificate = Certificate(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not self._valid(certificate):
+            return None
+        # Modification time marks the last use, so entries used by every session are not evicted
+        path.touch(exist_ok=True)
+        return certificate
+
+    def put(self, key: str, certificate: Certificate):
+        """Stores the certificate, safe to be used by multiple processes at once"""
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, delete=False, encoding="utf-8") as file:
+            json.dump(dataclasses.asdict(certificate), file)
+        os.replace(file.name, self.directory / f"{key}.json")
+
+
+class CertificateSigner(abc.ABC):
+    """Common interface of all the ways to generate certificates, with optional caching"""
 
     DEFAULT_NAMES = [
         {
@@ -125,10 +200,115 @@ class CFSSLClient:
         }
     ]
 
-    def __init__(self, binary) -> None:
+    def __init__(self, cache: Optional[CertificateCache] = None) -> None:
         super().__init__()
+        self.cache = cache
+
+    @property
+    @abc.abstractmethod
+    def signer_id(self) -> str:
+        """Identification of the signer and its key settings, certificates from different signers are cached apart"""
+
+    def _cached(self, kind, common_name, hosts, names, parent: Optional[Certificate], generate) -> Certificate:
+        """Returns certificate from the cache if there is one, otherwise generates and caches it"""
+        if self.cache is None or (kind == "authority" and not self.cache.include_authorities):
+            return generate()
+        hosts = [hosts] if isinstance(hosts, str) else sorted(hosts or [])
+        key = self.cache.key(self.signer_id, kind, common_name, hosts, names, parent.certificate if parent else None)
+        certificate = self.cache.get(key)
+        if certificate is None:
+            certificate = generate()
+            self.cache.put(key, certificate)
+        return certificate
+
+    def create_authority(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: Optional[List[Dict[str, str]]] = None,
+        certificate_authority: Optional[Certificate] = None,
+    ) -> Certificate:
+        """Generates self-signed root or intermediate CA certificate and private key
+        Args:
+            :param common_name: identifier to the certificate and key.
+            :param hosts: list of hosts
+            :param names: dict of all names
+            :param certificate_authority: Optional Authority to sign this new authority, making it intermediate
+        """
+        names = names or self.DEFAULT_NAMES
+        return self._cached(
+            "authority",
+            common_name,
+            hosts,
+            names,
+            certificate_authority,
+            lambda: self._create_authority(common_name, hosts, names, certificate_authority),
+        )
+
+    def create(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        certificate_authority: Optional[Certificate] = None,
+        names: Optional[List[Dict[str, str]]] = None,
+    ) -> Certificate:
+        """Create a new certificate.
+        Args:
+            :param common_name: Exact DNS match for which this certificate is valid
+            :param hosts: Hosts field in the csr
+            :param names: Names field in the csr
+            :param certificate_authority: Certificate Authority to be used for signing
+        """
+        names = names or self.DEFAULT_NAMES
+        return self._cached(
+            "certificate",
+            common_name,
+            hosts,
+            names,
+            certificate_authority,
+            lambda: self._create(common_name, hosts, names, certificate_authority),
+        )
+
+    def create_from_info(
+        self, name: str, info: CertInfo, hosts: Collection[str], parent: Optional[Certificate]
+    ) -> Certificate:
+        """Creates certificate described by the CertInfo, CertInfo with children is always a Certificate Authority"""
+        if info.ca or info.children:
+            return self.create_authority(name, names=info.names, hosts=hosts, certificate_authority=parent)
+        return self.create(name, names=info.names, hosts=hosts, certificate_authority=parent)
+
+    @abc.abstractmethod
+    def _create_authority(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
+    ) -> Certificate:
+        """Generates CA certificate, see create_authority"""
+
+    @abc.abstractmethod
+    def _create(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
+    ) -> Certificate:
+        """Generates certificate, see create"""
+
+
+class CFSSLClient(CertificateSigner):
+    """Client for working with CFSSL library"""
+
+    def __init__(self, binary, cache: Optional[CertificateCache] = None) -> None:
+        super().__init__(cache)
         self.binary = binary
 
+    @property
+    def signer_id(self) -> str:
+        return "cfssl-rsa-4096"
+
     def _execute_command(
         self, command: str, *args: str, stdin: Optional[str] = None, env: Optional[Dict[str, str]] = None
     ):
@@ -204,21 +384,13 @@ class CFSSLClient:
         result = self._execute_command("selfsign", common_name, "-", stdin=json.dumps(data))
         return Certificate(key=result["key"], certificate=result["cert"], chain=result["cert"])
 
-    def create_authority(
+    def _create_authority(
         self,
         common_name: str,
         hosts: Collection[str],
-        names: Optional[List[Dict[str, str]]] = None,
-        certificate_authority: Optional[Certificate] = None,
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
     ) -> Certificate:
-        """Generates self-signed root or intermediate CA certificate and private key
-        Args:
-            :param common_name: identifier to the certificate and key.
-            :param hosts: list of hosts
-            :param names: dict of all names
-            :param certificate_authority: Optional Authority to sign this new authority, making it intermediate
-        """
-        names = names or self.DEFAULT_NAMES
         data = build_cert_request_json(common_name, names, hosts)
 
         result = self._execute_command("genkey", "-initca", "-", stdin=json.dumps(data))
@@ -228,24 +400,170 @@ class CFSSLClient:
             certificate = self.sign_intermediate_authority(key, certificate_authority)
         return certificate
 
-    def create(
+    def _create(
         self,
         common_name: str,
         hosts: Collection[str],
-        certificate_authority: Optional[Certificate] = None,
-        names: Optional[List[Dict[str, str]]] = None,
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
     ) -> Certificate:
-        """Create a new certificate.
-        Args:
-            :param common_name: Exact DNS match for which this certificate is valid
-            :param hosts: Hosts field in the csr
-            :param names: Names field in the csr
-            :param certificate_authority: Certificate Authority to be used for signing
-        """
-        names = names or self.DEFAULT_NAMES
         if certificate_authority is None:
-            certificate = self.self_sign(common_name, names, hosts)
+            return self.self_sign(common_name, names, hosts)
+        key = self.generate_key(common_name, names, hosts)
+        return self.sign(key, certificate_authority=certificate_authority)
+
+
+class CryptographySigner(CertificateSigner):
+    """
+    Generates and signs certificates in-process with the cryptography library, without the CFSSL binary.
+    Certificates have the same attributes and validity as the ones created by CFSSL with the default settings.
+    """
+
+    NAME_OIDS = {
+        "C": NameOID.COUNTRY_NAME,
+        "ST": NameOID.STATE_OR_PROVINCE_NAME,
+        "L": NameOID.LOCALITY_NAME,
+        "O": NameOID.ORGANIZATION_NAME,
+        "OU": NameOID.ORGANIZATIONAL_UNIT_NAME,
+    }
+    CURVES: dict[int, ec.EllipticCurve] = {256: ec.SECP256R1(), 384: ec.SECP384R1(), 521: ec.SECP521R1()}
+    CA_VALIDITY = datetime.timedelta(hours=43800)
+    VALIDITY = datetime.timedelta(hours=8760)
+    # Same as CFSSL, to tolerate clock skew between the testsuite and the cluster
+    BACKDATE = datetime.timedelta(minutes=5)
+
+    def __init__(
+        self, key_algorithm: str = "rsa", key_size: int = 2048, cache: Optional[CertificateCache] = None
+    ) -> None:
+        super().__init__(cache)
+        if key_algorithm not in ("rsa", "ecdsa"):
+            raise ValueError(f"Unsupported key algorithm {key_algorithm}, use rsa or ecdsa")
+        if key_algorithm == "ecdsa" and key_size not in self.CURVES:
+            raise ValueError(f"Unsupported ECDSA key size {key_size}, use one of {list(self.CURVES)}")
+        self.key_algorithm = key_algorithm
+        self.key_size = key_size
+
+    @property
+    def signer_id(self) -> str:
+        return f"cryptography-{self.key_algorithm}-{self.key_size}"
+
+    @property
+    def exists(self):
+        """Always True, present for compatibility with CFSSLClient"""
+        return True
+
+    def _generate_key(self) -> CertificateIssuerPrivateKeyTypes:
+        if self.key_algorithm == "ecdsa":
+            return ec.generate_private_key(self.CURVES[self.key_size])
+        return rsa.generate_private_key(public_exponent=65537, key_size=self.key_size)
+
+    def _subject(self, common_name: str, names: List[Dict[str, str]]) -> x509.Name:
+        attributes: list[x509.NameAttribute] = []
+        for name in names:
+            attributes.extend(x509.NameAttribute(oid, name[key]) for key, oid in self.NAME_OIDS.items() if key in name)
+        attributes.append(x509.NameAttribute(NameOID.COMMON_NAME, common_name))
+        return x509.Name(attributes)
+
+    @staticmethod
+    def _alternative_names(hosts: Union[Collection[str], str]) -> list[x509.GeneralName]:
+        """Sorts hosts into IPs, emails, URIs and DNS names, the same way as CFSSL does"""
+        result: list[x509.GeneralName] = []
+        for host in [hosts] if isinstance(hosts, str) else hosts:
+            try:
+                result.append(x509.IPAddress(ipaddress.ip_address(host)))
+                continue
+            except ValueError:
+                pass
+            if "@" in host:
+                result.append(x509.RFC822Name(host))
+            elif "://" in host:
+                result.append(x509.UniformResourceIdentifier(host))
+            else:
+                result.append(x509.DNSName(host))
+        return result
+
+    def _sign(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: List[Dict[str, str]],
+        issuer: Optional[Certificate],
+        ca: bool,
+    ) -> Certificate:
+        """Generates new key and certificate for it, signed by the issuer or self-signed"""
+        key = self._generate_key()
+        subject = self._subject(common_name, names)
+        if issuer:
+            issuer_key = cast(
+                CertificateIssuerPrivateKeyTypes,
+                serialization.load_pem_private_key(issuer.key.encode("utf-8"), password=None),
+            )
+            issuer_name = issuer.decoded.subject
         else:
-            key = self.generate_key(common_name, names, hosts)
-            certificate = self.sign(key, certificate_authority=certificate_authority)
+            issuer_key, issuer_name = key, subject
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer_name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - self.BACKDATE)
+            .not_valid_after(now + (self.CA_VALIDITY if ca else self.VALIDITY))
+            .add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True)
+            .add_extension(
+                x509.KeyUsage(
+                    digital_signature=True,
+                    content_commitment=False,
+                    key_encipherment=not ca,
+                    data_encipherment=False,
+                    key_agreement=False,
+                    key_cert_sign=ca,
+                    crl_sign=ca,
+                    encipher_only=False,
+                    decipher_only=False,
+                ),
+                critical=True,
+            )
+            .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+            .add_extension(
+                x509.AuthorityKeyIdentifier.from_issuer_public_key(issuer_key.public_key()),  # type: ignore
+                critical=False,
+            )
+        )
+        if not ca:
+            builder = builder.add_extension(
+                x509.ExtendedKeyUsage([ExtendedKeyUsageOID.SERVER_AUTH, ExtendedKeyUsageOID.CLIENT_AUTH]),
+                critical=False,
+            )
+        if hosts:
+            builder = builder.add_extension(x509.SubjectAlternativeName(self._alternative_names(hosts)), critical=False)
+
+        certificate = builder.sign(issuer_key, hashes.SHA256()).public_bytes(serialization.Encoding.PEM).decode("utf-8")
+        key_pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()
+        ).decode("utf-8")
+        return Certificate(key=key_pem, certificate=certificate, chain=certificate)
+
+    def _create_authority(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
+    ) -> Certificate:
+        # Same as CFSSL, intermediate authority chain contains only its own certificate
+        return self._sign(common_name, hosts, names, certificate_authority, ca=True)
+
+    def _create(
+        self,
+        common_name: str,
+        hosts: Collection[str],
+        names: List[Dict[str, str]],
+        certificate_authority: Optional[Certificate],
+    ) -> Certificate:
+        certificate = self._sign(common_name, hosts, names, certificate_authority, ca=False)
+        if certificate_authority:
+            return dataclasses.replace(certificate, chain=certificate.certificate + certificate_authority.chain)
         return certificate
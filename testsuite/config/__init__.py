@@ -2,7 +2,7 @@
 
 from dynaconf import Dynaconf, Validator
 
-from testsuite.utils import hostname_to_ip
+from testsuite.utils import hostname_to_ip, is_local_address
 from testsuite.config.tools import fetch_route, fetch_service, fetch_secret, fetch_service_ip, fetch_prometheus_url
 
 
@@ -39,11 +39,26 @@ settings = Dynaconf(
             Validator("service_protection.authorino.auth_url", must_exist=True)
             & Validator("service_protection.authorino.oidc_url", must_exist=True)
         ),
-        DefaultValueValidator("tracing.backend", default="jaeger", is_in=["jaeger", "tempo"]),
-        DefaultValueValidator(
-            "tracing.collector_url", default=fetch_service("jaeger-collector", protocol="rpc", port=4317)
+        DefaultValueValidator("tracing.backend", default="jaeger", is_in=["jaeger", "tempo", "local"]),
+        Validator(
+            "tracing.local",
+            # Instrumented components run in the cluster, so they have to be able to reach the receivers
+            condition=lambda local: not is_local_address(local.get("host") or local.get("bind")),
+            messages={
+                "condition": "tracing.local.host has to be set to the address under which the local OTLP receivers "
+                "are reachable from the cluster, loopback or unspecified address is not"
+            },
+            when=Validator("tracing.backend", eq="local"),
+        ),
+        Validator("tracing.backend", eq="local")
+        | (
+            DefaultValueValidator(
+                "tracing.collector_url", default=fetch_service("jaeger-collector", protocol="rpc", port=4317)
+            )
+            & DefaultValueValidator(
+                "tracing.query_url", default=fetch_service_ip("jaeger-query", protocol="http", port=80)
+            )
         ),
-        DefaultValueValidator("tracing.query_url", default=fetch_service_ip("jaeger-query", protocol="http", port=80)),
         Validator(
             "default_exposer",
             # If exposer was successfully converted, it will no longer be a string"""
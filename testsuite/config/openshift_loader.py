@@ -19,7 +19,11 @@ def load(obj, env=None, silent=True, key=None, filename=None):
 
     cluster = control_plane.setdefault("cluster", {})
     client = KubernetesClient(
-        cluster.get("project"), cluster.get("api_url"), cluster.get("token"), cluster.get("kubeconfig_path")
+        cluster.get("project"),
+        cluster.get("api_url"),
+        cluster.get("token"),
+        cluster.get("kubeconfig_path"),
+        cluster.get("backend", "oc"),
     )
     obj["control_plane"]["cluster"] = client
 
@@ -33,7 +37,11 @@ def load(obj, env=None, silent=True, key=None, filename=None):
     for value in clusters:
         clients.append(
             KubernetesClient(
-                value.get("project"), value.get("api_url"), value.get("token"), value.get("kubeconfig_path")
+                value.get("project"),
+                value.get("api_url"),
+                value.get("token"),
+                value.get("kubeconfig_path"),
+                value.get("backend", "oc"),
             )
         )
     if len(clients) > 0:
@@ -41,10 +49,18 @@ def load(obj, env=None, silent=True, key=None, filename=None):
 
     if cluster2 := control_plane.setdefault("cluster2", {}):
         obj["control_plane"]["cluster2"] = KubernetesClient(
-            cluster2.get("project"), cluster2.get("api_url"), cluster2.get("token"), cluster2.get("kubeconfig_path")
+            cluster2.get("project"),
+            cluster2.get("api_url"),
+            cluster2.get("token"),
+            cluster2.get("kubeconfig_path"),
+            cluster2.get("backend", "oc"),
         )
 
     if cluster3 := control_plane.setdefault("cluster3", {}):
         obj["control_plane"]["cluster3"] = KubernetesClient(
-            cluster3.get("project"), cluster3.get("api_url"), cluster3.get("token"), cluster3.get("kubeconfig_path")
+            cluster3.get("project"),
+            cluster3.get("api_url"),
+            cluster3.get("token"),
+            cluster3.get("kubeconfig_path"),
+            cluster3.get("backend", "oc"),
         )
@@ -49,6 +49,7 @@ class StaticLocalHostname(Hostname):
         self.force_https = force_https
 
     def client(self, **kwargs) -> KuadrantClient:
+        """Returns client for the hostname, with shared_pool=True connections are shared with other clients"""
         headers = kwargs.setdefault("headers", {})
         headers["Host"] = self.hostname
         ip = self.ip_getter()
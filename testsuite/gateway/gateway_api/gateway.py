@@ -1,6 +1,5 @@
 """Module containing all gateway classes"""
 
-from time import sleep
 from typing import Any
 
 import openshift_client as oc
@@ -8,6 +7,8 @@ import openshift_client as oc
 from testsuite.config import settings
 from testsuite.certificates import Certificate
 from testsuite.gateway import Gateway, GatewayListener
+from testsuite.httpx import KuadrantClient
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kubernetes.client import KubernetesClient
 from testsuite.kubernetes import KubernetesObject, modify
 from testsuite.kuadrant.policy import Policy
@@ -97,7 +98,16 @@ class KuadrantGateway(KubernetesObject, Gateway):
         success = self.wait_until(lambda obj: self.__class__(obj.model).is_ready(), timelimit=timeout)
         assert success, f"Gateway didn't reach required state, instead it was: {self.model.status.conditions}"
         if settings["control_plane"]["slow_loadbalancers"]:
-            sleep(60)
+            self.wait_for_loadbalancer()
+
+    def wait_for_loadbalancer(self, timeout: int = 5 * 60):
+        """Waits until the load balancer in front of the Gateway routes requests to it"""
+        self.refresh()
+        listener = self.model.spec.listeners[0]
+        scheme = "https" if listener.protocol == "HTTPS" else "http"
+        address = self.model.status.addresses[0].value
+        with KuadrantClient(base_url=f"{scheme}://{address}:{listener.port}", verify=False, timeout=5) as client:
+            ConvergenceProbe(client, timeout=timeout, max_interval=5).reachable()
 
     def is_affected_by(self, policy: Policy) -> bool:
         """Returns True, if affected by status is found within the object for the specific policy"""
@@ -107,6 +107,18 @@ class HTTPRoute(KubernetesObject, GatewayRoute):
         """Remove all rules from the Route"""
         self.model.spec.rules = []
 
+    @property
+    def probe_path(self) -> typing.Optional[str]:
+        """Returns path which is certainly routed by the first rule, None if it does not match on plain path only"""
+        rules = self.as_dict()["spec"].get("rules")
+        if not rules:
+            return None
+        match = (rules[0].get("matches") or [{"path": {"type": "PathPrefix", "value": "/"}}])[0]
+        path = match.get("path", {"type": "PathPrefix", "value": "/"})
+        if set(match) - {"path"} or path.get("type", "PathPrefix") not in ("PathPrefix", "Exact"):
+            return None
+        return path.get("value", "/")
+
     @modify
     def add_backend(self, backend: "Backend", prefix="/"):
         self.model.spec.rules.append(
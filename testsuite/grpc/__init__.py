@@ -1,10 +1,19 @@
 """gRPC client for Kuadrant testsuite"""
 
+import asyncio
+import functools
+import itertools
+import time
+from typing import Any, NamedTuple, Optional
+
 import grpc
+import grpc.aio
 from grpc import StatusCode
 from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
 from google.protobuf.message_factory import GetMessageClass
 
+from testsuite.certificates import Certificate
 from testsuite.httpx import ResultList
 from testsuite.backend.grpc import grpcbin_pb2
 
@@ -14,10 +23,15 @@ SERVICE_DESCRIPTOR = grpcbin_pb2.DESCRIPTOR.services_by_name["GRPCBin"]
 class GRPCResult:
     """Result from a gRPC request"""
 
-    def __init__(self, code, error=None, response=None):
+    def __init__(self, code, error=None, response=None, timestamp=None, latency=None):
         self.code = code
         self.error = error
+        # Single message for unary methods, list of messages for server-streaming methods
         self.response = response
+        # Unix time when the call was started
+        self.timestamp = timestamp
+        # Seconds until the call finished (including all streamed messages)
+        self.latency = latency
 
     @property
     def status_code(self):
@@ -25,9 +39,11 @@ class GRPCResult:
         return self.code
 
     def json(self):
-        """Returns response as a dictionary"""
+        """Returns response as a dictionary (list of dictionaries for server-streaming methods)"""
         if self.response is None:
             return None
+        if isinstance(self.response, list):
+            return [MessageToDict(message, preserving_proto_field_name=True) for message in self.response]
         return MessageToDict(self.response, preserving_proto_field_name=True)
 
     def __str__(self):
@@ -36,33 +52,103 @@ class GRPCResult:
         return f"GRPCResult[code={self.code}, error={self.error.details()}]"
 
 
+class GRPCMethod(NamedTuple):
+    """Resolved method of a service from the grpcbin descriptor"""
+
+    path: str
+    request_class: type[Message]
+    response_class: type[Message]
+    server_streaming: bool
+
+
+@functools.cache
+def resolve_method(method: str, service: str = "/grpcbin.GRPCBin") -> GRPCMethod:
+    """Returns path and message classes of the method, client-streaming methods are not supported"""
+    method = method.lstrip("/")
+    descriptor = SERVICE_DESCRIPTOR.methods_by_name[method]
+    if descriptor.client_streaming:
+        raise ValueError(f"Client-streaming method {method} is not supported")
+    return GRPCMethod(
+        f"{service}/{method}",
+        GetMessageClass(descriptor.input_type),
+        GetMessageClass(descriptor.output_type),
+        descriptor.server_streaming,
+    )
+
+
+def _metadata(auth=None, headers=None) -> Optional[list[tuple[str, str]]]:
+    metadata = []
+    if auth:
+        metadata.append(("authorization", f"Bearer {auth.token.access_token}"))
+    if headers:
+        metadata.extend((k.lower(), v) for k, v in headers.items())
+    return metadata or None
+
+
+def _create_channel(module, host, hostname, tls, verify, cert, options=None):
+    """Creates channel using either `grpc` or `grpc.aio` module, TLS trusts system CAs if no verify is set"""
+    options = list(options or [])
+    if hostname:
+        options.append(("grpc.default_authority", hostname))
+        if tls:
+            options.append(("grpc.ssl_target_name_override", hostname))
+    if not tls:
+        return module.insecure_channel(host, options=options)
+    credentials = grpc.ssl_channel_credentials(
+        root_certificates=verify.chain.encode("utf-8") if verify else None,
+        private_key=cert.key.encode("utf-8") if cert else None,
+        certificate_chain=cert.chain.encode("utf-8") if cert else None,
+    )
+    return module.secure_channel(host, credentials, options=options)
+
+
+def _create_stub(channel, method: GRPCMethod):
+    """Creates callable for the method, it is reusable for all calls on the channel"""
+    factory = channel.unary_stream if method.server_streaming else channel.unary_unary
+    return factory(
+        method.path,
+        request_serializer=method.request_class.SerializeToString,
+        response_deserializer=method.response_class.FromString,
+    )
+
+
 class GRPCClient:
-    """gRPC client for making unary calls"""
-
-    def __init__(self, host, *, hostname=None):
-        options = []
-        if hostname:
-            options.append(("grpc.default_authority", hostname))
-        self.channel = grpc.insecure_channel(host, options=options)
-
-    def call(self, method, *, service="/grpcbin.GRPCBin", auth=None, headers=None):
-        """Makes a unary gRPC call to the given method on the service."""
-        metadata = []
-        if auth:
-            metadata.append(("authorization", f"Bearer {auth.token.access_token}"))
-        if headers:
-            metadata.extend((k.lower(), v) for k, v in headers.items())
-        method = method.lstrip("/")
-        make_call = self.channel.unary_unary(
-            service + "/" + method,
-            request_serializer=grpcbin_pb2.EmptyMessage.SerializeToString,
-            response_deserializer=GetMessageClass(SERVICE_DESCRIPTOR.methods_by_name[method].output_type).FromString,
-        )
+    """gRPC client for making unary and server-streaming calls"""
+
+    def __init__(
+        self,
+        host,
+        *,
+        hostname=None,
+        tls: bool = False,
+        verify: Optional[Certificate] = None,
+        cert: Optional[Certificate] = None,
+    ):
+        self.host = host
+        self.hostname = hostname
+        self.tls = tls or verify is not None or cert is not None
+        self.verify = verify
+        self.cert = cert
+        self.channel = _create_channel(grpc, host, hostname, self.tls, verify, cert)
+        self._stubs: dict[str, Any] = {}
+
+    def call(self, method, *, service="/grpcbin.GRPCBin", auth=None, headers=None, request=None, timeout=10):
+        """Makes a unary (or server-streaming) gRPC call to the given method on the service."""
+        resolved = resolve_method(method, service)
+        if resolved.path not in self._stubs:
+            self._stubs[resolved.path] = _create_stub(self.channel, resolved)
+        request = resolved.request_class() if request is None else request
+        timestamp, start = time.time(), time.perf_counter()
         try:
-            response = make_call(grpcbin_pb2.EmptyMessage(), metadata=metadata or None, timeout=10)
-            return GRPCResult(StatusCode.OK, response=response)
+            response = self._stubs[resolved.path](request, metadata=_metadata(auth, headers), timeout=timeout)
+            if resolved.server_streaming:
+                response = list(response)
+            return GRPCResult(
+                StatusCode.OK, response=response, timestamp=timestamp, latency=time.perf_counter() - start
+            )
         except grpc.RpcError as e:
-            return GRPCResult(e.code(), error=e)  # pylint: disable=no-member
+            # pylint: disable=no-member
+            return GRPCResult(e.code(), error=e, timestamp=timestamp, latency=time.perf_counter() - start)
 
     def call_many(self, method, count, *, auth=None, **kwargs) -> ResultList:
         """Send multiple gRPC requests."""
@@ -71,6 +157,98 @@ class GRPCClient:
             responses.append(self.call(method, auth=auth, **kwargs))
         return responses
 
+    def call_many_concurrent(self, method, count, *, concurrency=10, channels=1, **kwargs) -> ResultList:
+        """
+        Send multiple gRPC requests concurrently, see AsyncGRPCClient.call_many.
+        Uses the same host, hostname and TLS configuration as this client.
+        """
+
+        async def _call():
+            async with self.async_client(channels=channels) as client:
+                return await client.call_many(method, count, concurrency=concurrency, **kwargs)
+
+        return asyncio.run(_call())
+
+    def async_client(self, channels=1) -> "AsyncGRPCClient":
+        """Returns AsyncGRPCClient with the same configuration as this client"""
+        return AsyncGRPCClient(
+            self.host, hostname=self.hostname, tls=self.tls, verify=self.verify, cert=self.cert, channels=channels
+        )
+
     def close(self):
         """Close the gRPC channel"""
         self.channel.close()
+
+
+class AsyncGRPCClient:
+    """
+    Asynchronous gRPC client for sending many calls in parallel.
+    Calls are spread over `channels` channels (each one with its own HTTP/2 connection) in round-robin fashion.
+    """
+
+    def __init__(
+        self,
+        host,
+        *,
+        hostname=None,
+        tls: bool = False,
+        verify: Optional[Certificate] = None,
+        cert: Optional[Certificate] = None,
+        channels: int = 1,
+    ):
+        tls = tls or verify is not None or cert is not None
+        # Channels with the same target share connections, unless each of them has its own subchannel pool
+        options = [("grpc.use_local_subchannel_pool", 1)]
+        self.channels = [_create_channel(grpc.aio, host, hostname, tls, verify, cert, options) for _ in range(channels)]
+        self._stubs: list[dict[str, Any]] = [{} for _ in self.channels]
+        self._next = itertools.cycle(range(channels))
+
+    def _stub(self, method: GRPCMethod):
+        """Returns stub of the method on the next channel of the pool"""
+        index = next(self._next)
+        if method.path not in self._stubs[index]:
+            self._stubs[index][method.path] = _create_stub(self.channels[index], method)
+        return self._stubs[index][method.path]
+
+    async def call(
+        self, method, *, service="/grpcbin.GRPCBin", auth=None, headers=None, request=None, timeout=10
+    ) -> GRPCResult:
+        """Makes a unary (or server-streaming) gRPC call to the given method on the service."""
+        resolved = resolve_method(method, service)
+        request = resolved.request_class() if request is None else request
+        timestamp, start = time.time(), time.perf_counter()
+        try:
+            call = self._stub(resolved)(request, metadata=_metadata(auth, headers), timeout=timeout)
+            if resolved.server_streaming:
+                response = [message async for message in call]
+            else:
+                response = await call
+            return GRPCResult(
+                StatusCode.OK, response=response, timestamp=timestamp, latency=time.perf_counter() - start
+            )
+        except grpc.RpcError as e:
+            # pylint: disable=no-member
+            return GRPCResult(e.code(), error=e, timestamp=timestamp, latency=time.perf_counter() - start)
+
+    async def call_many(self, method, count, *, concurrency=10, auth=None, **kwargs) -> ResultList:
+        """
+        Send multiple gRPC requests in parallel, at most `concurrency` of them in-flight at once.
+        Results are returned in the order in which they were submitted.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _call():
+            async with semaphore:
+                return await self.call(method, auth=auth, **kwargs)
+
+        return ResultList(await asyncio.gather(*(_call() for _ in range(count))))
+
+    async def close(self):
+        """Close all gRPC channels"""
+        await asyncio.gather(*(channel.close() for channel in self.channels))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,15 +1,24 @@
 """Common classes for Httpx"""
 
+import asyncio
+import functools
+import math
+import os
 import ssl
+import threading
+import time
 import typing
+from array import array
+from collections import Counter
+from contextlib import contextmanager
 
 # I change return type of HTTPX client to Kuadrant Result
 # mypy: disable-error-code="override, return-value"
 from tempfile import NamedTemporaryFile
-from typing import Union, Iterable, MutableMapping
+from typing import Union, Iterable, Iterator, MutableMapping, Optional
 
 import backoff
-from httpx import Client, RequestError, USE_CLIENT_DEFAULT, Request
+from httpx import AsyncClient, Client, HTTPTransport, RequestError, USE_CLIENT_DEFAULT, Request, URL, create_ssl_context
 from httpx._client import UseClientDefault
 from httpx._types import (
     URLTypes,
@@ -35,13 +44,105 @@ def create_tmp_file(content: str):
     return file
 
 
+@contextmanager
+def _in_memory_file(content: str) -> Iterator[str]:
+    """Yields path of a file with the content, which lives only in memory where the platform allows it"""
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("tls", 0)
+        try:
+            os.write(fd, content.encode("utf-8"))
+            yield f"/proc/self/fd/{fd}"
+        finally:
+            os.close(fd)
+    else:
+        with create_tmp_file(content) as file:
+            yield file.name
+
+
+@functools.lru_cache(maxsize=256)
+def _ssl_context(
+    ca_chain: Optional[str], cert_chain: Optional[str], key: Optional[str], verify: bool, http2: bool
+) -> ssl.SSLContext:
+    """Returns SSL context shared by all clients with the same certificates"""
+    if ca_chain is not None:
+        context = ssl.create_default_context(cadata=ca_chain)
+    else:
+        context = create_ssl_context(verify=verify)
+    if cert_chain is not None and key is not None:
+        # ssl module can load certificates only from files
+        with _in_memory_file(cert_chain) as cert_file, _in_memory_file(key) as key_file:
+            context.load_cert_chain(cert_file, key_file)
+    # httpcore sets ALPN on every new connection, contexts are split by it so the setting is always the same
+    context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+    return context
+
+
+def create_tls_config(verify: Union[Certificate, ssl.SSLContext, bool, None], cert: Certificate = None, http2=False):
+    """
+    Converts Certificates into arguments accepted by httpx clients, returns verify and cert argument.
+    SSL contexts are cached for the whole process, so clients with the same certificates do not build them again.
+    """
+    if isinstance(verify, ssl.SSLContext):
+        return verify, cert
+    ca_chain = verify.chain if isinstance(verify, Certificate) else None
+    return (
+        _ssl_context(ca_chain, cert.chain if cert else None, cert.key if cert else None, verify is not False, http2),
+        None,
+    )
+
+
+class SharedTransport(HTTPTransport):
+    """Connection pool shared by all clients aimed at the same address with the same TLS configuration"""
+
+    def close(self) -> None:
+        """Connections stay open for the other clients, they are closed by close_shared_transports"""
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None) -> None:
+        """Clients used as context managers exit their transport instead of closing it"""
+
+
+_shared_transports: dict[tuple, SharedTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def _shared_transport(origin: str, sni_hostname: Optional[str], context: ssl.SSLContext, http2: bool):
+    """
+    Returns connection pool shared by the whole process, origin and SNI are only part of the key.
+    Pools reuse connections regardless of their SNI, so clients with different SNI cannot share them
+    """
+    with _shared_transports_lock:
+        key = (origin, sni_hostname, context, http2)
+        if key not in _shared_transports:
+            _shared_transports[key] = SharedTransport(verify=context, http2=http2)
+        return _shared_transports[key]
+
+
+def close_shared_transports():
+    """Closes all connection pools shared by the clients with shared_pool, called at the end of the session"""
+    with _shared_transports_lock:
+        for transport in _shared_transports.values():
+            HTTPTransport.close(transport)
+        _shared_transports.clear()
+
+
 class Result:
     """Result from HTTP request"""
 
-    def __init__(self, retry_codes, response=None, error=None):
+    def __init__(self, retry_codes, response=None, error=None, timestamp=None):
         self.response = response
         self.error = error
         self.retry_codes = retry_codes
+        # Unix time when the request (its last retry) was sent
+        self.timestamp = timestamp
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds between sending the request and receiving the whole response, None if there is no response"""
+        try:
+            return self.response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError):
+            # Errors and responses which were not read yet have no latency
+            return None
 
     def should_backoff(self):
         """True, if the Result can be considered an instability and should be retried"""
@@ -98,17 +199,187 @@ class Result:
         return f"Result[error={self.error}]"
 
 
+def _status_number(status_code) -> int:
+    """Returns status code as a number, gRPC StatusCode enums are converted to their numeric code"""
+    if isinstance(status_code, int):
+        return status_code
+    return status_code.value[0]
+
+
+class ResultColumns:
+    """
+    Columnar view of Results, every attribute is stored in a compact array, so statistics over large bursts
+    are computed without touching the Result objects.
+    Requests which failed without any status code have status code -1, failed requests have NaN latency
+    and the name of the error class as their error kind.
+    """
+
+    def __init__(self, results: Iterable = ()):
+        self.status_codes = array("i")
+        # Seconds between sending the request and receiving the whole response
+        self.latencies = array("d")
+        # Unix time when the request was sent, NaN if unknown
+        self.timestamps = array("d")
+        self.bytes = array("q")
+        # Indexes into error_names, 0 is no error
+        self.errors = array("H")
+        self.error_names: list[Optional[str]] = [None]
+        self.extend(results)
+
+    def append(self, result):
+        """Appends single Result (or GRPCResult)"""
+        response = result.response
+        try:
+            self.status_codes.append(_status_number(result.status_code))
+        except RequestError:
+            self.status_codes.append(-1)
+        if result.error is None:
+            self.errors.append(0)
+        else:
+            name = type(result.error).__name__
+            if name not in self.error_names:
+                self.error_names.append(name)
+            self.errors.append(self.error_names.index(name))
+        latency = result.latency
+        self.latencies.append(math.nan if latency is None else latency)
+        self.timestamps.append(getattr(result, "timestamp", None) or math.nan)
+        self.bytes.append(getattr(response, "num_bytes_downloaded", 0))
+
+    def extend(self, results: Iterable):
+        """Appends all Results"""
+        for result in results:
+            self.append(result)
+
+    def __len__(self):
+        return len(self.status_codes)
+
+    def status_histogram(self) -> Counter:
+        """Returns number of results per status code"""
+        return Counter(self.status_codes)
+
+    def error_histogram(self) -> Counter:
+        """Returns number of failed requests per error kind"""
+        return Counter(self.error_names[error] for error in self.errors if error)
+
+    def first_index(self, status_code) -> Optional[int]:
+        """Returns index of the first result with the status code, None if there is none"""
+        try:
+            return self.status_codes.index(_status_number(status_code))
+        except ValueError:
+            return None
+
+    def first_mismatch(self, status_code) -> Optional[int]:
+        """Returns index of the first result with different status code, None if all of them match"""
+        expected = _status_number(status_code)
+        return next((i for i, code in enumerate(self.status_codes) if code != expected), None)
+
+    def count_per_bucket(self, status_code, bucket: float = 1.0) -> list[int]:
+        """
+        Returns number of results with the status code in every `bucket` seconds long window,
+        counted from the first sent request. Results without timestamp are ignored.
+        """
+        expected = _status_number(status_code)
+        timestamps = [t for t in self.timestamps if not math.isnan(t)]
+        if not timestamps:
+            return []
+        start = min(timestamps)
+        buckets = [0] * (int((max(timestamps) - start) / bucket) + 1)
+        for code, timestamp in zip(self.status_codes, self.timestamps):
+            if code == expected and not math.isnan(timestamp):
+                buckets[int((timestamp - start) / bucket)] += 1
+        return buckets
+
+    def latency_percentiles(self, *percentiles: float) -> dict[float, float]:
+        """Returns nearest-rank latency percentiles in seconds, failed requests are ignored"""
+        latencies = sorted(latency for latency in self.latencies if not math.isnan(latency))
+        if not latencies:
+            return {percentile: math.nan for percentile in percentiles}
+        return {
+            percentile: latencies[max(math.ceil(len(latencies) * percentile / 100), 1) - 1]
+            for percentile in percentiles
+        }
+
+
 class ResultList(list):
-    """List-like object for Result"""
+    """List-like object for Result, with columnar statistics (see ResultColumns) for large number of Results"""
+
+    def __init__(self, results: Iterable = ()):
+        super().__init__(results)
+        self._columns: Optional[ResultColumns] = None
+
+    @property
+    def columns(self) -> ResultColumns:
+        """Returns columnar view of all Results, kept up to date while results are appended"""
+        if self._columns is None or len(self._columns) != len(self):
+            self._columns = ResultColumns(self)
+        return self._columns
+
+    def append(self, result):
+        super().append(result)
+        if self._columns is not None:
+            self._columns.append(result)
+
+    def extend(self, results: Iterable):
+        results = list(results)
+        super().extend(results)
+        if self._columns is not None:
+            self._columns.extend(results)
+
+    def _invalidate(self, method: str, *args):
+        """Calls list method, which can change the Results in other way than appending, and drops the columns"""
+        self._columns = None
+        return getattr(super(), method)(*args)
+
+    def __setitem__(self, index, value):
+        self._invalidate("__setitem__", index, value)
+
+    def __delitem__(self, index):
+        self._invalidate("__delitem__", index)
+
+    def insert(self, index, result):
+        self._invalidate("insert", index, result)
+
+    def pop(self, index=-1):
+        return self._invalidate("pop", index)
+
+    def remove(self, result):
+        self._invalidate("remove", result)
+
+    def clear(self):
+        self._invalidate("clear")
+
+    def sort(self, *, key=None, reverse=False):
+        self._columns = None
+        super().sort(key=key, reverse=reverse)
+
+    def reverse(self):
+        self._invalidate("reverse")
 
     def assert_all(self, status_code):
         """Assert all responses that contain certain status code"""
-        for request in self:
+        if (index := self.columns.first_mismatch(status_code)) is not None:
+            request = self[index]
             assert request.status_code == status_code, (
-                f"Status code assertion failed for request {self.index(request)+1} out of {len(self)} requests: "
+                f"Status code assertion failed for request {index+1} out of {len(self)} requests: "
                 f"{request} != {status_code}"
             )
 
+    def status_histogram(self) -> Counter:
+        """Returns number of results per status code, see ResultColumns"""
+        return self.columns.status_histogram()
+
+    def first_index(self, status_code) -> Optional[int]:
+        """Returns index of the first result with the status code, see ResultColumns"""
+        return self.columns.first_index(status_code)
+
+    def count_per_bucket(self, status_code, bucket: float = 1.0) -> list[int]:
+        """Returns number of results with the status code per time window, see ResultColumns"""
+        return self.columns.count_per_bucket(status_code, bucket)
+
+    def latency_percentiles(self, *percentiles: float) -> dict[float, float]:
+        """Returns latency percentiles in seconds, see ResultColumns"""
+        return self.columns.latency_percentiles(*percentiles)
+
 
 class KuadrantClient(Client):
     """Httpx client which retries unstable requests"""
@@ -119,37 +390,38 @@ class KuadrantClient(Client):
         verify: Union[Certificate, bool] = True,
         cert: Certificate = None,
         retry_codes: Iterable[int] = None,
+        shared_pool: bool = False,
         **kwargs,
     ):
-        self.files = []
+        """If shared_pool is set, connections are reused by all clients with the same address, SNI and certificates"""
         self.retry_codes = {503} if retry_codes is None else set(retry_codes)
-        _verify = None
-        if isinstance(verify, Certificate):
-            verify_file = create_tmp_file(verify.chain)
-            self.files.append(verify_file)
-            _verify = ssl.create_default_context(cafile=verify_file.name)
-        _cert = None
-        if cert:
-            cert_file = create_tmp_file(cert.chain)
-            self.files.append(cert_file)
-            key_file = create_tmp_file(cert.key)
-            self.files.append(key_file)
-            _cert = (cert_file.name, key_file.name)
+        self.verify, self.cert = verify, cert
+        ssl_verify, ssl_cert = create_tls_config(verify, cert, kwargs.get("http2", False))
+        if shared_pool and ssl_cert is None and "transport" not in kwargs:
+            url = URL(kwargs.get("base_url", ""))
+            kwargs["transport"] = _shared_transport(
+                f"{url.scheme}://{url.host}:{url.port}",
+                getattr(self, "sni_hostname", None),
+                ssl_verify,
+                kwargs.get("http2", False),
+            )
 
         # Mypy does not understand the typing magic I have done
-        self.verify = _verify or verify
-        super().__init__(verify=self.verify, cert=_cert or cert, **kwargs)  # type: ignore
-
-    def close(self) -> None:
-        super().close()
-        for file in self.files:
-            file.close()
-        self.files = []
+        super().__init__(verify=ssl_verify, cert=ssl_cert, **kwargs)  # type: ignore
 
     def add_retry_code(self, code):
         """Add a new retry code to"""
         self.retry_codes.add(code)
 
+    def request_once(self, method: str, url, **kwargs) -> Result:
+        """Sends single request, unstable results are not retried"""
+        timestamp = time.time()
+        try:
+            response = super().request(method, url, **kwargs)
+            return Result(self.retry_codes, response=response, timestamp=timestamp)
+        except RequestError as e:
+            return Result(self.retry_codes, error=e, timestamp=timestamp)
+
     # pylint: disable=too-many-locals
     @backoff.on_predicate(backoff.fibo, lambda result: result.should_backoff(), max_tries=8, jitter=None)
     def request(
@@ -169,25 +441,21 @@ class KuadrantClient(Client):
         timeout=None,
         extensions=None,
     ) -> Result:
-        try:
-            response = super().request(
-                method,
-                url,
-                content=content,
-                data=data,
-                files=files,
-                json=json,
-                params=params,
-                headers=headers,
-                cookies=cookies,
-                auth=auth,
-                follow_redirects=follow_redirects,
-                timeout=timeout,
-                extensions=extensions,
-            )
-            return Result(self.retry_codes, response=response)
-        except RequestError as e:
-            return Result(self.retry_codes, error=e)
+        return self.request_once(
+            method,
+            url,
+            content=content,
+            data=data,
+            files=files,
+            json=json,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            auth=auth,
+            follow_redirects=follow_redirects,
+            timeout=timeout,
+            extensions=extensions,
+        )
 
     def get(self, *args, **kwargs) -> Result:
         return super().get(*args, **kwargs)
@@ -200,6 +468,30 @@ class KuadrantClient(Client):
 
         return responses
 
+    def get_many_concurrent(self, url, count, *, concurrency=10, params=None, headers=None, auth=None) -> ResultList:
+        """
+        Send multiple `GET` requests concurrently, see AsyncKuadrantClient.get_many_concurrent.
+        Uses the same base_url, headers, auth, TLS configuration and retry codes as this client.
+        """
+
+        async def _send():
+            async with self.async_client() as client:
+                return await client.get_many_concurrent(
+                    url, count, concurrency=concurrency, params=params, headers=headers, auth=auth
+                )
+
+        return asyncio.run(_send())
+
+    def async_client(self, **kwargs) -> "AsyncKuadrantClient":
+        """Returns AsyncKuadrantClient with the same configuration as this client"""
+        kwargs.setdefault("base_url", self.base_url)
+        kwargs.setdefault("headers", self.headers)
+        kwargs.setdefault("cookies", self.cookies)
+        kwargs.setdefault("auth", self.auth)
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("sni_hostname", getattr(self, "sni_hostname", None))
+        return AsyncKuadrantClient(verify=self.verify, cert=self.cert, retry_codes=self.retry_codes, **kwargs)
+
 
 class ForceSNIClient(KuadrantClient):
     """Kuadrant client that forces SNI for each request"""
@@ -213,8 +505,8 @@ class ForceSNIClient(KuadrantClient):
         sni_hostname: str = None,
         **kwargs,
     ):
-        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
         self.sni_hostname = sni_hostname
+        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
 
     def build_request(
         self,
@@ -246,3 +538,68 @@ class ForceSNIClient(KuadrantClient):
             timeout=timeout,
             extensions=extensions,
         )
+
+
+class AsyncKuadrantClient(AsyncClient):
+    """
+    Asynchronous httpx client which retries unstable requests the same way as KuadrantClient.
+    Uses pooled HTTP/2 connections by default, so many requests can be sent in parallel.
+    """
+
+    def __init__(
+        self,
+        *,
+        verify: Union[Certificate, bool] = True,
+        cert: Certificate = None,
+        retry_codes: Iterable[int] = None,
+        sni_hostname: str = None,
+        http2: bool = True,
+        **kwargs,
+    ):
+        self.retry_codes = {503} if retry_codes is None else set(retry_codes)
+        self.verify, self.cert = verify, cert
+        self.sni_hostname = sni_hostname
+        ssl_verify, ssl_cert = create_tls_config(verify, cert, http2)
+
+        super().__init__(verify=ssl_verify, cert=ssl_cert, http2=http2, **kwargs)  # type: ignore
+
+    def add_retry_code(self, code):
+        """Add a new retry code to"""
+        self.retry_codes.add(code)
+
+    def build_request(self, method, url, *, extensions=None, **kwargs) -> Request:
+        if self.sni_hostname:
+            extensions = extensions or {}
+            extensions.setdefault("sni_hostname", self.sni_hostname)
+        return super().build_request(method, url, extensions=extensions, **kwargs)
+
+    async def request_once(self, method: str, url, **kwargs) -> Result:
+        """Sends the request without any retries, e.g. for load generation where retries would skew the latency"""
+        timestamp = time.time()
+        try:
+            response = await super().request(method, url, **kwargs)
+            return Result(self.retry_codes, response=response, timestamp=timestamp)
+        except RequestError as e:
+            return Result(self.retry_codes, error=e, timestamp=timestamp)
+
+    @backoff.on_predicate(backoff.fibo, lambda result: result.should_backoff(), max_tries=8, jitter=None)
+    async def request(self, method: str, url, **kwargs) -> Result:
+        return await self.request_once(method, url, **kwargs)
+
+    async def get(self, *args, **kwargs) -> Result:
+        return await super().get(*args, **kwargs)
+
+    async def get_many_concurrent(
+        self, url, count, *, concurrency=10, params=None, headers=None, auth=None
+    ) -> ResultList:
+        """
+        Send multiple `GET` requests in parallel, at most `concurrency` of them in-flight at once.
+        Results are returned in the order in which they were submitted, each with the time it was sent.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get():
+            async with semaphore:
+                return await self.get(url, params=params, headers=headers, auth=auth or USE_CLIENT_DEFAULT)
+
+        return ResultList(await asyncio.gather(*(_get() for _ in range(count))))
@@ -7,10 +7,23 @@ from httpx import Auth, Request, URL, Response
 
 from testsuite.oidc.keycloak import User
 from testsuite.oidc import Token
+from testsuite.oidc.token_pool import TokenPool
 
 TokenType = Union[Token, Callable[[], Token]]
 
 
+def add_credentials(request: Request, token: str, location: str):
+    """Adds access token to the request, location is one of `authorization`, `headers` or `query`"""
+    if location == "authorization":
+        request.headers["Authorization"] = f"Bearer {token}"
+    elif location == "headers":
+        request.headers["access_token"] = token
+    elif location == "query":
+        request.url = URL(request.url, params={"access_token": token})
+    else:
+        raise ValueError(f"Unknown credentials location '{location}'")
+
+
 class HttpxOidcClientAuth(Auth):
     """Auth class for Httpx client for product secured by oidc"""
 
@@ -33,14 +46,7 @@ class HttpxOidcClientAuth(Auth):
         return self._token
 
     def _add_credentials(self, request: Request, token):
-        if self.location == "authorization":
-            request.headers["Authorization"] = f"Bearer {token}"
-        elif self.location == "headers":
-            request.headers["access_token"] = token
-        elif self.location == "query":
-            request.url = URL(request.url, params={"access_token": token})
-        else:
-            raise ValueError(f"Unknown credentials location '{self.location}'")
+        add_credentials(request, token, self.location)
 
     def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
         self._add_credentials(request, self.token.access_token)
@@ -64,3 +70,16 @@ class HeaderApiKeyAuth(Auth):
     def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
         request.headers["Authorization"] = f"{self.prefix} {self.api_key}"
         yield request
+
+
+class TokenPoolAuth(Auth):
+    """Auth class using tokens from TokenPool, every request uses the next user unless the username is set"""
+
+    def __init__(self, pool: TokenPool, username: str = None, location="authorization") -> None:
+        self.pool = pool
+        self.username = username
+        self.location = location
+
+    def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        add_credentials(request, self.pool.get(self.username).access_token, self.location)
+        yield request
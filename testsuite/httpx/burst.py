@@ -0,0 +1,86 @@
+"""
+Sends bursts of requests aligned with the windows of a rate limit, so a burst never straddles a window boundary
+and the next burst waits exactly until the counters reset instead of sleeping for a fixed time.
+"""
+
+import time
+from typing import Optional
+
+from testsuite.httpx import KuadrantClient, Result, ResultList
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+# Headers with number of seconds until the limit resets, returned if the gateway is configured to do so
+RESET_HEADERS = ("ratelimit-reset", "x-ratelimit-reset")
+
+
+class WindowScheduler:
+    """
+    Tracks the window of a single Limit on the requests sent through it.
+    Limitador starts the window with the first request counted against the limit, so the window end is learned from
+    that request, from the reset headers (if present) or, if the limit was already reached by someone else,
+    from the first successful request after a series of 429s.
+    """
+
+    def __init__(self, client: KuadrantClient, limit: Limit, margin: float = 0.2, poll_interval: float = 0.1):
+        self.client = client
+        self.limit = limit
+        # Added to every wait, to cover clock skew and counters expiring slightly later than expected
+        self.margin = margin
+        self.poll_interval = poll_interval
+        # time.monotonic() after which the current window is over, None if no window is known to be in progress
+        self.window_end: Optional[float] = None
+        # Limit was reached in a window, which did not start with a request sent through this scheduler
+        self.limited = False
+
+    def _observe(self, result: Result):
+        """Learns window end from the response"""
+        now = time.monotonic()
+        if result.error is not None:
+            return
+        for header in RESET_HEADERS:
+            if header in result.headers:
+                self.window_end = now + float(result.headers[header])
+                return
+        if self.window_end is None:
+            if result.status_code == 429:
+                self.limited = True
+            else:
+                # The counter was created before the response arrived, so the window surely ends by then
+                self.window_end = now + self.limit.window_seconds
+                self.limited = False
+
+    def get(self, url, **kwargs) -> Result:
+        """Sends single GET request and tracks the window with it"""
+        if self.window_end is not None and time.monotonic() > self.window_end + self.margin:
+            self.window_end = None
+        result = self.client.get(url, **kwargs)
+        self._observe(result)
+        return result
+
+    def wait_for_reset(self, url, **kwargs) -> Optional[Result]:
+        """
+        Waits until the current window ends.
+        If the window end is not known, polls the url until the limit resets and returns the first successful
+        Result, which is the first request counted in the new window.
+        """
+        if self.window_end is not None:
+            time.sleep(max(self.window_end + self.margin - time.monotonic(), 0))
+            self.window_end = None
+        elif self.limited:
+            while (result := self.get(url, **kwargs)).status_code == 429:
+                time.sleep(self.poll_interval)
+            return result
+        return None
+
+    def burst(self, url, count: int = None, **kwargs) -> ResultList:
+        """Sends `count` GET requests (limit of the Limit by default) at the start of a fresh window"""
+        count = self.limit.limit if count is None else count
+        if (first := self.wait_for_reset(url, **kwargs)) is None:
+            first = self.get(url, **kwargs)
+            if self.limited:
+                # Limit was reached before the burst in a window this scheduler knows nothing about
+                first = self.wait_for_reset(url, **kwargs)
+        responses = ResultList([first])
+        while len(responses) < count:
+            responses.append(self.get(url, **kwargs))
+        return responses
@@ -0,0 +1,197 @@
+"""
+Open-loop load generator, which sends requests at a constant rate regardless of how fast the responses come back.
+Latency is measured from the time each request was supposed to be sent, so it is not affected by coordinated
+omission: if the client or the server stalls, the delay of all the requests queued behind it is recorded as well.
+"""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from httpx import Limits
+
+from testsuite.gateway import Hostname
+from testsuite.httpx import KuadrantClient, Result
+
+
+class LatencyHistogram:  # pylint: disable=too-many-instance-attributes
+    """
+    HDR-style histogram of latencies with a fixed relative precision (3 significant digits by default).
+    Values are recorded in microseconds into log-linear buckets, so memory does not grow with the number of requests.
+    """
+
+    def __init__(self, significant_digits: int = 3, highest_value: float = 3600):
+        # Number of linear sub-buckets per power of two, large enough to keep the relative error below 10^-digits
+        self.sub_bucket_bits = (2 * 10**significant_digits - 1).bit_length()
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count // 2
+        self.highest_value = int(highest_value * 1_000_000)
+        self.counts = [0] * (self._index(self.highest_value) + 1)
+        self.total = 0
+        self.min = float("inf")
+        self.max = 0.0
+        self.sum = 0.0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        exponent = value.bit_length() - self.sub_bucket_bits
+        return (
+            self.sub_bucket_count + (exponent - 1) * self.sub_bucket_half + (value >> exponent) - self.sub_bucket_half
+        )
+
+    def _value(self, index: int) -> int:
+        """Returns the highest value (in microseconds) which is recorded in the bucket"""
+        if index < self.sub_bucket_count:
+            return index
+        exponent, sub_bucket = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        exponent += 1
+        return ((sub_bucket + self.sub_bucket_half + 1) << exponent) - 1
+
+    def record(self, seconds: float):
+        """Records single latency in seconds, values over highest_value are recorded as the highest_value"""
+        value = min(max(int(seconds * 1_000_000), 0), self.highest_value)
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds all values recorded in the other histogram with the same precision"""
+        assert len(self.counts) == len(other.counts), "Only histograms with the same precision can be merged"
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def __len__(self):
+        return self.total
+
+    @property
+    def mean(self) -> float:
+        """Returns mean latency in seconds"""
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Returns latency in seconds under which `percentile` % of the recorded values are"""
+        if self.total == 0:
+            return 0.0
+        threshold = max(1, round(self.total * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return min(self._value(index) / 1_000_000, self.max)
+        return self.max
+
+    def percentiles(self, *percentiles: float) -> dict[float, float]:
+        """Returns multiple percentiles at once, see percentile"""
+        return {p: self.percentile(p) for p in percentiles}
+
+
+@dataclass
+class LoadResult:
+    """Outcome of a load run"""
+
+    rate: float
+    duration: float
+    histogram: LatencyHistogram
+    status_codes: Counter = field(default_factory=Counter)
+    # Requests that could not be sent at the intended time as there were too many in-flight already
+    delayed: int = 0
+
+    @property
+    def count(self) -> int:
+        """Returns number of completed requests"""
+        return self.histogram.total
+
+    @property
+    def throughput(self) -> float:
+        """Returns completed requests per second"""
+        return self.count / self.duration if self.duration else 0.0
+
+    def summary(self) -> dict:
+        """Returns JSON serializable summary, latencies in milliseconds"""
+        percentiles = self.histogram.percentiles(50, 90, 99, 99.9)
+        return {
+            "target_rate": self.rate,
+            "duration": round(self.duration, 3),
+            "requests": self.count,
+            "throughput": round(self.throughput, 2),
+            "delayed": self.delayed,
+            "latency_ms": {
+                "mean": round(self.histogram.mean * 1000, 3),
+                "max": round(self.histogram.max * 1000, 3) if self.count else 0.0,
+                **{f"p{p:g}": round(value * 1000, 3) for p, value in percentiles.items()},
+            },
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items(), key=str)},
+        }
+
+
+class ConstantRateLoad:
+    """
+    Sends requests at a constant rate for the given duration (open-loop), with at most `max_in_flight` requests
+    waiting for the response at the same time. Requests are not retried.
+    """
+
+    def __init__(self, client: KuadrantClient, rate: float, duration: float, max_in_flight: int = 1000):
+        self.client = client
+        self.rate = rate
+        self.duration = duration
+        self.max_in_flight = max_in_flight
+
+    @staticmethod
+    def _status(result: Result) -> int | str:
+        return result.response.status_code if result.error is None else type(result.error).__name__
+
+    async def _run(self, method: str, url: str, **kwargs) -> LoadResult:  # pylint: disable=too-many-locals
+        histogram = LatencyHistogram()
+        result = LoadResult(self.rate, 0, histogram)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        loop = asyncio.get_running_loop()
+
+        limits = Limits(max_connections=self.max_in_flight, max_keepalive_connections=self.max_in_flight)
+        async with self.client.async_client(limits=limits) as client:
+
+            async def _send(intended: float):
+                try:
+                    response = await client.request_once(method, url, **kwargs)
+                    histogram.record(loop.time() - intended)
+                    result.status_codes[self._status(response)] += 1
+                finally:
+                    semaphore.release()
+
+            tasks = []
+            start = loop.time()
+            for i in range(int(self.rate * self.duration)):
+                intended = start + i / self.rate
+                if (delay := intended - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                if semaphore.locked():
+                    result.delayed += 1
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(_send(intended)))
+            await asyncio.gather(*tasks)
+            result.duration = loop.time() - start
+        return result
+
+    def run(self, url: str = "/", method: str = "GET", **kwargs) -> LoadResult:
+        """Runs the load, kwargs are passed to every request (e.g. headers, auth or content)"""
+        return asyncio.run(self._run(method, url, **kwargs))
+
+
+def run_load(
+    hostname: Hostname,
+    rate: float,
+    duration: float,
+    url: str = "/",
+    method: str = "GET",
+    client_kwargs: Optional[dict] = None,
+    **kwargs,
+) -> LoadResult:
+    """Drives `rate` requests per second against the Hostname for `duration` seconds, see ConstantRateLoad"""
+    with hostname.client(**(client_kwargs or {})) as client:
+        return ConstantRateLoad(client, rate, duration).run(url, method, **kwargs)
@@ -0,0 +1,125 @@
+"""
+Probes which send lightweight requests through the data plane until it behaves as expected.
+They replace fixed sleeps after a policy or gateway is reported ready, as the data plane usually converges much sooner.
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from testsuite.httpx import KuadrantClient, Result
+
+logger = logging.getLogger(__name__)
+
+# Status codes returned by load balancers or Envoy while there is no ready upstream yet
+UNAVAILABLE_CODES = {502, 503, 504}
+
+
+class ConvergenceProbe:
+    """
+    Repeats a probe with exponentially growing intervals (starting at `initial_interval`, at most `max_interval`)
+    until it succeeds, fails with AssertionError if it does not succeed within `timeout` seconds.
+    Client is required only by the probes sending HTTP requests, `until` accepts any callable (e.g. a gRPC call).
+    """
+
+    def __init__(
+        self,
+        client: Optional[KuadrantClient] = None,
+        timeout: float = 60,
+        initial_interval: float = 0.05,
+        max_interval: float = 2,
+    ):
+        self.client = client
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+
+    def _request(self, method: str, url, **kwargs) -> Result:
+        assert self.client is not None, "ConvergenceProbe needs a client to send requests"
+        return self.client.request_once(method, url, **kwargs)
+
+    def until(self, probe: Callable[[], bool], description: str = "expected behavior"):
+        """Repeats the probe until it returns True"""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        interval = self.initial_interval
+        attempts = 0
+        while True:
+            attempts += 1
+            if probe():
+                logger.info(
+                    "Data plane converged to %s in %.2fs (%s probes)", description, time.monotonic() - start, attempts
+                )
+                return
+            remaining = deadline - time.monotonic()
+            assert remaining > 0, f"Data plane did not converge to {description} in {self.timeout}s ({attempts} probes)"
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.max_interval)
+
+    def until_result(
+        self, predicate: Callable[[Result], bool], url="/", description: str = None, method="GET", **kwargs
+    ) -> Result:
+        """Sends single request until the predicate returns True for its Result, returns the matching Result"""
+        results: list[Result] = []
+
+        def _probe():
+            results.append(self._request(method, url, **kwargs))
+            return predicate(results[-1])
+
+        self.until(_probe, description or f"expected response from {url}")
+        return results[-1]
+
+    def status(self, status_code: int, url="/", method="GET", **kwargs) -> Result:
+        """Waits until the request returns the status code, e.g. 200 once a rate limit window resets"""
+        return self.until_result(
+            lambda result: result.error is None and result.status_code == status_code,
+            url,
+            f"status code {status_code} from {url}",
+            method,
+            **kwargs,
+        )
+
+    def denied(self, url="/", **kwargs) -> Result:
+        """Waits until the request is denied by authentication or authorization, i.e. 401 or 403"""
+        return self.until_result(
+            lambda result: result.error is None and result.status_code in (401, 403),
+            url,
+            f"denied request to {url}",
+            **kwargs,
+        )
+
+    def header(self, name: str, value: str = None, url="/", **kwargs) -> Result:
+        """Waits until the response contains the header (with the value, if set)"""
+        return self.until_result(
+            lambda result: result.error is None
+            and name in result.headers
+            and (value is None or result.headers[name] == value),
+            url,
+            f"header {name} in response from {url}",
+            **kwargs,
+        )
+
+    def reachable(self, url="/", **kwargs) -> Result:
+        """
+        Waits until anything answers the request, e.g. a new load balancer starts routing to the gateway.
+        TLS failures count as an answer too, as the server had to take part in the handshake.
+        """
+        return self.until_result(
+            lambda result: (result.error is None and result.status_code not in UNAVAILABLE_CODES)
+            or result.has_error("SSL"),
+            url,
+            f"any response from {url}",
+            **kwargs,
+        )
+
+    def limited(self, count: int, url="/", **kwargs):
+        """
+        Waits until `count` requests are followed by a 429.
+        Every attempt counts against the limit, so it should be used only with limits not verified afterward.
+        """
+
+        def _probe():
+            results = [self._request("GET", url, **kwargs) for _ in range(count + 1)]
+            return any(result.error is None and result.status_code == 429 for result in results)
+
+        self.until(_probe, f"429 after {count} requests to {url}")
@@ -26,6 +26,10 @@ class KuadrantSection:
     @property
     def deployment(self):
         """Returns Deployment object for CR"""
+        if self.api_client:
+            deployments = self.informer("apps/v1", "Deployment").list(labels={"app": self.spec_name})
+            assert len(deployments) == 1, f"Expected a single Deployment, but found {len(deployments)}"
+            return Deployment(deployments[0], context=self.context)
         with self.context:
             return selector("deployment", labels={"app": self.spec_name}).object(cls=Deployment)
 
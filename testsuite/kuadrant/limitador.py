@@ -106,6 +106,10 @@ class LimitadorCR(CustomResource):
     @property
     def deployment(self) -> Deployment:
         """Returns Deployment object for this Limitador"""
+        if self.api_client:
+            deployments = self.informer("apps/v1", "Deployment").list(labels={"app": self.name()})
+            assert len(deployments) == 1, f"Expected a single Deployment, but found {len(deployments)}"
+            return Deployment(deployments[0], context=self.context)
         with self.context:
             return selector("deployment", labels={"app": self.name()}).object(cls=Deployment)
 
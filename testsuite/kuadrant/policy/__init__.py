@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Callable, Optional
 
 from testsuite.kubernetes import KubernetesObject
 from testsuite.utils import check_condition
@@ -71,12 +72,19 @@ def is_affected_by(policy: "Policy"):
 class Policy(KubernetesObject):
     """Base class with common functionality for all policies"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Checks that the data plane enforces the policy (see testsuite.httpx.probe), run once it is reported enforced
+        self.probe: Optional[Callable[[], object]] = None
+
     def wait_for_ready(self):
-        """Wait for a Policy to be ready"""
+        """Wait for a Policy to be ready and, if it has a probe, until the data plane enforces it"""
         self.refresh()
         success = self.wait_until(has_observed_generation(self.generation))
         assert success, f"{self.kind()} did not reach observed generation in time"
         self.wait_for_full_enforced()
+        if self.probe is not None:
+            self.probe()
 
     def wait_for_accepted(self):
         """Wait for a Policy to be Accepted"""
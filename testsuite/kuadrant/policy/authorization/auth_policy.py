@@ -43,6 +43,23 @@ class AuthPolicy(Policy, AuthConfig):
 
         return cls(model, context=cluster.context)
 
+    @property
+    def requires_credentials(self) -> bool:
+        """
+        True if every request without credentials is denied, i.e. there is an authentication, none of the identities
+        is anonymous and neither the policy nor the identities are conditional
+        """
+        spec = self.as_dict()["spec"]
+        sections = [spec] + [spec[name] for name in ("defaults", "overrides") if name in spec]
+        if any(section.get("when") for section in sections):
+            return False
+        identities = [
+            identity for section in sections for identity in section.get("rules", {}).get("authentication", {}).values()
+        ]
+        return len(identities) > 0 and not any(
+            "anonymous" in identity or identity.get("when") for identity in identities
+        )
+
     @modify
     def add_rule(self, when: list[CelPredicate]):
         """Add rule for the skip of entire AuthPolicy"""
@@ -181,6 +181,9 @@ class DNSPolicy(Policy):
 
     def get_dns_records(self) -> list[DNSRecord]:
         """Returns DNSRecord objects for the created DNSPolicy"""
+        if self.api_client:
+            records = self.informer("kuadrant.io/v1alpha1", "DNSRecord").list(owner_uid=self.model.metadata.uid)
+            return [DNSRecord(model, context=self.context) for model in records]
         with self.context:
             dns_records = self.get_owned("dnsrecord.kuadrant.io")
             return [DNSRecord(x.model, context=self.context) for x in dns_records]
@@ -1,5 +1,6 @@
 """RateLimitPolicy related objects"""
 
+import re
 import time
 from dataclasses import dataclass
 from typing import Iterable
@@ -18,6 +19,15 @@ class Limit:
     limit: int
     window: str
 
+    @property
+    def window_seconds(self) -> float:
+        """Returns length of the window in seconds, window is a duration like `500ms`, `10s`, `1m` or `1h30m`"""
+        units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+        parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)", self.window)
+        if not parts or "".join(value + unit for value, unit in parts) != self.window:
+            raise ValueError(f"Invalid limit window: {self.window}")
+        return sum(float(value) * units[unit] for value, unit in parts)
+
 
 class RateLimitPolicy(Policy):
     """RateLimitPolicy (or RLP for short) object, used for applying rate limiting rules to a Gateway/HTTPRoute"""
@@ -111,7 +121,9 @@ class RateLimitPolicy(Policy):
         return self
 
     def wait_for_ready(self):
-        """Wait for RLP to be enforced"""
+        """Wait for RLP to be enforced, set probe (e.g. ConvergenceProbe.limited) to avoid the fixed sleep"""
         super().wait_for_ready()
-        # Even after enforced condition RLP requires a short sleep
-        time.sleep(5)
+        if self.probe is None:
+            # Even after enforced condition RLP requires a short sleep. There is no default probe, as any request
+            # checking the limit is counted against it and tests verify the exact number of allowed requests.
+            time.sleep(5)
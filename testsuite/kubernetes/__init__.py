@@ -5,8 +5,10 @@ import functools
 from dataclasses import dataclass, field
 from typing import Optional, Literal
 
-from openshift_client import APIObject, timeout, OpenShiftPythonException
+from openshift_client import APIObject, Model, timeout, OpenShiftPythonException
 
+from testsuite.kubernetes.api_client import KubernetesAPIClient, KubernetesAPIException, APIResult, api_client_for
+from testsuite.kubernetes.informer import Informer, informer_for
 from testsuite.lifecycle import LifecycleObject
 from testsuite.utils import asdict
 
@@ -18,11 +20,25 @@ class KubernetesObject(APIObject, LifecycleObject):
         super().__init__(dict_to_model, string_to_model, context)
         self._committed = None
 
+    @property
+    def api_client(self) -> Optional[KubernetesAPIClient]:
+        """Returns persistent API client if the cluster uses `http` backend, None if it uses oc binary"""
+        return api_client_for(self.context)
+
+    def _api_model(self) -> dict:
+        """Returns model with namespace filled in, as the API client does not know about the context"""
+        model = self.as_dict()
+        model["metadata"].setdefault("namespace", self.context.get_project())
+        return model
+
     @property
     def committed(self):
         """Returns True, if the objects is already committed to the server"""
         if self._committed is None:
-            self._committed, _ = self.exists()
+            if self.api_client:
+                self._committed = self.api_client.get(self._api_model(), ignore_not_found=True) is not None
+            else:
+                self._committed, _ = self.exists()
         return self._committed
 
     def commit(self):
@@ -32,34 +48,107 @@ class KubernetesObject(APIObject, LifecycleObject):
         If the object already exists (e.g. during a pytest rerun), it falls back to apply.
         """
         try:
-            self.create(["--save-config=true"])
-        except OpenShiftPythonException as e:
-            if "AlreadyExists" in str(e):
-                self.apply()
+            if self.api_client:
+                self.api_client.create(self._api_model())
             else:
+                self.create(["--save-config=true"])
+        except (OpenShiftPythonException, KubernetesAPIException) as e:
+            if "AlreadyExists" not in str(e):
                 raise
+            if self.api_client:
+                # Replace requires resourceVersion of the server copy, server-side apply keeps the local spec
+                self.api_client.apply(self._api_model())
+            else:
+                self.apply()
         self._committed = True
         return self.refresh()
 
+    def refresh(self):
+        """Refreshes the model from the server"""
+        if self.api_client:
+            self.model = Model(self.api_client.get(self._api_model()))
+            return self
+        return super().refresh()
+
+    def modify_and_apply(self, modifier_func, retries=2, cmd_args=None, **kwargs):
+        """
+        Same as openshift_client modify_and_apply, with `http` backend the object is replaced and
+        on conflict the modifier_func is applied again on the refreshed object.
+        Other errors are returned right away, so the local changes are not overwritten by the server copy.
+        """
+        if self.api_client is None:
+            return super().modify_and_apply(modifier_func, retries=retries, cmd_args=cmd_args, **kwargs)
+
+        result = APIResult("apply")
+        for attempt in reversed(range(retries + 1)):
+            if modifier_func(self, **kwargs) is False:
+                return result, False
+            try:
+                self.model = Model(self.api_client.replace(self._api_model()))
+                return APIResult("apply", self.as_dict()), True
+            except KubernetesAPIException as e:
+                result = APIResult("apply", error=e)
+                if e.status_code != 409:
+                    break
+                if attempt != 0:
+                    self.refresh()
+        return result, False
+
     def apply(self, modifier_func=None, retries=2, **kwargs):  # pylint: disable=arguments-renamed
         """
         Wrapper for modify_and_apply method, which applies the changes to the already commited object.
         openshift_client library .apply() method is literally .modify_and_apply(), but with no modifier_func and
         retries set to 0.
         """
-        res, success = super().modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
+        res, success = self.modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
         assert success, f"Modify and apply returned non-zero exit code for {self.kind()}/{self.name()}: {res.err()}"
         return res
 
     def delete(self, ignore_not_found=True, cmd_args=None):
         """Deletes the resource, by default ignored not found"""
+        if self.api_client:
+            model = self._api_model()
+            deleted = self.api_client.delete(model, ignore_not_found)
+            self.api_client.wait_for_deletion(model, timeout=30)
+            self._committed = False
+            return deleted
         with timeout(30):
             deleted = super().delete(ignore_not_found, cmd_args)
             self._committed = False
             return deleted
 
+    def informer(self, api_version: str = None, kind: str = None) -> Informer:
+        """
+        Returns informer shared by the whole session for the kind (this object's kind by default)
+        in the namespace of this object. Only available with the `http` backend.
+        """
+        return informer_for(
+            self.api_client,  # type: ignore[arg-type]
+            api_version or self.model.apiVersion,
+            kind or self.model.kind,
+            self.context.get_project(),
+        )
+
+    def _watch_until(self, test_function, timelimit):
+        """
+        Waits until the test function succeeds, evaluating it on every change seen by the shared informer.
+        Returns as soon as the condition is met instead of polling the object periodically.
+        """
+        model = self.informer().wait_for(
+            self.name(),
+            lambda model: test_function(self.__class__(model, context=self.context)),
+            timelimit,
+            self.resource_version(if_missing=None),
+        )
+        if model is None:
+            return False
+        self.model = Model(model)
+        return True
+
     def wait_until(self, test_function, timelimit=60):
         """Waits until the test function succeeds for this object"""
+        if self.api_client:
+            return self._watch_until(test_function, timelimit)
         try:
             with timeout(timelimit):
                 success, _, _ = self.self_selector().until_all(
@@ -0,0 +1,323 @@
+"""
+Persistent HTTP client for the Kubernetes API server.
+It is an optional alternative to the oc/kubectl binary, which is spawned by openshift_client for every single call.
+"""
+
+import base64
+import functools
+import json
+import os
+import ssl
+import time
+from typing import Any, Iterator, Optional
+
+import httpx
+import yaml
+import openshift_client as oc
+
+from testsuite.httpx import create_tmp_file
+
+FIELD_MANAGER = "kuadrant-testsuite"
+
+
+class KubernetesAPIException(Exception):
+    """Kubernetes API server responded with an error Status"""
+
+    def __init__(self, status: dict, status_code: int = None, prefix: str = ""):
+        self.status_code = status.get("code", status_code)
+        self.reason = status.get("reason", "")
+        self.msg = status.get("message", "")
+        super().__init__(f"{prefix}{self.status_code} {self.reason}: {self.msg}")
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "KubernetesAPIException":
+        """Creates exception from the error response"""
+        try:
+            status = response.json()
+        except ValueError:
+            status = {"reason": response.reason_phrase, "message": response.text}
+        return cls(status, response.status_code, f"{response.request.method} {response.request.url}: ")
+
+
+class APIResult:
+    """Minimal equivalent of openshift_client Result, so callers can handle both backends the same way"""
+
+    def __init__(self, verb: str, model: Optional[dict] = None, error: Optional[KubernetesAPIException] = None):
+        self.verb = verb
+        self.model = model
+        self.error = error
+
+    def status(self) -> int:
+        """Returns 0 if the action succeeded, same as oc return code"""
+        return 0 if self.error is None else 1
+
+    def out(self) -> str:
+        """Returns object returned by the server"""
+        return yaml.safe_dump(self.model) if self.model else ""
+
+    def err(self) -> str:
+        """Returns error message returned by the server"""
+        return str(self.error) if self.error else ""
+
+
+def _kubeconfig(kubeconfig_path: Optional[str]) -> dict:
+    """Loads kubeconfig in the same order of precedence as kubectl"""
+    path = kubeconfig_path or os.environ.get("KUBECONFIG", "").split(os.pathsep)[0] or "~/.kube/config"
+    path = os.path.expanduser(path)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return yaml.safe_load(file) or {}
+
+
+def _named(items: Optional[list[dict]], name: Optional[str]) -> dict:
+    """Returns inner section of the named kubeconfig item"""
+    for item in items or []:
+        if item["name"] == name:
+            return next(value for key, value in item.items() if key != "name")
+    return {}
+
+
+class KubernetesAPIClient:
+    """Talks to the Kubernetes API server directly over a persistent connection pool"""
+
+    def __init__(self, api_url: str, token: str = None, verify: ssl.SSLContext | bool = True, cert_data=None):
+        self.files = []
+        cert = None
+        if cert_data:
+            cert_file, key_file = create_tmp_file(cert_data[0]), create_tmp_file(cert_data[1])
+            self.files.extend([cert_file, key_file])
+            cert = (cert_file.name, key_file.name)
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.client = httpx.Client(base_url=api_url, headers=headers, verify=verify, cert=cert, timeout=30)
+
+    @classmethod
+    def from_kubeconfig(cls, api_url: str = None, token: str = None, kubeconfig_path: str = None):
+        """
+        Creates client from the kubeconfig, explicitly set api_url and token take precedence.
+        If kubeconfig authenticates in a way not supported here (e.g. exec plugins), token is requested through oc.
+        """
+        config = _kubeconfig(kubeconfig_path)
+        context = _named(config.get("contexts"), config.get("current-context"))
+        cluster = _named(config.get("clusters"), context.get("cluster"))
+        user = _named(config.get("users"), context.get("user"))
+
+        if api_url and cluster.get("server") != api_url:
+            # Explicitly selected cluster might not be the current one
+            cluster = next((c["cluster"] for c in config.get("clusters", []) if c["cluster"]["server"] == api_url), {})
+        api_url = api_url or cluster["server"]
+
+        verify: ssl.SSLContext | bool = True
+        if cluster.get("insecure-skip-tls-verify"):
+            verify = False
+        elif "certificate-authority-data" in cluster:
+            ca_data = base64.b64decode(cluster["certificate-authority-data"]).decode("utf-8")
+            verify = ssl.create_default_context(cadata=ca_data)
+        elif "certificate-authority" in cluster:
+            verify = ssl.create_default_context(cafile=cluster["certificate-authority"])
+
+        cert_data = None
+        if not token and "client-certificate-data" in user:
+            cert_data = (
+                base64.b64decode(user["client-certificate-data"]).decode("utf-8"),
+                base64.b64decode(user["client-key-data"]).decode("utf-8"),
+            )
+        elif not token:
+            token = user.get("token")
+            if not token and "tokenFile" in user:
+                with open(user["tokenFile"], encoding="utf-8") as file:
+                    token = file.read().strip()
+            if not token:
+                with oc.api_server(api_url, kubeconfig_path=kubeconfig_path):
+                    token = oc.get_auth_token()
+        return cls(api_url, token, verify, cert_data)
+
+    @functools.cache  # pylint: disable=method-cache-max-size-none
+    def resource(self, api_version: str, kind: str) -> tuple[str, bool]:
+        """Returns API path prefix with the plural resource name and whether the resource is namespaced"""
+        base = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+        for resource in self._request("GET", base)["resources"]:
+            if resource["kind"] == kind and "/" not in resource["name"]:
+                return f"{base}/{{namespace}}{resource['name']}", resource["namespaced"]
+        raise KeyError(f"Resource {kind} not found in {api_version}")
+
+    def url(self, api_version: str, kind: str, namespace: str = None, name: str = None) -> str:
+        """Returns URL for the collection (or the named object if name is set)"""
+        path, namespaced = self.resource(api_version, kind)
+        url = path.format(namespace=f"namespaces/{namespace}/" if namespaced and namespace else "")
+        return f"{url}/{name}" if name else url
+
+    def _request(self, method: str, url: str, **kwargs) -> dict[str, Any]:
+        response = self.client.request(method, url, **kwargs)
+        if response.is_error:
+            raise KubernetesAPIException.from_response(response)
+        return response.json()
+
+    @staticmethod
+    def _parts(model: dict) -> tuple[str, str, str, str]:
+        return model["apiVersion"], model["kind"], model["metadata"]["name"], model["metadata"].get("namespace")
+
+    def get(self, model: dict, ignore_not_found=False) -> Optional[dict]:
+        """Returns current version of the object from the server"""
+        api_version, kind, name, namespace = self._parts(model)
+        try:
+            return self._request("GET", self.url(api_version, kind, namespace, name))
+        except KubernetesAPIException as e:
+            if ignore_not_found and e.status_code == 404:
+                return None
+            raise
+
+    def watch(self, model: dict, resource_version: str, timeout: float) -> Iterator[tuple[str, dict]]:
+        """
+        Streams (event type, object) for changes of the object made after the resource_version.
+        Stream ends after timeout seconds, raises KubernetesAPIException with status code 410
+        if the resource_version is too old and the object needs to be fetched again.
+        """
+        api_version, kind, name, namespace = self._parts(model)
+        return self.watch_all(api_version, kind, namespace, resource_version, timeout, {"metadata.name": name})
+
+    def watch_all(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: Optional[str],
+        resource_version: str,
+        timeout: float,
+        field_selectors: dict[str, str] = None,
+    ) -> Iterator[tuple[str, dict]]:
+        """Streams (event type, object) for changes of all objects of the kind, same as watch"""
+        params = {"watch": "true", "resourceVersion": resource_version, "timeoutSeconds": str(max(int(timeout), 1))}
+        if field_selectors:
+            params["fieldSelector"] = ",".join(f"{k}={v}" for k, v in field_selectors.items())
+        url = self.url(api_version, kind, namespace)
+        try:
+            with self.client.stream("GET", url, params=params, timeout=httpx.Timeout(30, read=timeout + 5)) as response:
+                if response.is_error:
+                    response.read()
+                    raise KubernetesAPIException.from_response(response)
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event["type"] == "ERROR":
+                        raise KubernetesAPIException(event["object"], prefix=f"Watch {url}: ")
+                    yield event["type"], event["object"]
+        except httpx.ReadTimeout:
+            # Server did not close the stream after timeoutSeconds
+            pass
+
+    def list_with_version(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str = None,
+        labels: dict[str, str] = None,
+        field_selectors: dict[str, str] = None,
+    ) -> tuple[list[dict], str]:
+        """Same as list, but also returns resourceVersion of the list from which a watch can continue"""
+        params = {}
+        if labels:
+            params["labelSelector"] = ",".join(f"{k}={v}" for k, v in labels.items())
+        if field_selectors:
+            params["fieldSelector"] = ",".join(f"{k}={v}" for k, v in field_selectors.items())
+        result = self._request("GET", self.url(api_version, kind, namespace), params=params)
+        for item in result["items"]:
+            # Items in a List do not contain type information
+            item.setdefault("apiVersion", api_version)
+            item.setdefault("kind", kind)
+        return result["items"], result["metadata"]["resourceVersion"]
+
+    def list(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str = None,
+        labels: dict[str, str] = None,
+        field_selectors: dict[str, str] = None,
+    ) -> list[dict]:
+        """Lists all objects of the kind, optionally filtered by labels and fields"""
+        items, _ = self.list_with_version(api_version, kind, namespace, labels, field_selectors)
+        return items
+
+    def create(self, model: dict) -> dict:
+        """Creates new object"""
+        api_version, kind, _, namespace = self._parts(model)
+        return self._request("POST", self.url(api_version, kind, namespace), json=model)
+
+    def replace(self, model: dict) -> dict:
+        """Replaces the object, fails with Conflict if the resourceVersion in the model is outdated"""
+        api_version, kind, name, namespace = self._parts(model)
+        return self._request("PUT", self.url(api_version, kind, namespace, name), json=model)
+
+    def patch(self, model: dict, patch: dict, patch_type: str = "merge") -> dict:
+        """Patches the object, patch_type is one of `merge`, `strategic-merge` or `json`"""
+        api_version, kind, name, namespace = self._parts(model)
+        return self._request(
+            "PATCH",
+            self.url(api_version, kind, namespace, name),
+            json=patch,
+            headers={"Content-Type": f"application/{patch_type}-patch+json"},
+        )
+
+    def apply(self, model: dict) -> dict:
+        """Server-side applies the object, creating it if it does not exist"""
+        api_version, kind, name, namespace = self._parts(model)
+        model = {**model, "metadata": {k: v for k, v in model["metadata"].items() if k != "managedFields"}}
+        return self._request(
+            "PATCH",
+            self.url(api_version, kind, namespace, name),
+            json=model,
+            params={"fieldManager": FIELD_MANAGER, "force": "true"},
+            headers={"Content-Type": "application/apply-patch+yaml"},
+        )
+
+    def delete(self, model: dict, ignore_not_found=True) -> APIResult:
+        """Deletes the object"""
+        api_version, kind, name, namespace = self._parts(model)
+        try:
+            return APIResult("delete", self._request("DELETE", self.url(api_version, kind, namespace, name)))
+        except KubernetesAPIException as e:
+            if ignore_not_found and e.status_code == 404:
+                return APIResult("delete")
+            raise
+
+    def wait_for_deletion(self, model: dict, timeout: float = 30):
+        """Waits until the object is gone from the server (e.g. its finalizers finished), like `oc delete` does"""
+        deadline = time.monotonic() + timeout
+        while (current := self.get(model, ignore_not_found=True)) is not None:
+            if (remaining := deadline - time.monotonic()) <= 0:
+                _, kind, name, namespace = self._parts(model)
+                raise TimeoutError(f"{kind} {namespace}/{name} was not deleted in {timeout}s")
+            try:
+                for event_type, _ in self.watch(current, current["metadata"]["resourceVersion"], remaining):
+                    if event_type == "DELETED":
+                        return
+            except KubernetesAPIException as e:
+                # Watch expired, the object is fetched again
+                if e.status_code != 410:
+                    raise
+
+    def close(self):
+        """Closes all pooled connections"""
+        self.client.close()
+        for file in self.files:
+            file.close()
+        self.files = []
+
+
+@functools.cache
+def _connect(api_url: Optional[str], token: Optional[str], kubeconfig_path: Optional[str]) -> KubernetesAPIClient:
+    """Returns one shared client per cluster and credentials, so the connection pool is reused"""
+    return KubernetesAPIClient.from_kubeconfig(api_url, token, kubeconfig_path)
+
+
+def api_client_for(context: oc.Context) -> Optional[KubernetesAPIClient]:
+    """Returns API client for the openshift_client Context, if it is set to use the `http` backend"""
+    if getattr(context, "backend", "oc") != "http":
+        return None
+    return shared_api_client(context)
+
+
+def shared_api_client(context: oc.Context) -> KubernetesAPIClient:
+    """Returns API client for the openshift_client Context regardless of its backend, e.g. for API server proxy"""
+    return _connect(context.get_api_server(), context.get_token(), context.get_kubeconfig_path())
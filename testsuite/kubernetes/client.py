@@ -1,39 +1,89 @@
 """This module implements an KubernetesCLI interface using oc/kubectl binary commands."""
 
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, cached_property
+from itertools import groupby
+from typing import Literal
 from urllib.parse import urlparse
+import json
 import tempfile
 import yaml
 
 import openshift_client as oc
 from openshift_client import Context, OpenShiftPythonException
 
+from testsuite.kubernetes import KubernetesObject
 from testsuite.kubernetes.openshift.route import OpenshiftRoute
 from testsuite.kubernetes.service import Service
+from .api_client import FIELD_MANAGER, KubernetesAPIClient, api_client_for
+from .informer import Informer, informer_for
 from .service_account import ServiceAccount
 from .deployment import Deployment
 from .secret import Secret
 
+# Kinds that other objects commonly depend on, in the order they need to exist. Anything else is applied last.
+APPLY_ORDER = [
+    "Namespace",
+    "CustomResourceDefinition",
+    "ServiceAccount",
+    "Role",
+    "RoleBinding",
+    "Secret",
+    "ConfigMap",
+    "Deployment",
+    "Service",
+    "Gateway",
+    "HTTPRoute",
+    "GRPCRoute",
+]
+
+
+def _apply_rank(obj: KubernetesObject) -> int:
+    """Returns position of the object's kind in APPLY_ORDER"""
+    kind = obj.model.kind
+    return APPLY_ORDER.index(kind) if kind in APPLY_ORDER else len(APPLY_ORDER)
+
 
 class KubernetesClient:
-    """KubernetesClient is a helper class for invoking kubectl commands"""
+    """
+    KubernetesClient is a helper class for invoking kubectl commands.
+    With `http` backend, KubernetesObjects created through it talk to the API server directly instead.
+    """
 
     # pylint: disable=too-many-public-methods
 
-    def __init__(self, project: str = None, api_url: str = None, token: str = None, kubeconfig_path: str = None):
+    def __init__(
+        self,
+        project: str = None,
+        api_url: str = None,
+        token: str = None,
+        kubeconfig_path: str = None,
+        backend: Literal["oc", "http"] = "oc",
+    ):
         self._project = project
         self._api_url = api_url
         self._token = token
         self._kubeconfig_path = kubeconfig_path
+        self._backend = backend
 
     @classmethod
     def from_context(cls, context: Context) -> "KubernetesClient":
         """Creates self from the context"""
-        return cls(context.get_project(), context.get_api_url(), context.get_token(), context.get_kubeconfig_path())
+        return cls(
+            context.get_project(),
+            context.get_api_url(),
+            context.get_token(),
+            context.get_kubeconfig_path(),
+            getattr(context, "backend", "oc"),
+        )
 
     def change_project(self, project) -> "KubernetesClient":
         """Return new self with a different project"""
-        return KubernetesClient(project, self._api_url, self._token, self._kubeconfig_path)
+        return KubernetesClient(project, self._api_url, self._token, self._kubeconfig_path, self._backend)
+
+    def change_backend(self, backend: Literal["oc", "http"]) -> "KubernetesClient":
+        """Return new self which uses a different backend for KubernetesObjects"""
+        return KubernetesClient(self._project, self._api_url, self._token, self._kubeconfig_path, backend)
 
     @cached_property
     def context(self):
@@ -44,9 +94,33 @@ class KubernetesClient:
         context.api_server = self._api_url
         context.token = self._token
         context.kubeconfig_path = self._kubeconfig_path
+        # Not used by openshift_client, it is copied together with the context into every object
+        context.backend = self._backend
 
         return context
 
+    @property
+    def backend(self) -> str:
+        """Returns backend used by the objects, either `oc` or `http`"""
+        return self._backend
+
+    @property
+    def api_client(self) -> KubernetesAPIClient | None:
+        """Returns persistent API client if the `http` backend is used"""
+        return api_client_for(self.context)
+
+    def informer(self, api_version: str, kind: str) -> Informer:
+        """Returns informer shared by the whole session for the kind in this project, only for `http` backend"""
+        return informer_for(self.api_client, api_version, kind, self.project)  # type: ignore[arg-type]
+
+    def _get_object(self, api_version: str, kind: str, name: str, cls):
+        """Returns the object served from the shared informer, wrapped in the class"""
+        model = self.informer(api_version, kind).get(name)
+        if model is None:
+            # Same error as oc backend raises, so callers can handle both the same way
+            raise oc.OpenShiftPythonException(f"Expected a single object, but selected 0: {kind}/{name}")
+        return cls(model, context=self.context)
+
     @property
     def current_context_name(self) -> str:
         """Returns the current context name from the kubeconfig"""
@@ -102,11 +176,15 @@ class KubernetesClient:
 
     def get_secret(self, name):
         """Returns dict-like structure for accessing secret data"""
+        if self.api_client:
+            return self._get_object("v1", "Secret", name, Secret)
         with self.context:
             return oc.selector(f"secret/{name}").object(cls=Secret)
 
     def service_exists(self, name) -> bool:
         """Returns True if service with the given name exists"""
+        if self.api_client:
+            return self.informer("v1", "Service").get(name) is not None
         with self.context:
             return oc.selector(f"svc/{name}").count_existing() == 1
 
@@ -122,11 +200,15 @@ class KubernetesClient:
 
     def get_service(self, service_name: str):
         """Returns dict-like structure for accessing service data"""
+        if self.api_client:
+            return self._get_object("v1", "Service", service_name, Service)
         with self.context:
             return oc.selector(f"service/{service_name}").object(cls=Service)
 
     def get_deployment(self, name: str):
         """Returns dict-like structure for accessing deployment data"""
+        if self.api_client:
+            return self._get_object("apps/v1", "Deployment", name, Deployment)
         with self.context:
             return oc.selector(f"deployment/{name}").object(cls=Deployment)
 
@@ -162,6 +244,70 @@ class KubernetesClient:
             obj.context = self.context
         return obj
 
+    def apply_many(self, objects: list[KubernetesObject]) -> list[KubernetesObject]:
+        """
+        Applies all objects at once, creating those that do not exist yet, and returns them refreshed.
+        Objects are applied in dependency order (see APPLY_ORDER), the order of the passed list does not matter.
+        With `oc` backend it is a single client-side `oc apply` invocation, so the objects get the last-applied
+        annotation the same way as with `create --save-config` and later `oc apply` calls can merge with it.
+        With `http` backend (of all objects) all objects of the same rank are server-side applied concurrently
+        over the pooled connection. Objects of classes with their own `commit` are committed one by one, in order.
+        All objects have to belong to this cluster.
+        """
+        ordered = sorted(objects, key=_apply_rank)
+        pending: list[KubernetesObject] = []
+        for obj in ordered:
+            if type(obj).commit is KubernetesObject.commit:
+                pending.append(obj)
+                continue
+            self._apply_all(pending)
+            pending = []
+            obj.commit()
+        self._apply_all(pending)
+        return objects
+
+    def _apply_all(self, objects: list[KubernetesObject]):
+        """Applies already ordered objects using their plain manifests, see apply_many"""
+        if not objects:
+            return
+        for obj in objects:
+            if self._namespaced(obj.model.apiVersion, obj.model.kind):
+                obj.model.metadata.namespace = obj.model.metadata.namespace or obj.context.get_project()
+
+        if all(obj.api_client for obj in objects):
+            with ThreadPoolExecutor() as executor:
+                for _, rank in groupby(objects, key=_apply_rank):
+                    batch = list(rank)
+                    models = executor.map(lambda o: o.api_client.apply(o.as_dict()), batch)
+                    for obj, model in zip(batch, models):
+                        obj.model = oc.Model(model)
+        else:
+            manifest = {"apiVersion": "v1", "kind": "List", "items": [obj.as_dict() for obj in objects]}
+            args = ["-f", "-", f"--field-manager={FIELD_MANAGER}", "-o", "json"]
+            applied = json.loads(self.do_action("apply", *args, stdin_str=json.dumps(manifest)).out())
+            by_name = {
+                (item["kind"], item["metadata"].get("namespace"), item["metadata"]["name"]): item
+                for item in applied.get("items", [applied])
+            }
+            for obj in objects:
+                obj.model = oc.Model(by_name[(obj.model.kind, obj.namespace(if_missing=None), obj.name())])
+
+        for obj in objects:
+            obj._committed = True  # pylint: disable=protected-access
+
+    def _namespaced(self, api_version: str, kind: str) -> bool:
+        """Returns whether the kind is namespaced according to the API discovery, unknown kinds are namespaced"""
+        if self.api_client:
+            return self.api_client.resource(api_version, kind)[1]
+        return self._discovery(api_version).get(kind, True)
+
+    @cache  # pylint: disable=method-cache-max-size-none
+    def _discovery(self, api_version: str) -> dict[str, bool]:
+        """Returns whether each kind of the API group version is namespaced"""
+        base = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+        resources = json.loads(self.do_action("get", "--raw", base).out())["resources"]
+        return {resource["kind"]: resource["namespaced"] for resource in resources if "/" not in resource["name"]}
+
     def create_merged_kubeconfig(self, cluster2: "KubernetesClient") -> str:
         """
         Creates a merged kubeconfig from this instance and another KubernetesClient instance.
@@ -0,0 +1,233 @@
+"""
+Shared in-memory cache of Kubernetes objects, kept up to date by a single long-lived watch per kind and namespace.
+Used with the `http` backend to serve lookups and waits without asking the API server every time.
+"""
+
+import copy
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from testsuite.kubernetes.api_client import KubernetesAPIClient, KubernetesAPIException
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for the cache to catch up with a resourceVersion before asking the API server directly
+FRESHNESS_TIMEOUT = 5
+# Predicates can depend on other objects too, so they are re-evaluated at least this often even without an event
+REEVALUATE_INTERVAL = 1
+
+
+class Informer:  # pylint: disable=too-many-instance-attributes
+    """List-watches all objects of a single kind in a namespace and keeps them indexed by name, label and owner"""
+
+    def __init__(self, api_client: KubernetesAPIClient, api_version: str, kind: str, namespace: Optional[str]):
+        self.api_client = api_client
+        self.api_version = api_version
+        self.kind = kind
+        self.namespace = namespace
+        self.resource_version = "0"
+
+        self._objects: dict[str, dict] = {}
+        self._by_label: dict[tuple[str, str], set[str]] = {}
+        self._by_owner: dict[str, set[str]] = {}
+        # All resourceVersions of every object seen by this informer. They are opaque and can only be compared
+        # for equality, the cache is fresh for a version once it has seen the object at exactly that version.
+        self._versions: dict[str, set[str]] = {}
+        self._condition = threading.Condition()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        # Last failure of list or watch, reported if the cache never manages to sync
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name=f"informer-{kind}-{namespace}", daemon=True)
+        self._thread.start()
+
+    def _index(self, name: str, model: Optional[dict]):
+        """Replaces object in the store and all indexes, model None removes it"""
+        if old := self._objects.pop(name, None):
+            for label in (old["metadata"].get("labels") or {}).items():
+                self._by_label.get(label, set()).discard(name)
+            for owner in old["metadata"].get("ownerReferences") or []:
+                self._by_owner.get(owner["uid"], set()).discard(name)
+        if model is None:
+            return
+        self._objects[name] = model
+        for label in (model["metadata"].get("labels") or {}).items():
+            self._by_label.setdefault(label, set()).add(name)
+        for owner in model["metadata"].get("ownerReferences") or []:
+            self._by_owner.setdefault(owner["uid"], set()).add(name)
+
+    def _list(self):
+        items, resource_version = self.api_client.list_with_version(self.api_version, self.kind, self.namespace)
+        with self._condition:
+            for name in list(self._objects):
+                self._index(name, None)
+            for name in set(self._versions) - {item["metadata"]["name"] for item in items}:
+                del self._versions[name]
+            for item in items:
+                self._index(item["metadata"]["name"], item)
+                self._versions.setdefault(item["metadata"]["name"], set()).add(item["metadata"]["resourceVersion"])
+            self.resource_version = resource_version
+            self._error = None
+            self._synced.set()
+            self._condition.notify_all()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._list()
+                while not self._stopped.is_set():
+                    for event, model in self.api_client.watch_all(
+                        self.api_version, self.kind, self.namespace, self.resource_version, timeout=5 * 60
+                    ):
+                        with self._condition:
+                            name = model["metadata"]["name"]
+                            if event == "DELETED":
+                                self._index(name, None)
+                                self._versions.pop(name, None)
+                            else:
+                                self._index(name, model)
+                                self._versions.setdefault(name, set()).add(model["metadata"]["resourceVersion"])
+                            self.resource_version = model["metadata"]["resourceVersion"]
+                            self._condition.notify_all()
+            except KubernetesAPIException as e:
+                # 410 Gone means the resourceVersion is too old, start over with a full list right away
+                if e.status_code != 410:
+                    self._failed(e)
+            # Any other failure means the cache might be out of date, start over with a full list
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._failed(e)
+
+    def _failed(self, error: Exception):
+        logger.warning("Informer for %s in %s failed, relisting: %s", self.kind, self.namespace, error)
+        self._error = error
+        self._stopped.wait(1)
+
+    def stop(self):
+        """Stops watching, the current watch is closed after its timeout"""
+        self._stopped.set()
+
+    @property
+    def synced(self) -> bool:
+        """True if the initial list succeeded and the cache can be used"""
+        return self._synced.is_set()
+
+    def _wait_fresh(self, timeout: float, name: str = None, resource_version: str = None) -> bool:
+        """
+        Waits until the cache has seen the object at resource_version, returns False on timeout.
+        Cache can skip some versions while relisting, so callers have to fall back to the API server on timeout.
+        """
+        if not self._synced.wait(timeout):
+            return False
+        if name is None or resource_version is None:
+            return True
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: resource_version in self._versions.get(name, set()), timeout=timeout
+            )
+
+    def get(self, name: str, resource_version: str = None) -> Optional[dict]:
+        """
+        Returns copy of the object, at least as fresh as the resource_version.
+        If the cache does not catch up in time, the object is fetched from the API server.
+        """
+        if self._wait_fresh(FRESHNESS_TIMEOUT, name, resource_version):
+            with self._condition:
+                if name in self._objects:
+                    return copy.deepcopy(self._objects[name])
+        return self._get_direct(name)
+
+    def _get_direct(self, name: str) -> Optional[dict]:
+        """Fetches the object from the API server, bypassing the cache"""
+        metadata = {"name": name, "namespace": self.namespace}
+        model = {"apiVersion": self.api_version, "kind": self.kind, "metadata": metadata}
+        return self.api_client.get(model, ignore_not_found=True)
+
+    def list(self, labels: dict[str, str] = None, owner_uid: str = None) -> list[dict]:
+        """Returns copies of all objects matching all labels and owned by the owner_uid"""
+        if not self._wait_fresh(FRESHNESS_TIMEOUT):
+            items = self.api_client.list(self.api_version, self.kind, self.namespace, labels)
+            return [
+                item
+                for item in items
+                if not owner_uid
+                or any(owner["uid"] == owner_uid for owner in item["metadata"].get("ownerReferences") or [])
+            ]
+        with self._condition:
+            names = set(self._objects)
+            for label in (labels or {}).items():
+                names &= self._by_label.get(label, set())
+            if owner_uid:
+                names &= self._by_owner.get(owner_uid, set())
+            return [copy.deepcopy(self._objects[name]) for name in sorted(names)]
+
+    def wait_for(
+        self, name: str, predicate: Callable[[dict], bool], timeout: float, resource_version: str = None
+    ) -> Optional[dict]:
+        """
+        Waits until the predicate returns True for the object (at least as fresh as the resource_version).
+        Returns copy of the matching object or None on timeout.
+        If the cache does not see the resource_version in time, the object is fetched from the API server
+        and the cache has to catch up with its current version instead.
+        If the cache cannot sync, the object is polled from the API server and the informer failure is raised
+        if the predicate never succeeds.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._synced.wait(min(timeout, FRESHNESS_TIMEOUT)):
+            return self._poll_for(name, predicate, deadline)
+        if not self._wait_fresh(min(deadline - time.monotonic(), FRESHNESS_TIMEOUT), name, resource_version):
+            model = self._get_direct(name)
+            if model is not None and predicate(model):
+                return model
+            if time.monotonic() >= deadline:
+                return None
+            current_version = model["metadata"]["resourceVersion"] if model is not None else None
+            return self.wait_for(name, predicate, deadline - time.monotonic(), current_version)
+        while True:
+            # Predicate is evaluated outside the lock, it can take a while and the watch must not be blocked
+            with self._condition:
+                seen_version = self.resource_version
+                model = copy.deepcopy(self._objects.get(name))
+            if model is not None and predicate(model):
+                return model
+            with self._condition:
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    return None
+                self._condition.wait_for(
+                    lambda: self.resource_version != seen_version, timeout=min(remaining, REEVALUATE_INTERVAL)
+                )
+
+    def _poll_for(self, name: str, predicate: Callable[[dict], bool], deadline: float) -> Optional[dict]:
+        """Waits for the predicate by fetching the object directly, used while the cache is not synced"""
+        while True:
+            if (model := self._get_direct(name)) is not None and predicate(model):
+                return model
+            if self.synced:
+                return self.wait_for(name, predicate, deadline - time.monotonic())
+            if time.monotonic() >= deadline:
+                if self._error is not None:
+                    raise self._error
+                return None
+            time.sleep(REEVALUATE_INTERVAL)
+
+
+_informers: dict[tuple, Informer] = {}
+_informers_lock = threading.Lock()
+
+
+def informer_for(api_client: KubernetesAPIClient, api_version: str, kind: str, namespace: Optional[str]) -> Informer:
+    """Returns informer shared by the whole test session for the kind in the namespace"""
+    with _informers_lock:
+        key = (api_client, api_version, kind, namespace)
+        if key not in _informers:
+            _informers[key] = Informer(api_client, api_version, kind, namespace)
+        return _informers[key]
+
+
+def stop_informers():
+    """Stops all shared informers, called at the end of the session"""
+    with _informers_lock:
+        for informer in _informers.values():
+            informer.stop()
+        _informers.clear()
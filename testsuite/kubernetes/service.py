@@ -1,11 +1,12 @@
 """Service related objects"""
 
-from time import sleep
 from dataclasses import dataclass, asdict
 from typing import Literal
 
 from openshift_client import timeout, Missing
 
+from testsuite.httpx import KuadrantClient
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kubernetes import KubernetesObject
 
 
@@ -88,4 +89,7 @@ class Service(KubernetesObject):
         )
         assert success, f"Service {self.name()} did not get ready in time"
         if slow_loadbalancers:
-            sleep(60)
+            with KuadrantClient(
+                base_url=f"http://{self.external_ip}:{self.model.spec.ports[0].port}", timeout=5
+            ) as client:
+                ConvergenceProbe(client, timeout=timeout, max_interval=5).reachable()
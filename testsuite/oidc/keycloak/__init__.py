@@ -7,7 +7,7 @@ from keycloak import KeycloakOpenID, KeycloakAdmin, KeycloakPostError
 
 from testsuite.oidc import OIDCProvider, Token
 from testsuite.lifecycle import LifecycleObject
-from .objects import Realm, Client, User
+from .objects import Realm, Client, User, RealmImport, ImportedResources
 
 
 # pylint: disable=too-many-instance-attributes
@@ -1,7 +1,8 @@
 """Object wrappers for Keycloak resources"""
 
+import secrets
 from functools import cached_property
-from typing import List
+from typing import List, Optional
 
 from keycloak import KeycloakOpenID, KeycloakAdmin
 
@@ -56,6 +57,31 @@ class Realm:
         role_id = self.admin.get_realm_role(role_name)["id"]
         return {"name": role_name, "id": role_id}
 
+    def import_resources(self, resources: "RealmImport") -> "ImportedResources":
+        """Creates all resources from the RealmImport in a single partial import request"""
+        response = self.admin.partial_import_realm(self.name, resources.payload())
+        ids: dict[str, dict[str, str]] = {}
+        for result in response.get("results", []):
+            ids.setdefault(result["resourceType"], {})[result["resourceName"]] = result["id"]
+
+        users = ids.get("USER", {})
+        clients = ids.get("CLIENT", {})
+        roles = ids.get("REALM_ROLE", {})
+        return ImportedResources(
+            users=[
+                User(self, users[user["username"]], user["username"], resources.passwords[user["username"]])
+                for user in resources.users
+                if user["username"] in users
+            ],
+            clients=[
+                Client(self, clients[client["clientId"]])
+                for client in resources.clients
+                if client["clientId"] in clients
+            ],
+            groups=ids.get("GROUP", {}),
+            roles={name: {"name": name, "id": role_id} for name, role_id in roles.items()},
+        )
+
     def oidc_client(self, client_id, client_secret):
         """Create OIDC client for this realm"""
         return KeycloakOpenID(
@@ -173,3 +199,106 @@ class User:
     def properties(self):
         """Returns User information in a dict"""
         return self.admin.get_user(self.user_id)
+
+
+class RealmImport:
+    """
+    In-memory representation of many realm resources (realm roles, groups, users and clients), which are created
+    by Realm.import_resources in a single partial import request instead of several requests per resource.
+    Passwords and client secrets are generated unless they are set explicitly.
+    """
+
+    def __init__(self, if_resource_exists="FAIL") -> None:
+        # One of FAIL, SKIP or OVERWRITE
+        self.if_resource_exists = if_resource_exists
+        self.realm_roles: list[dict] = []
+        self.groups: list[dict] = []
+        self.users: list[dict] = []
+        self.clients: list[dict] = []
+        self.passwords: dict[str, str] = {}
+
+    def add_realm_role(self, name: str, **kwargs) -> str:
+        """Adds realm role, returns its name"""
+        self.realm_roles.append({**kwargs, "name": name})
+        return name
+
+    def add_group(
+        self,
+        name: str,
+        realm_roles: Optional[List[str]] = None,
+        client_roles: Optional[dict[str, List[str]]] = None,
+        **kwargs,
+    ) -> str:
+        """Adds top-level group with realm roles and client roles (by clientId), returns its path usable in add_user"""
+        self.groups.append(
+            {
+                **kwargs,
+                "name": name,
+                "path": f"/{name}",
+                "realmRoles": realm_roles or [],
+                "clientRoles": client_roles or {},
+            }
+        )
+        return f"/{name}"
+
+    def add_user(
+        self,
+        username: str,
+        password: Optional[str] = None,
+        realm_roles: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+        client_roles: Optional[dict[str, List[str]]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Adds user with realm roles, client roles (by clientId) and group memberships (paths of the groups),
+        returns the password
+        """
+        password = password or secrets.token_urlsafe(16)
+        kwargs.setdefault("firstName", "John")
+        kwargs.setdefault("lastName", "Doe")
+        kwargs.setdefault("email", f"{username}@anything.invalid")
+        self.users.append(
+            {
+                **kwargs,
+                "username": username,
+                "enabled": True,
+                "emailVerified": True,
+                "credentials": [{"type": "password", "value": password, "temporary": False}],
+                "realmRoles": realm_roles or [],
+                "groups": groups or [],
+                "clientRoles": client_roles or {},
+            }
+        )
+        self.passwords[username] = password
+        return password
+
+    def add_client(self, name: str, secret: Optional[str] = None, **kwargs) -> str:
+        """Adds confidential client, returns its secret"""
+        secret = secret or secrets.token_urlsafe(24)
+        self.clients.append(
+            {"publicClient": False, "protocol": "openid-connect", **kwargs, "clientId": name, "secret": secret}
+        )
+        return secret
+
+    def payload(self) -> dict:
+        """Returns PartialImportRepresentation"""
+        return {
+            "ifResourceExists": self.if_resource_exists,
+            "roles": {"realm": self.realm_roles},
+            "groups": self.groups,
+            "users": self.users,
+            "clients": self.clients,
+        }
+
+
+class ImportedResources:
+    """Resources created by Realm.import_resources"""
+
+    def __init__(self, users: List[User], clients: List[Client], groups: dict[str, str], roles: dict[str, dict]):
+        self.users = users
+        self.clients = clients
+        # Group name to its id
+        self.groups = groups
+        # Role name to dictionary with "name" and "id", as returned by Realm.create_realm_role
+        self.roles = roles
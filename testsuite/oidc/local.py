@@ -0,0 +1,258 @@
+"""OIDCProvider signing tokens in-process, with discovery, JWKS and token endpoints served by a local HTTP server"""
+
+import json
+import secrets
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from testsuite.lifecycle import LifecycleObject
+from testsuite.oidc import OIDCProvider, Token
+from testsuite.utils import is_local_address
+
+
+class SigningKey:
+    """RSA key used for signing tokens, identified by its kid in JWKS"""
+
+    def __init__(self, key_size: int = 2048) -> None:
+        self.kid = uuid.uuid4().hex
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+
+    @property
+    def jwk(self) -> dict:
+        """Public part of the key as JWK"""
+        jwk = RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True)
+        return {**jwk, "kid": self.kid, "use": "sig", "alg": "RS256"}
+
+
+class TokenError(Exception):
+    """Token request was rejected, `error` is the OAuth 2.0 error code"""
+
+    def __init__(self, error: str, description: str):
+        super().__init__(f"{error}: {description}")
+        self.error = error
+        self.description = description
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves discovery document, JWKS and token endpoint of the provider"""
+
+    server: "_Server"
+
+    def _send_json(self, status: int, document: dict):
+        body = json.dumps(document).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Returns JSON document for known paths, 404 otherwise"""
+        provider = self.server.provider
+        if self.path == "/.well-known/openid-configuration":
+            self._send_json(200, provider.well_known)
+        elif self.path == "/jwks":
+            self._send_json(200, provider.jwks())
+        elif self.path.split("?")[0] == "/authorize":
+            # Only direct grants are supported, there is no login page
+            self._send_json(400, {"error": "unsupported_response_type"})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Token endpoint, supports password and refresh_token grants"""
+        if self.path != "/token":
+            self.send_error(404)
+            return
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode())
+        params = {name: values[0] for name, values in form.items()}
+        provider = self.server.provider
+        try:
+            match params.get("grant_type"):
+                case "password":
+                    if not params.get("username") or not params.get("password"):
+                        raise TokenError("invalid_request", "Username and password are required")
+                    token = provider.get_token(params["username"], params["password"])
+                case "refresh_token":
+                    token = provider.refresh_token(params.get("refresh_token", ""))
+                case grant_type:
+                    raise TokenError("unsupported_grant_type", f"Grant type {grant_type} is not supported")
+        except TokenError as e:
+            self._send_json(400, {"error": e.error, "error_description": e.description})
+            return
+        self._send_json(
+            200,
+            {
+                "access_token": token.access_token,
+                "token_type": "Bearer",
+                "expires_in": provider.token_lifetime,
+                "refresh_token": token.refresh_token,
+                "refresh_expires_in": provider.refresh_token_lifetime,
+            },
+        )
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Requests are not logged"""
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, provider: "LocalOIDCProvider"):
+        super().__init__(address, _Handler)
+        self.provider = provider
+
+
+# pylint: disable=too-many-instance-attributes
+class LocalOIDCProvider(OIDCProvider, LifecycleObject):
+    """
+    OIDCProvider stand-in which mints RS256-signed JWTs in-process, without a round trip to a real provider.
+    Tokens are issued only for known users with the right password (see add_user) and refresh tokens are opaque,
+    single-use values expiring after `refresh_token_lifetime` seconds. Discovery document, JWKS and token endpoint
+    are served on `bind`:`port` (random port if 0). Authorino fetches the discovery document and JWKS from the issuer
+    URL, so `issuer` has to be set to a URL reachable from the cluster unless `bind` is such an address itself
+    (see reachable_from_cluster).
+    """
+
+    def __init__(
+        self,
+        bind: str = "127.0.0.1",
+        port: int = 0,
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        token_lifetime: int = 24 * 60 * 60,
+        refresh_token_lifetime: int = 24 * 60 * 60,
+        key_size: int = 2048,
+        test_username: str = "testUser",
+        test_password: str = "testPassword",
+    ) -> None:
+        self.bind = bind
+        self.port = port
+        self._issuer = issuer
+        self.audience = audience
+        self.token_lifetime = token_lifetime
+        self.refresh_token_lifetime = refresh_token_lifetime
+        self.key_size = key_size
+        self.test_username = test_username
+        self.test_password = test_password
+        self.users: dict[str, str] = {test_username: test_password}
+        # Opaque refresh token -> (username, expiration), every refresh token can be used only once
+        self._refresh_tokens: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        # Newest key is the first one and is used for signing, the others are only published in JWKS
+        self.keys: list[SigningKey] = [SigningKey(key_size)]
+        self.server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def issuer(self) -> str:
+        """Issuer URL, which is also the base URL of the discovery document"""
+        if self._issuer:
+            return self._issuer.rstrip("/")
+        assert self.server is not None, "LocalOIDCProvider has to be committed first"
+        return f"http://{self.bind}:{self.server.server_address[1]}"
+
+    @property
+    def reachable_from_cluster(self) -> bool:
+        """False if the issuer is not set and the server is bound to a loopback or unspecified address"""
+        return bool(self._issuer) or not is_local_address(self.bind)
+
+    def commit(self):
+        self.server = _Server((self.bind, self.port), self)
+        self._thread = threading.Thread(target=self.server.serve_forever, name="local-oidc", daemon=True)
+        self._thread.start()
+
+    def delete(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    @property
+    def well_known(self):
+        return {
+            "issuer": self.issuer,
+            "authorization_endpoint": f"{self.issuer}/authorize",
+            "token_endpoint": f"{self.issuer}/token",
+            "jwks_uri": f"{self.issuer}/jwks",
+            "response_types_supported": ["id_token"],
+            "grant_types_supported": ["password", "refresh_token"],
+            "subject_types_supported": ["public"],
+            "id_token_signing_alg_values_supported": ["RS256"],
+            "token_endpoint_auth_methods_supported": ["none"],
+            "scopes_supported": ["openid"],
+            "claims_supported": ["iss", "sub", "aud", "exp", "iat", "jti", "preferred_username"],
+        }
+
+    def jwks(self) -> dict:
+        """Returns JWKS with all keys"""
+        return {"keys": [key.jwk for key in self.keys]}
+
+    def mint(self, subject: Optional[str] = None, lifetime: Optional[int] = None, **claims) -> str:
+        """Returns access token for the subject signed by the newest key, claims override the default ones"""
+        assert self.keys, "There is no signing key, create one with create_signing_rs256_jwks_key"
+        subject = subject or self.test_username
+        now = int(time.time())
+        payload = {
+            "iss": self.issuer,
+            "sub": subject,
+            "preferred_username": subject,
+            "iat": now,
+            "exp": now + (lifetime or self.token_lifetime),
+            "jti": uuid.uuid4().hex,
+        }
+        if self.audience:
+            payload["aud"] = self.audience
+        key = self.keys[0]
+        return jwt.encode({**payload, **claims}, key.private_key, algorithm="RS256", headers={"kid": key.kid})
+
+    def add_user(self, username: str, password: str):
+        """Adds user, for which tokens can be issued"""
+        with self._lock:
+            self.users[username] = password
+
+    def _issue(self, username: str) -> Token:
+        refresh_token = secrets.token_urlsafe(32)
+        now = time.monotonic()
+        with self._lock:
+            # Expired refresh tokens are evicted, so unused ones do not pile up for the whole session
+            for expired in [token for token, (_, expiration) in self._refresh_tokens.items() if expiration <= now]:
+                del self._refresh_tokens[expired]
+            self._refresh_tokens[refresh_token] = (username, now + self.refresh_token_lifetime)
+        return Token(self.mint(username), self.refresh_token, refresh_token)
+
+    def refresh_token(self, refresh_token):
+        """Mints new token for the user the refresh token was issued to, the refresh token is revoked"""
+        with self._lock:
+            username, expiration = self._refresh_tokens.pop(refresh_token, (None, 0.0))
+        if username is None or expiration <= time.monotonic():
+            raise TokenError("invalid_grant", "Refresh token is invalid, expired or was already used")
+        return self._issue(username)
+
+    def get_token(self, username=None, password=None) -> Token:
+        """Mints token for the user, raises TokenError if the credentials are not valid"""
+        username = username or self.test_username
+        password = password or self.test_password
+        with self._lock:
+            expected = self.users.get(username)
+        if expected is None or not secrets.compare_digest(expected.encode(), password.encode()):
+            raise TokenError("invalid_grant", "Invalid user credentials")
+        return self._issue(username)
+
+    def create_signing_rs256_jwks_key(self):
+        """Creates a new signing RS256 key, which is used for all tokens minted from now on"""
+        self.keys.insert(0, SigningKey(self.key_size))
+
+    def delete_signing_rs256_jwks_key(self):
+        """Deletes the key currently used for signing from JWKS, previous key (if any) takes its place"""
+        assert self.keys, "There is no signing key to delete"
+        self.keys.pop(0)
@@ -0,0 +1,127 @@
+"""Pool of OIDC tokens for many users, minted ahead of time and kept fresh in the background"""
+
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import jwt
+
+from testsuite.oidc import OIDCProvider, Token
+
+logger = logging.getLogger(__name__)
+
+# Tokens are refreshed after at least this fraction of their lifetime, even if it is shorter than refresh_margin
+MIN_LIFETIME_FRACTION = 0.5
+# Shortest time between refreshes of a token, e.g. if the provider issues already expired tokens due to clock skew
+MIN_REFRESH_INTERVAL = 1.0
+
+
+def token_expiration(token: Token) -> float:
+    """Returns Unix time when the access token expires, tokens without `exp` claim are considered valid for a day"""
+    claims = jwt.decode(token.access_token, options={"verify_signature": False})
+    return float(claims.get("exp", time.time() + 24 * 60 * 60))
+
+
+class TokenPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Mints tokens for all users concurrently when started and refreshes them `refresh_margin` seconds
+    before they expire, so the tokens can be handed out without waiting for the OIDC provider.
+    Tokens living shorter than twice the margin are refreshed in the middle of their lifetime instead.
+    """
+
+    def __init__(
+        self,
+        provider: OIDCProvider,
+        users: Iterable[tuple[str, str]],
+        max_workers: int = 16,
+        refresh_margin: float = 30,
+    ):
+        self.provider = provider
+        self.users = dict(users)
+        self.max_workers = max_workers
+        self.refresh_margin = refresh_margin
+        self.tokens: dict[str, Token] = {}
+        self.expirations: dict[str, float] = {}
+        self.refresh_at: dict[str, float] = {}
+        self._usernames = itertools.cycle(self.users)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_users(cls, provider: OIDCProvider, users: Iterable, **kwargs) -> "TokenPool":
+        """Creates pool from objects with username and password attributes, e.g. Keycloak Users"""
+        return cls(provider, ((user.username, user.password) for user in users), **kwargs)
+
+    def _mint(self, username: str) -> Token:
+        token = self.provider.get_token(username, self.users[username])
+        self._store(username, token)
+        return token
+
+    def _refresh(self, username: str):
+        try:
+            token = self.tokens[username].refresh()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Refresh tokens can expire too, in which case the user has to log in again
+            logger.debug("Unable to refresh token of %s, minting a new one: %s", username, e)
+            token = self.provider.get_token(username, self.users[username])
+        self._store(username, token)
+
+    def _store(self, username: str, token: Token):
+        now = time.time()
+        expiration = token_expiration(token)
+        margin = min(self.refresh_margin, (expiration - now) * (1 - MIN_LIFETIME_FRACTION))
+        with self._lock:
+            self.tokens[username] = token
+            self.expirations[username] = expiration
+            self.refresh_at[username] = max(expiration - margin, now + MIN_REFRESH_INTERVAL)
+
+    def start(self) -> "TokenPool":
+        """Mints tokens for all users and starts refreshing them in the background"""
+        start = time.monotonic()
+        list(self._executor.map(self._mint, self.users))
+        logger.info("Minted %s tokens in %.2fs", len(self.users), time.monotonic() - start)
+        self._thread = threading.Thread(target=self._run, name="token-pool", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                refresh_at = dict(self.refresh_at)
+            now = time.time()
+            if expiring := [name for name, at in refresh_at.items() if at <= now]:
+                try:
+                    list(self._executor.map(self._refresh, expiring))
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning("Token refresh failed, retrying: %s", e)
+                    self._stopped.wait(1)
+                continue
+            self._stopped.wait(min(refresh_at.values(), default=now + 60) - now)
+
+    def stop(self):
+        """Stops refreshing the tokens"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def get(self, username: str = None) -> Token:
+        """Returns current token of the user, or of the next user in round-robin fashion if username is not set"""
+        with self._lock:
+            if username is None:
+                username = next(self._usernames)
+            return self.tokens[username]
+
+    def __len__(self):
+        return len(self.users)
@@ -0,0 +1,101 @@
+"""Pool of resources provisioned once and shared by all xdist workers of the same test run"""
+
+import fcntl
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SharedPool:
+    """
+    Up to `size` resources (e.g. backends) shared by all workers, coordinated through a lock file in a directory
+    common to all workers. The first `size` workers to lease provision one resource each, others share the least
+    leased one. Resource is deleted by the worker which releases its last lease.
+    Resources are identified by JSON serializable data returned from the provision function.
+    """
+
+    def __init__(self, directory: Path, size: int, worker_id: str, poll_interval: float = 2):
+        self.directory = directory
+        self.size = size
+        self.worker_id = worker_id
+        self.poll_interval = poll_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._state_file = directory / "pool.json"
+        self._lock_file = directory / "pool.lock"
+        self._leased: Optional[str] = None
+
+    @contextmanager
+    def _state(self):
+        """Exclusively locks the pool state, changes to the yielded state are saved on exit"""
+        with open(self._lock_file, "a", encoding="utf-8") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                state = json.loads(self._state_file.read_text()) if self._state_file.exists() else {"entries": {}}
+                yield state
+                self._state_file.write_text(json.dumps(state))
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def lease(self, provision: Callable[[], dict]) -> dict:
+        """Leases resource from the pool, provisioning it with the provision function if needed and returns its data"""
+        while True:
+            with self._state() as state:
+                entries = state["entries"]
+                if len(entries) < self.size:
+                    key = str(max((int(k) for k in entries), default=-1) + 1)
+                    entries[key] = {"status": "provisioning", "leases": [self.worker_id], "data": None}
+                    provisioner = True
+                else:
+                    key = min(entries, key=lambda k: len(entries[k]["leases"]))
+                    entries[key]["leases"].append(self.worker_id)
+                    provisioner = False
+
+            if provisioner:
+                return self._provision(key, provision)
+            if (data := self._wait_for(key)) is not None:
+                return data
+
+    def _provision(self, key: str, provision: Callable[[], dict]) -> dict:
+        start = time.monotonic()
+        try:
+            data = provision()
+        except Exception:
+            with self._state() as state:
+                del state["entries"][key]
+            raise
+        with self._state() as state:
+            state["entries"][key].update(status="ready", data=data)
+        logger.info("Worker %s provisioned %s in %.2fs", self.worker_id, data, time.monotonic() - start)
+        self._leased = key
+        return data
+
+    def _wait_for(self, key: str):
+        """Waits until the resource is provisioned by another worker, returns None if the provisioning failed"""
+        while True:
+            with self._state() as state:
+                entry = state["entries"].get(key)
+                if entry is None or self.worker_id not in entry["leases"]:
+                    return None
+                if entry["status"] == "ready":
+                    self._leased = key
+                    return entry["data"]
+            time.sleep(self.poll_interval)
+
+    def release(self, cleanup: Callable[[dict], None]):
+        """Returns the leased resource to the pool, deleting it with the cleanup function if nobody else uses it"""
+        if self._leased is None:
+            return
+        with self._state() as state:
+            entry = state["entries"][self._leased]
+            entry["leases"].remove(self.worker_id)
+            last = not entry["leases"]
+            if last:
+                del state["entries"][self._leased]
+        self._leased = None
+        if last:
+            cleanup(entry["data"])
@@ -1,23 +1,39 @@
 """Simple client for the Prometheus metrics"""
 
 import operator
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Optional
 
 import backoff
 from apyproxy import ApyProxy
 from httpx import Client
 
+from testsuite.kubernetes import KubernetesObject
+from testsuite.kubernetes.api_client import shared_api_client
+from testsuite.kubernetes.client import KubernetesClient
 from testsuite.kubernetes.monitoring.pod_monitor import PodMonitor
 from testsuite.kubernetes.monitoring.service_monitor import ServiceMonitor
 
+# Sample line of the text exposition format: name, optional labels, value and optional timestamp in milliseconds
+_SAMPLE = re.compile(r"([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)(?:\s+(-?\d+))?\s*")
+_LABEL = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"\s*,?')
+_ESCAPES = re.compile(r"\\(.)")
 
-def _params(key: str = "", labels: dict[str, str] = None) -> dict[str, str]:
-    """Generate metrics query parameters based on key and labels"""
+
+def metric_selector(key: str = "", labels: dict[str, str] = None) -> str:
+    """Returns PromQL selector for the metric key and labels"""
     if not labels:
-        return {"query": key}
+        return key
     # pylint: disable=consider-using-f-string
-    return {"query": "%s{%s}" % (key, ",".join(f"{k}='{v}'" for k, v in labels.items()))}
+    return "%s{%s}" % (key, ",".join(f"{k}='{v}'" for k, v in labels.items()))
+
+
+def _params(key: str = "", labels: dict[str, str] = None) -> dict[str, str]:
+    """Generate metrics query parameters based on key and labels"""
+    return {"query": metric_selector(key, labels)}
 
 
 def has_label(label_name: str, label_value: str):
@@ -29,6 +45,35 @@ def has_label(label_name: str, label_value: str):
     return _has_label
 
 
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPES.sub(lambda match: "\n" if match.group(1) == "n" else match.group(1), value)
+
+
+def iter_exposition(
+    lines: Iterable[str], timestamp: Optional[float] = None, labels: dict[str, str] = None
+) -> Iterator[dict]:
+    """
+    Parses Prometheus text exposition format line by line into series in the same format as the Prometheus API returns.
+    Samples without their own timestamp get `timestamp` (now by default), `labels` are added to every series.
+    """
+    timestamp = time.time() if timestamp is None else timestamp
+    labels = labels or {}
+    for line in lines:
+        if not line or line[0] == "#" or line.isspace():
+            continue
+        match = _SAMPLE.fullmatch(line)
+        if match is None:
+            raise ValueError(f"Invalid exposition line: {line}")
+        name, raw_labels, value, sample_time = match.groups()
+        metric = {"__name__": name, **labels}
+        if raw_labels:
+            for label in _LABEL.finditer(raw_labels):
+                metric[label.group(1)] = _unescape(label.group(2))
+        yield {"metric": metric, "value": [int(sample_time) / 1000 if sample_time else timestamp, value]}
+
+
 class Metrics:
     """Interface to the returned Prometheus metrics"""
 
@@ -40,7 +85,7 @@ class Metrics:
         Given function will be used as a filter on metrics structure.
         E.g. func = lambda x: x["metric"]["evaluator_name"] == 'json'
         After the filtering, new Metrics object will be returned."""
-        return Metrics([m for m in self.metrics if func(m)])
+        return self.__class__([m for m in self.metrics if func(m)])
 
     def __len__(self):
         return len(self.metrics)
@@ -55,12 +100,32 @@ class Metrics:
         """Return list of metrics values as floats"""
         return [float(m["value"][1]) for m in self.metrics]
 
+    @classmethod
+    def from_exposition(cls, text: str, labels: dict[str, str] = None) -> "Metrics":
+        """Parses metrics from the Prometheus text exposition format, e.g. /metrics endpoint response"""
+        return cls(list(iter_exposition(text.splitlines(), labels=labels)))
+
+
+class MetricsRange(Metrics):
+    """Interface to the Prometheus range query results, every series contains multiple samples"""
+
+    @property
+    def values(self) -> list[float]:
+        """Return list of the latest values of all series as floats"""
+        return [float(m["values"][-1][1]) for m in self.metrics if m["values"]]
+
+    @property
+    def samples(self) -> list[list[tuple[float, float]]]:
+        """Return (timestamp, value) samples of every series as floats, ordered by time"""
+        return [[(float(t), float(v)) for t, v in m["values"]] for m in self.metrics]
+
 
 class Prometheus:
     """Interface to the Prometheus client"""
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, max_workers: int = 10):
         self.client = ApyProxy(str(client.base_url), session=client).api.v1
+        self.max_workers = max_workers
 
     def get_active_targets(self) -> dict:
         """Get active metric targets information"""
@@ -75,6 +140,33 @@ class Prometheus:
 
         return Metrics(response.json()["data"]["result"])
 
+    def query(self, expression: str) -> Metrics:
+        """Evaluates PromQL expression at the current time"""
+        response = self.client.query.get(params={"query": expression})
+
+        return Metrics(response.json()["data"]["result"])
+
+    def query_many(self, expressions: Iterable[str]) -> dict[str, Metrics]:
+        """Evaluates all PromQL expressions concurrently, each distinct expression only once"""
+        expressions = list(dict.fromkeys(expressions))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(expressions, executor.map(self.query, expressions)))
+
+    def query_range(
+        self, expression: str, start: datetime | float, end: Optional[datetime | float] = None, step: str = "15s"
+    ) -> MetricsRange:
+        """Evaluates PromQL expression over a range of time, end defaults to now"""
+        end = end or datetime.now(timezone.utc)
+        params = {
+            "query": expression,
+            "start": str(start.timestamp() if isinstance(start, datetime) else start),
+            "end": str(end.timestamp() if isinstance(end, datetime) else end),
+            "step": step,
+        }
+        response = self.client.query_range.get(params=params)
+
+        return MetricsRange(response.json()["data"]["result"])
+
     @backoff.on_predicate(backoff.constant, interval=10, jitter=None, max_tries=35)
     def is_reconciled(self, monitor: ServiceMonitor | PodMonitor):
         """True, if all endpoints in ServiceMonitor are active targets"""
@@ -118,16 +210,29 @@ class Prometheus:
         """Wait for a metric to reach the expected value by polling with retries.
         Treats missing metrics as value 0.
         Supports any comparison via operator module (e.g. operator.eq, operator.ge, operator.lt)."""
+        return self.wait_for_metrics({metric_selector(metric_name, labels): metric_value}, compare)
 
-        @backoff.on_predicate(backoff.constant, interval=10, jitter=None, max_tries=5)
-        def _wait():
-            metrics = self.get_metrics(key=metric_name, labels=labels)
+    def wait_for_metrics(
+        self,
+        expectations: dict[str, float],
+        compare: Callable[[float, float], bool] = operator.eq,
+        interval: float = 2,
+        timeout: float = 50,
+    ) -> bool:
+        """Wait until all PromQL expressions reach their expected values, returns as soon as all of them do.
+        All expressions are evaluated together in every round, missing metrics are treated as value 0.
+        Every expression has to return at most one series, use metric_selector() to build them."""
+
+        def _satisfied(expression: str, metrics: Metrics) -> bool:
             values = metrics.values
-            if not values:
-                return compare(0, metric_value)
             if len(values) > 1:
-                raise AssertionError(f"Metric '{metric_name}' returned {len(values)} series; use stricter labels.")
-            return compare(values[0], metric_value)
+                raise AssertionError(f"Query '{expression}' returned {len(values)} series; use stricter labels.")
+            return compare(values[0] if values else 0, expectations[expression])
+
+        @backoff.on_predicate(backoff.constant, interval=interval, jitter=None, max_time=timeout)
+        def _wait():
+            results = self.query_many(expectations)
+            return all(_satisfied(expression, metrics) for expression, metrics in results.items())
 
         return _wait()
 
@@ -142,3 +247,54 @@ class Prometheus:
                 if labels.get(label_key) in expected_values:
                     return False
         return True
+
+
+class MetricsScraper:
+    """
+    Scrapes /metrics endpoints of components directly, through the Kubernetes API server proxy or on plain URLs,
+    so the current values are available immediately instead of after the next Prometheus scrape.
+    """
+
+    def __init__(self, client: Client, max_workers: int = 10):
+        self.client = client
+        self.max_workers = max_workers
+
+    @classmethod
+    def for_cluster(cls, cluster: KubernetesClient, **kwargs) -> "MetricsScraper":
+        """Returns scraper using the shared API server connection of the cluster"""
+        return cls(shared_api_client(cluster.context).client, **kwargs)
+
+    def scrape(self, url: str, labels: dict[str, str] = None) -> Metrics:
+        """Fetches and parses metrics from the URL (relative URLs are relative to the API server)"""
+        with self.client.stream("GET", url) as response:
+            if response.is_error:
+                response.read()
+            response.raise_for_status()
+            return Metrics(list(iter_exposition(response.iter_lines(), labels=labels)))
+
+    def scrape_pod(self, pod: KubernetesObject, port: int | str, path: str = "/metrics", scheme: str = "") -> Metrics:
+        """Scrapes metrics of the pod through API server proxy, series get `pod` and `namespace` labels"""
+        target = f"{scheme}:{pod.name()}:{port}" if scheme else f"{pod.name()}:{port}"
+        return self.scrape(
+            f"/api/v1/namespaces/{pod.namespace()}/pods/{target}/proxy{path}",
+            {"pod": pod.name(), "namespace": pod.namespace()},
+        )
+
+    def scrape_service(
+        self, service: KubernetesObject, port: int | str, path: str = "/metrics", scheme: str = ""
+    ) -> Metrics:
+        """
+        Scrapes metrics of the service through API server proxy (the request ends up on one of its pods),
+        series get `service` and `namespace` labels
+        """
+        target = f"{scheme}:{service.name()}:{port}" if scheme else f"{service.name()}:{port}"
+        return self.scrape(
+            f"/api/v1/namespaces/{service.namespace()}/services/{target}/proxy{path}",
+            {"service": service.name(), "namespace": service.namespace()},
+        )
+
+    def scrape_many(self, scrapes: Iterable[Callable[[], Metrics]]) -> Metrics:
+        """Runs the scrapes (e.g. partials of scrape_pod) concurrently and merges their series"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda scrape: scrape(), scrapes))
+        return Metrics([series for metrics in results for series in metrics.metrics])
@@ -0,0 +1,90 @@
+"""Concurrent clean-up of objects created during a pytest scope"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Callable, Optional
+
+import pytest
+
+from testsuite.backend import Backend
+from testsuite.gateway import Gateway, GatewayRoute
+from testsuite.kuadrant.policy import Policy
+from testsuite.kubernetes import KubernetesObject
+from testsuite.lifecycle import LifecycleObject
+
+logger = logging.getLogger(__name__)
+
+# Objects are deleted in this order, objects of the same rank concurrently. Anything else is deleted last.
+DELETE_ORDER: list[type] = [Policy, GatewayRoute, Gateway, Backend]
+
+
+def _rank(obj: LifecycleObject) -> int:
+    """Returns position of the object in DELETE_ORDER"""
+    return next((i for i, cls in enumerate(DELETE_ORDER) if isinstance(obj, cls)), len(DELETE_ORDER))
+
+
+def _describe(obj: LifecycleObject) -> str:
+    """Returns identification of the object as kind/namespace/name for the report"""
+    if isinstance(obj, KubernetesObject):
+        kind, namespace = obj.kind(), obj.namespace(if_missing=None) or obj.context.get_project()
+    else:
+        cluster = getattr(obj, "cluster", None)
+        kind, namespace = obj.__class__.__name__, cluster.context.get_project() if cluster else None
+    name = getattr(obj, "name", None)
+    if callable(name):
+        name = name()
+    return "/".join(str(part) for part in (kind, namespace, name) if part)
+
+
+class TeardownScheduler:
+    """
+    Collects deletions of all fixtures of a pytest scope and executes them together at the end of the scope,
+    objects are scheduled instead of using `request.addfinalizer`. Deletions of the same rank (see DELETE_ORDER)
+    run concurrently, so e.g. all DNSPolicies wait for their DNSRecords together, before any Gateway is deleted.
+
+    The deletions are registered as a single finalizer of the scope node when the scheduler is created, i.e. before
+    any fixture using it is set up, so under the LIFO teardown order of pytest they run after all these fixtures
+    are torn down. Fixtures which clean up something the scheduled objects still need on deletion should therefore
+    not be set up before the scheduler fixture, unless they depend on it.
+    """
+
+    def __init__(self, node: pytest.Item | pytest.Collector, max_workers: int = 16):
+        self.max_workers = max_workers
+        self.deletions: list[tuple[int, str, Callable[[], object]]] = []
+        self.latencies: dict[str, float] = {}
+        node.addfinalizer(self.run)
+
+    def defer(self, obj: LifecycleObject, delete: Optional[Callable[[], object]] = None, rank: Optional[int] = None):
+        """Schedules deletion of the object, using its `delete` method unless other function is specified"""
+        self.deletions.append((_rank(obj) if rank is None else rank, _describe(obj), delete or obj.delete))
+        return obj
+
+    def _delete(self, name: str, delete: Callable[[], object]) -> Optional[Exception]:
+        start = time.monotonic()
+        try:
+            delete()
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Deletion of %s failed: %s", name, e)
+            return e
+        finally:
+            self.latencies[name] = time.monotonic() - start
+            logger.info("Deleted %s in %.2fs", name, self.latencies[name])
+
+    def run(self):
+        """Deletes all scheduled objects rank by rank, waits for all of them and then raises all failures"""
+        deletions = sorted(self.deletions, key=lambda d: d[0])
+        self.deletions = []
+        errors: list[Exception] = []
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _, group in groupby(deletions, key=lambda d: d[0]):
+                batch = list(group)
+                results = executor.map(lambda d: self._delete(d[1], d[2]), batch)
+                errors.extend(error for error in results if error is not None)
+        if deletions:
+            logger.info("Teardown of %s objects took %.2fs", len(deletions), time.monotonic() - start)
+        if errors:
+            raise ExceptionGroup("Teardown failed", errors)
@@ -0,0 +1,50 @@
+"""
+Micro-benchmark comparing `oc` and `http` backends of KubernetesClient on basic ConfigMap operations
+"""
+
+import logging
+import time
+
+import pytest
+
+from testsuite.kubernetes.config_map import ConfigMap
+
+pytestmark = [pytest.mark.benchmark]
+
+logger = logging.getLogger(__name__)
+
+ITERATIONS = 10
+
+
+def _patch(config_map):
+    """Modifier used for the patch operation"""
+    config_map.model.data["patched"] = "true"
+
+
+def _measure(timings, operation, func, *args):
+    """Runs the function and records its duration under the operation name"""
+    start = time.perf_counter()
+    func(*args)
+    timings.setdefault(operation, []).append(time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("backend", ["oc", "http"])
+def test_config_map_operations(request, cluster, blame, backend, record_property):
+    """Measures create/get/patch/delete of ConfigMaps with the selected backend"""
+    client = cluster.change_backend(backend)
+    timings: dict[str, list[float]] = {}
+
+    for i in range(ITERATIONS):
+        config_map = ConfigMap.create_instance(client, blame("cm"), data={"iteration": str(i)})
+        request.addfinalizer(config_map.delete)
+
+        _measure(timings, "create", config_map.commit)
+        _measure(timings, "get", config_map.refresh)
+        _measure(timings, "patch", config_map.apply, _patch)
+        assert config_map.refresh()["patched"] == "true"
+        _measure(timings, "delete", config_map.delete)
+
+    for operation, durations in timings.items():
+        average = sum(durations) / len(durations)
+        logger.info("%s backend: %s took %.1f ms on average", backend, operation, average * 1000)
+        record_property(f"{backend}_{operation}_ms", round(average * 1000, 1))
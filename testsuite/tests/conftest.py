@@ -2,6 +2,7 @@
 
 import operator
 import signal
+from pathlib import Path
 from urllib.parse import urlparse
 
 import pytest
@@ -11,16 +12,21 @@ from dynaconf import ValidationError
 from keycloak import KeycloakAuthenticationError
 
 from testsuite.capabilities import has_kuadrant, kuadrant_version
-from testsuite.certificates import CFSSLClient
+from testsuite.certificates import CFSSLClient, CertificateCache, CertificateSigner, CryptographySigner
 from testsuite.config import settings
 from testsuite.gateway import Exposer, CustomReference
-from testsuite.httpx import KuadrantClient
+from testsuite.httpx import KuadrantClient, close_shared_transports
+from testsuite.kubernetes.informer import stop_informers
 from testsuite.mockserver import Mockserver
 from testsuite.oidc import OIDCProvider
 from testsuite.oidc.auth0 import Auth0Provider
-from testsuite.prometheus import Prometheus
+from testsuite.oidc.local import LocalOIDCProvider
+from testsuite.pool import SharedPool
+from testsuite.prometheus import MetricsScraper, Prometheus
+from testsuite.teardown import TeardownScheduler
 from testsuite.oidc.keycloak import Keycloak
 from testsuite.tracing.jaeger import JaegerClient
+from testsuite.tracing.local import LocalTracingClient
 from testsuite.tracing.tempo import RemoteTempoClient
 from testsuite.utils import randomize, _whoami
 
@@ -31,6 +37,24 @@ def pytest_addoption(parser):
         "--enforce", action="store_true", default=False, help="Fails tests instead of skip, if capabilities are missing"
     )
     parser.addoption("--standalone", action="store_true", default=False, help="Runs testsuite in standalone mode")
+    parser.addoption(
+        "--pool-size",
+        type=int,
+        default=0,
+        help="Number of backends shared by all xdist workers, 0 means every worker creates its own",
+    )
+    parser.addoption(
+        "--benchmark-results",
+        default="benchmark-results.json",
+        help="File to which the benchmark results are written",
+    )
+    parser.addoption("--benchmark-baseline", default=None, help="Results of a previous benchmark run to compare with")
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.2,
+        help="Relative difference from the baseline which is still not considered a regression",
+    )
 
 
 def pytest_runtest_setup(item):
@@ -148,6 +172,12 @@ def pytest_report_header(config):
     return header
 
 
+def pytest_sessionfinish(session, exitstatus):  # pylint: disable=unused-argument
+    """Stops watches of the shared informers and closes connection pools shared by the clients"""
+    stop_informers()
+    close_shared_transports()
+
+
 @pytest.fixture(scope="session")
 def skip_or_fail(request):
     """Skips or fails tests depending on --enforce option"""
@@ -223,6 +253,12 @@ def testconfig():
     return settings
 
 
+@pytest.fixture(scope="session")
+def metrics_scraper(cluster):
+    """Scrapes metrics directly from the components, without waiting for Prometheus"""
+    return MetricsScraper.for_cluster(cluster)
+
+
 @pytest.fixture(scope="session")
 def prometheus(cluster, testconfig, skip_or_fail):
     """Prometheus metrics client, auto-discovered via DefaultValueValidator or configured explicitly"""
@@ -279,9 +315,31 @@ def auth0(testconfig):
 
 
 @pytest.fixture(scope="session")
-def cfssl(testconfig, skip_or_fail):
-    """CFSSL client library"""
-    client = CFSSLClient(binary=testconfig["cfssl"])
+def local_oidc(request, testconfig, skip_or_fail):
+    """OIDC provider signing tokens in-process, usable instead of Keycloak for high-volume authenticated load"""
+    cnf = testconfig["local_oidc"]
+    provider = LocalOIDCProvider(cnf["bind"], cnf["port"], cnf.get("issuer"))
+    if not provider.reachable_from_cluster:
+        skip_or_fail(
+            f"Local OIDC provider bound to {cnf['bind']} is not reachable from the cluster, "
+            "set local_oidc.issuer to the URL under which it is reachable (or local_oidc.bind to such address)"
+        )
+    request.addfinalizer(provider.delete)
+    provider.commit()
+    return provider
+
+
+@pytest.fixture(scope="session")
+def cfssl(testconfig, skip_or_fail) -> CertificateSigner:
+    """Certificate signer, either in-process or CFSSL binary depending on the configuration"""
+    config = testconfig["certificates"]
+    cache = None
+    if config.get("cache_dir"):
+        cache = CertificateCache(Path(config["cache_dir"]).expanduser(), config.get("cache_authorities", False))
+    if config["signer"] == "cryptography":
+        return CryptographySigner(config["key_algorithm"], config["key_size"], cache)
+
+    client = CFSSLClient(binary=testconfig["cfssl"], cache=cache)
     if not client.exists:
         skip_or_fail("Skipping CFSSL tests as CFSSL binary path is not properly configured")
     return client
@@ -307,6 +365,14 @@ def tracing(testconfig, skip_or_fail):
     except (KeyError, ValidationError) as exc:
         skip_or_fail(f"Tracing configuration item is missing: {exc}")
 
+    if testconfig["tracing"]["backend"] == "local":
+        cnf = testconfig["tracing"]["local"]
+        local = LocalTracingClient(cnf["bind"], cnf["grpc_port"], cnf["http_port"], cnf.get("host"))
+        local.commit()
+        yield local
+        local.delete()
+        return
+
     cls = JaegerClient if testconfig["tracing"]["backend"] == "jaeger" else RemoteTempoClient
     # Authorino needs to have verify disabled because it doesn't trust local service URLs
     with KuadrantClient(verify=False) as client:
@@ -368,6 +434,34 @@ def module_label(label):
     return randomize(label)
 
 
+@pytest.fixture(scope="session")
+def session_teardown(request):
+    """Deletes objects scheduled by session scoped fixtures concurrently at the end of the session"""
+    return TeardownScheduler(request.node)
+
+
+@pytest.fixture(scope="module")
+def module_teardown(request):
+    """Deletes objects scheduled by module scoped fixtures concurrently at the end of the module"""
+    return TeardownScheduler(request.node)
+
+
+@pytest.fixture(scope="session")
+def shared_pool(request, tmp_path_factory, worker_id):
+    """
+    Returns function creating named SharedPool common to all xdist workers,
+    or None if the pool is disabled or the tests do not run in parallel
+    """
+    size = request.config.getoption("--pool-size")
+    if size <= 0 or worker_id == "master":
+        return None
+
+    def _pool(name: str) -> SharedPool:
+        return SharedPool(tmp_path_factory.getbasetemp().parent / "pools" / name, size, worker_id)
+
+    return _pool
+
+
 @pytest.fixture(scope="session")
 def cluster(testconfig):
     """Kubernetes client for the primary namespace"""
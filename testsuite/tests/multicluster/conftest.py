@@ -69,7 +69,7 @@ def wildcard_domain(base_domain):
 
 
 @pytest.fixture(scope="session")
-def backends(request, cluster, cluster2, blame, label):
+def backends(session_teardown, cluster, cluster2, blame, label):
     """Deploys MockServer backend to each Kubernetes cluster"""
     backends = []
     name = blame("mockserver")
@@ -83,7 +83,7 @@ def backends(request, cluster, cluster2, blame, label):
         )
         config.commit()
         mockserver = MockserverBackend(cluster_client, name, label, service_type="ClusterIP", config=config)
-        request.addfinalizer(mockserver.delete)
+        session_teardown.defer(mockserver)
         mockserver.commit()
         mockserver.wait_for_ready()
         backends.append(mockserver)
@@ -91,7 +91,7 @@ def backends(request, cluster, cluster2, blame, label):
 
 
 @pytest.fixture(scope="module")
-def routes(request, gateway, gateway2, blame, hostname, backends, module_label) -> list[HTTPRoute]:
+def routes(module_teardown, gateway, gateway2, blame, hostname, backends, module_label) -> list[HTTPRoute]:
     """Deploys HttpRoute for each gateway"""
     routes = []
     name = blame("route")
@@ -99,7 +99,7 @@ def routes(request, gateway, gateway2, blame, hostname, backends, module_label)
         route = HTTPRoute.create_instance(gateway_.cluster, name, gateway_, {"app": module_label})
         route.add_hostname(hostname.hostname)
         route.add_backend(backends[i])
-        request.addfinalizer(route.delete)
+        module_teardown.defer(route)
         route.commit()
         routes.append(route)
     return routes
@@ -172,7 +172,7 @@ def client(hostname, gateway, gateway2):  # pylint: disable=unused-argument
 
 @pytest.fixture(scope="module", autouse=True)
 def commit(
-    request,
+    module_teardown,
     routes,
     gateway,
     gateway2,
@@ -184,7 +184,7 @@ def commit(
     """Commits gateways and all policies before tests"""
     components = [gateway, gateway2, dns_policy, dns_policy2, tls_policy, tls_policy2]
     for component in components:
-        request.addfinalizer(component.delete)
+        module_teardown.defer(component)
         component.commit()
     for component in components:
         component.wait_for_ready()
@@ -5,11 +5,10 @@ The gateway trusts a root CA at L4 (all certs pass TLS), while Authorino selects
 trusted CA secrets by label, providing fine-grained L7 trust control.
 """
 
-import time
-
 import pytest
 
 from testsuite.certificates import CertInfo
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.utils import cert_builder
 from testsuite.kubernetes import Selector
 from testsuite.kuadrant.policy.authorization import X509Source
@@ -92,13 +91,17 @@ def authorization(authorization, certificate_selector_labels):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, tls_policy, authorization, ca_secret_team_a, ca_secret_team_b):  # pylint: disable=unused-argument
-    """Commits TLSPolicy and AuthPolicy with delay for WasmPlugin sync"""
+def commit(
+    request, tls_policy, authorization, ca_secret_team_a, ca_secret_team_b, hostname, server_ca, cert_team_a
+):  # pylint: disable=unused-argument
+    """Commits TLSPolicy and AuthPolicy and waits until the trusted certificate is accepted, i.e. WasmPlugin synced"""
     for component in [tls_policy, authorization]:
         request.addfinalizer(component.delete)
         component.commit()
         component.wait_for_ready()
-    time.sleep(15)  # Kind workaround before https://github.com/envoyproxy/envoy/pull/43928 is released in istio 1.30
+    # Kind workaround before https://github.com/envoyproxy/envoy/pull/43928 is released in istio 1.30
+    with hostname.client(verify=server_ca, cert=cert_team_a) as client:
+        ConvergenceProbe(client).status(200, "/get")
 
 
 def test_multi_ca_trust(hostname, server_ca, cert_team_a, cert_team_b, cert_untrusted):
@@ -0,0 +1 @@
+"""Benchmarks of the data plane overhead of Kuadrant policies"""
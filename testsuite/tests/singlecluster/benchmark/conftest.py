@@ -0,0 +1,62 @@
+"""
+Conftest for policy overhead benchmarks.
+Every module measures the same route with a different set of policies, results of all of them are saved
+into a single JSON file (`--benchmark-results`) and compared with a previous one (`--benchmark-baseline`).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from testsuite.benchmark import BenchmarkReport
+from testsuite.httpx.load import run_load
+
+# Requests per second sent by the open-loop load generator
+RATE = 100
+DURATION = 30
+# Short load before the measurement, so connections, caches and token verification keys are ready
+WARMUP_DURATION = 5
+
+
+@pytest.fixture(scope="session")
+def benchmark_report(request):
+    """Report shared by all benchmarks of the session, saved at the end of the session"""
+    baseline = request.config.getoption("--benchmark-baseline")
+    report = BenchmarkReport.from_baseline_file(
+        Path(baseline) if baseline else None, request.config.getoption("--benchmark-tolerance")
+    )
+    request.addfinalizer(lambda: report.save(Path(request.config.getoption("--benchmark-results"))))
+    return report
+
+
+@pytest.fixture(scope="module")
+def api_key(create_api_key, module_label):
+    """Creates API key Secret"""
+    return create_api_key("api-key", module_label, "api_key_value")
+
+
+@pytest.fixture(scope="module")
+def auth():
+    """Authentication used for all requests, none by default"""
+    return None
+
+
+@pytest.fixture
+def measure_load(hostname, auth, benchmark_report, record_property):
+    """
+    Returns function which drives the load against the route and records its results under the name.
+    Returns tuple of LoadResult and regressions against the baseline.
+    """
+
+    def _measure(name: str):
+        kwargs = {"auth": auth} if auth is not None else {}
+        run_load(hostname, RATE, WARMUP_DURATION, **kwargs)
+        result = run_load(hostname, RATE, DURATION, **kwargs)
+        summary = result.summary()
+        regressions = benchmark_report.record(name, summary)
+        for key, value in summary["latency_ms"].items():
+            record_property(f"{name}_{key}_ms", value)
+        record_property(f"{name}_throughput", summary["throughput"])
+        return result, regressions
+
+    return _measure
@@ -0,0 +1,35 @@
+"""Benchmark of the route with AuthPolicy (API key identity) and RateLimitPolicy combined"""
+
+import pytest
+
+from testsuite.httpx.auth import HeaderApiKeyAuth
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def authorization(authorization, api_key):
+    """AuthPolicy with API key identity"""
+    authorization.identity.add_api_key("api_key", selector=api_key.selector)
+    return authorization
+
+
+@pytest.fixture(scope="module")
+def rate_limit(rate_limit):
+    """RateLimitPolicy with limit much higher than the number of requests sent"""
+    rate_limit.add_limit("high", [Limit(1_000_000, "60s")])
+    return rate_limit
+
+
+@pytest.fixture(scope="module")
+def auth(api_key):
+    """Valid API Key Auth"""
+    return HeaderApiKeyAuth(api_key)
+
+
+def test_all(measure_load):
+    """Measures latency and throughput of the route with both authentication and rate limiting"""
+    result, regressions = measure_load("all")
+    assert set(result.status_codes) == {200}
+    assert not regressions
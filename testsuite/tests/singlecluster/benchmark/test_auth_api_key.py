@@ -0,0 +1,33 @@
+"""Benchmark of the route protected by AuthPolicy with API key identity"""
+
+import pytest
+
+from testsuite.httpx.auth import HeaderApiKeyAuth
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def authorization(authorization, api_key):
+    """AuthPolicy with API key identity"""
+    authorization.identity.add_api_key("api_key", selector=api_key.selector)
+    return authorization
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """No RateLimitPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def auth(api_key):
+    """Valid API Key Auth"""
+    return HeaderApiKeyAuth(api_key)
+
+
+def test_auth_api_key(measure_load):
+    """Measures latency and throughput of the route with API key authentication"""
+    result, regressions = measure_load("auth_api_key")
+    assert set(result.status_codes) == {200}
+    assert not regressions
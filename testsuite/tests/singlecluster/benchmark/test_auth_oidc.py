@@ -0,0 +1,33 @@
+"""Benchmark of the route protected by AuthPolicy with OIDC identity"""
+
+import pytest
+
+from testsuite.httpx.auth import HttpxOidcClientAuth
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def authorization(authorization, oidc_provider):
+    """AuthPolicy with OIDC identity"""
+    authorization.identity.add_oidc("default", oidc_provider.well_known["issuer"])
+    return authorization
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """No RateLimitPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def auth(oidc_provider):
+    """Valid OIDC token, requested once for the whole load"""
+    return HttpxOidcClientAuth(oidc_provider.get_token, "authorization")
+
+
+def test_auth_oidc(measure_load):
+    """Measures latency and throughput of the route with OIDC authentication"""
+    result, regressions = measure_load("auth_oidc")
+    assert set(result.status_codes) == {200}
+    assert not regressions
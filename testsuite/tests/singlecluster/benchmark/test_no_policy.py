@@ -0,0 +1,24 @@
+"""Benchmark of the route without any policy, baseline for the policy overhead"""
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def authorization():
+    """No AuthPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """No RateLimitPolicy"""
+    return None
+
+
+def test_no_policy(measure_load):
+    """Measures latency and throughput of the route without any policy"""
+    result, regressions = measure_load("no_policy")
+    assert set(result.status_codes) == {200}
+    assert not regressions
@@ -0,0 +1,27 @@
+"""Benchmark of the route with RateLimitPolicy, which is never reached"""
+
+import pytest
+
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.kuadrant_only]
+
+
+@pytest.fixture(scope="module")
+def authorization():
+    """No AuthPolicy"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def rate_limit(rate_limit):
+    """RateLimitPolicy with limit much higher than the number of requests sent"""
+    rate_limit.add_limit("high", [Limit(1_000_000, "60s")])
+    return rate_limit
+
+
+def test_rate_limit(measure_load):
+    """Measures latency and throughput of the route with rate limiting"""
+    result, regressions = measure_load("rate_limit")
+    assert set(result.status_codes) == {200}
+    assert not regressions
@@ -1,6 +1,9 @@
 """Configure all the components through Kuadrant,
 all methods are placeholders for now since we do not work with Kuadrant"""
 
+import hashlib
+import json
+import logging
 from importlib import resources
 
 import pytest
@@ -12,12 +15,15 @@ from testsuite.gateway.envoy import Envoy
 from testsuite.gateway.envoy.route import EnvoyVirtualRoute
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
 from testsuite.gateway.gateway_api.route import HTTPRoute
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kuadrant import KuadrantCR
 from testsuite.kuadrant.policy.authorization.auth_policy import AuthPolicy
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy
 from testsuite.kubernetes.api_key import APIKey
 from testsuite.kubernetes.client import KubernetesClient
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.fixture(scope="session")
 def second_namespace(testconfig, skip_or_fail) -> KubernetesClient:
@@ -37,6 +43,29 @@ def authorization_name(blame):
     return blame("authz")
 
 
+def _denied_probe(policy: AuthPolicy, route, hostname, timeout: float = 30):
+    """
+    Returns probe which waits until a request without credentials is denied on the route.
+    It is best-effort, the probe is skipped if the policy lets some requests through without credentials or
+    the route does not match on a plain path, and it only logs a warning if the gateway does not deny in time,
+    as the policy might be intentionally overridden or the gateway might require a client certificate.
+    """
+
+    def _probe():
+        if not isinstance(route, HTTPRoute) or not policy.requires_credentials or route.probe_path is None:
+            return
+        with hostname.client() as client:
+            result = client.request_once("GET", route.probe_path)
+            if result.has_cert_required_error() or result.has_unknown_ca_error():
+                return
+            try:
+                ConvergenceProbe(client, timeout=timeout).denied(route.probe_path)
+            except AssertionError as e:
+                logger.warning("%s/%s: %s", policy.kind(), policy.name(), e)
+
+    return _probe
+
+
 @pytest.fixture(scope="module")
 def authorization(request, kuadrant, route, gateway, blame, cluster, label):  # pylint: disable=unused-argument
     """Authorization object (In case of Kuadrant AuthPolicy)"""
@@ -63,13 +92,20 @@ def rate_limit(kuadrant, cluster, blame, request, module_label, route, gateway):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, authorization, rate_limit):
-    """Commits all important stuff before tests"""
-    for component in [authorization, rate_limit]:
-        if component is not None:
-            request.addfinalizer(component.delete)
-            component.commit()
-            component.wait_for_ready()
+def commit(module_teardown, cluster, authorization, rate_limit, route, hostname):
+    """
+    Commits all important stuff before tests.
+    AuthPolicy without its own probe waits until a request without credentials is denied, see _denied_probe.
+    """
+    components = [component for component in [authorization, rate_limit] if component is not None]
+    for component in components:
+        module_teardown.defer(component)
+        if isinstance(component, AuthPolicy) and component.probe is None:
+            component.probe = _denied_probe(component, route, hostname)
+    if components:
+        cluster.apply_many(components)
+    for component in components:
+        component.wait_for_ready()
 
 
 @pytest.fixture(scope="session")
@@ -99,20 +135,56 @@ def mockserver_config(cluster, blame, label):
 
 
 @pytest.fixture(scope="session")
-def backend(request, cluster, blame, label, mockserver_config):
-    """Deploys MockServer backend"""
-    mockserver = MockserverBackend(
-        cluster, blame("mockserver"), label, service_type="ClusterIP", config=mockserver_config
-    )
-    request.addfinalizer(mockserver.delete)
-    mockserver.commit()
-    mockserver.wait_for_ready()
+def backend(session_teardown, shared_pool, cluster, blame, label, mockserver_config):
+    """Deploys MockServer backend, with --pool-size it is shared by all xdist workers using the same configuration"""
+    if shared_pool is None:
+        mockserver = MockserverBackend(
+            cluster, blame("mockserver"), label, service_type="ClusterIP", config=mockserver_config
+        )
+        session_teardown.defer(mockserver)
+        mockserver.commit()
+        mockserver.wait_for_ready()
+        return mockserver
+
+    def _provision():
+        mockserver = MockserverBackend(
+            cluster, blame("mockserver"), label, service_type="ClusterIP", config=mockserver_config
+        )
+        try:
+            mockserver.commit()
+            mockserver.wait_for_ready()
+        except Exception:
+            mockserver.delete()
+            raise
+        return {"name": mockserver.name, "config": mockserver_config.config_map.name()}
+
+    def _cleanup(data):
+        shared = MockserverBackend(cluster, data["name"], label)
+        shared.deployment = cluster.get_deployment(data["name"])
+        shared.service = cluster.get_service(data["name"])
+        shared.delete()
+        cluster.do_action("delete", f"configmap/{data['config']}", "--ignore-not-found")
+
+    digest = hashlib.sha256(json.dumps(mockserver_config.data, sort_keys=True).encode()).hexdigest()[:8]
+    pool = shared_pool(f"backend-{cluster.project}-{digest}")
+    data = pool.lease(_provision)
+    if data["config"] != mockserver_config.config_map.name():
+        # Backend provisioned by another worker uses its own configuration
+        session_teardown.defer(mockserver_config, delete=mockserver_config.delete)
+
+    mockserver = MockserverBackend(cluster, data["name"], label, service_type="ClusterIP")
+    mockserver.deployment = cluster.get_deployment(data["name"])
+    mockserver.service = cluster.get_service(data["name"])
+    session_teardown.defer(mockserver, delete=lambda: pool.release(_cleanup))
     return mockserver
 
 
 @pytest.fixture(scope="session")
-def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
-    """Deploys Gateway that wires up the Backend behind the reverse-proxy and Authorino instance"""
+def gateway(request, session_teardown, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
+    """
+    Deploys Gateway that wires up the Backend behind the reverse-proxy and Authorino instance.
+    Gateway is never shared by xdist workers (not even with --pool-size), as tests attach policies to it.
+    """
     if kuadrant:
         gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": label})
         gw.add_listener(GatewayListener(hostname=wildcard_domain))
@@ -125,7 +197,7 @@ def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domai
             testconfig["service_protection"]["envoy"]["image"],
             labels={"app": label},
         )
-    request.addfinalizer(gw.delete)
+    session_teardown.defer(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -145,7 +217,7 @@ def hostname(gateway, exposer, domain_name) -> Hostname:
 
 
 @pytest.fixture(scope="module")
-def route(request, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
+def route(module_teardown, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
     """Route object"""
     if kuadrant:
         route = HTTPRoute.create_instance(gateway.cluster, blame("route"), gateway, {"app": module_label})
@@ -153,7 +225,7 @@ def route(request, kuadrant, gateway, blame, hostname, backend, module_label) ->
         route = EnvoyVirtualRoute.create_instance(gateway.cluster, blame("route"), gateway)
     route.add_hostname(hostname.hostname)
     route.add_backend(backend)
-    request.addfinalizer(route.delete)
+    module_teardown.defer(route)
     route.commit()
     return route
 
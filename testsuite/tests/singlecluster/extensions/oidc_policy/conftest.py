@@ -10,6 +10,7 @@ import pytest
 
 from testsuite.gateway import Gateway, GatewayListener
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kuadrant.extensions.oidc_policy import OIDCPolicy
 
 
@@ -57,8 +58,9 @@ def oidc_policy(cluster, blame, oidc_policy_provider_config, gateway):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, oidc_policy):
-    """Commit and wait for OIDC policy to be ready."""
+def commit(request, oidc_policy, client):
+    """Commit and wait for OIDC policy to be ready, i.e. until unauthenticated request is redirected."""
     request.addfinalizer(oidc_policy.delete)
+    oidc_policy.probe = lambda: ConvergenceProbe(client).status(302)
     oidc_policy.commit()
     oidc_policy.wait_for_ready()
@@ -2,14 +2,13 @@
 Test for changing targetRef field in TLSPolicy
 """
 
-import time
-
 import pytest
 
 from testsuite.gateway import TLSGatewayListener
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
 from testsuite.gateway.gateway_api.hostname import StaticHostname
 from testsuite.httpx import KuadrantClient
+from testsuite.httpx.probe import ConvergenceProbe
 
 pytestmark = [pytest.mark.dnspolicy, pytest.mark.tlspolicy]
 
@@ -85,7 +84,6 @@ def test_update_tls_policy_target_ref(
     # Delete TLS secret to verify gateway1 no longer serves valid TLS traffic
     tls_secret = gateway.get_tls_secret(hostname.hostname)
     tls_secret.delete()
-    time.sleep(10)  # Allow extra time for secret deletion to propagate
 
-    response = KuadrantClient(base_url=f"https://{hostname.hostname}", verify=False).get("/get")
-    assert response.has_tls_error()
+    with KuadrantClient(base_url=f"https://{hostname.hostname}", verify=False) as client:
+        ConvergenceProbe(client).until_result(lambda result: result.has_tls_error(), "/get", "TLS error on gateway 1")
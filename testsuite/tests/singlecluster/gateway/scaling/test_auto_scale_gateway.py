@@ -2,11 +2,10 @@
 This module contains tests for auto-scaling the gateway deployment with an HPA watching the cpu usage
 """
 
-import time
-
 import pytest
 
 
+from testsuite.httpx.burst import WindowScheduler
 from testsuite.kubernetes.horizontal_pod_autoscaler import HorizontalPodAutoscaler
 from testsuite.tests.singlecluster.gateway.scaling.conftest import LIMIT
 
@@ -65,12 +64,11 @@ def test_auto_scale_gateway(
     assert auth_resp is not None
     assert auth_resp.status_code == 200
 
-    responses = client.get_many("/anything/limit", LIMIT.limit, auth=auth)
+    scheduler = WindowScheduler(client, LIMIT)
+    responses = scheduler.burst("/anything/limit", auth=auth)
     responses.assert_all(status_code=200)
 
-    assert client.get("/anything/limit", auth=auth).status_code == 429
-
-    time.sleep(5)  # sleep in order to reset the rate limit policy time limit.
+    assert scheduler.get("/anything/limit", auth=auth).status_code == 429
 
     # Write the metric to the custom metrics apiserver and trigger the scaling
     assert (
@@ -89,7 +87,8 @@ def test_auto_scale_gateway(
     assert auth_resp is not None
     assert auth_resp.status_code == 200
 
-    responses = client.get_many("/anything/limit", LIMIT.limit, auth=auth)
+    # Waits only for the rest of the window, if scaling took less time than that
+    responses = scheduler.burst("/anything/limit", auth=auth)
     responses.assert_all(status_code=200)
 
-    assert client.get("/anything/limit", auth=auth).status_code == 429
+    assert scheduler.get("/anything/limit", auth=auth).status_code == 429
@@ -1,11 +1,10 @@
 """Tests that AuthPolicy and RateLimitPolicy are enforced on a GRPCRoute"""
 
-import time
-
 import pytest
 from grpc import StatusCode
 
 from testsuite.httpx.auth import HttpxOidcClientAuth
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kuadrant.policy.rate_limit import Limit
 
 pytestmark = [pytest.mark.authorino, pytest.mark.limitador, pytest.mark.kuadrant_only]
@@ -49,5 +48,6 @@ def test_grpcroute(client, auth):
     responses.assert_all(status_code=StatusCode.OK)
     assert client.call("/HeadersUnary", auth=auth).status_code == StatusCode.UNAVAILABLE
 
-    time.sleep(5 + 1)
-    assert client.call("/HeadersUnary", auth=auth).status_code == StatusCode.OK
+    ConvergenceProbe(timeout=LIMIT.window_seconds + 1).until(
+        lambda: client.call("/HeadersUnary", auth=auth).status_code == StatusCode.OK, "OK after the limit window resets"
+    )
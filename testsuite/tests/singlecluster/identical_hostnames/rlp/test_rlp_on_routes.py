@@ -5,9 +5,9 @@ https://github.com/Kuadrant/kuadrant-operator/blob/3b8e313d552090c52d8aadca95f69
 This test validates that it has been properly fixed, i.e. both RateLimitPolicies (RLPs) are successfully enforced.
 """
 
-from time import sleep
 import pytest
 
+from testsuite.httpx.probe import ConvergenceProbe
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy, Limit
 
 pytestmark = [pytest.mark.limitador]
@@ -67,10 +67,8 @@ def test_identical_hostnames_rlp_on_routes(client, rate_limit2):
     rate_limit2.delete()
 
     # Access via 'route' should now be still limited via '1rp10s' RateLimitPolicy
-    # Wait for 15s to make sure the counter is reset
-    sleep(15)
-    response = client.get("/anything/route1/get")
-    assert response.status_code == 200
+    # Wait until the counter is reset, the first successful request is the one counted in the new window
+    ConvergenceProbe(client, timeout=15).status(200, "/anything/route1/get")
     response = client.get("/anything/route1/get")
     assert response.status_code == 429
 
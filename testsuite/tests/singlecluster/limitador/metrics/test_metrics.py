@@ -6,6 +6,9 @@ from testsuite.kuadrant.policy.rate_limit import Limit
 
 pytestmark = [pytest.mark.observability, pytest.mark.limitador]
 
+# Default port of the Limitador HTTP endpoint, which also serves metrics
+LIMITADOR_HTTP_PORT = 8080
+
 
 @pytest.fixture(scope="module")
 def rate_limit(rate_limit):
@@ -14,40 +17,29 @@ def rate_limit(rate_limit):
     return rate_limit
 
 
-@pytest.fixture(scope="module", autouse=True)
-def scrape_metrics_created_by_requests(prometheus, pod_monitor, client):
+@pytest.fixture(scope="module")
+def metrics(metrics_scraper, limitador, client):
     """
     Creates 5 requests, from which 3 are authorized and 2 are rate limited.
-    Waits until Prometheus scrapes '/metrics' endpoint.
+    Scrapes '/metrics' endpoint of the Limitador pod directly, so there is no need to wait for Prometheus.
     """
     client.get_many("/get", 5)
-    prometheus.wait_for_scrape(pod_monitor, "/metrics")
+    return metrics_scraper.scrape_pod(limitador.pod, LIMITADOR_HTTP_PORT)
 
 
 @pytest.mark.parametrize("metric, expected_value", [("authorized_calls", 3), ("limited_calls", 2)])
-def test_calls_metric(prometheus, limitador, route, metric, expected_value, pod_monitor):
+def test_calls_metric(metrics, route, metric, expected_value):
     """Tests that `authorized_calls` and `limited_calls` are emitted and correctly incremented"""
-    metrics = prometheus.get_metrics(
-        labels={
-            "pod": limitador.pod.name(),
-            "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
-        }
+    calls = metrics.filter(
+        lambda x: x["metric"]["__name__"] == metric
+        and x["metric"].get("limitador_namespace") == f"{route.namespace()}/{route.name()}"
     )
-
-    authorized = metrics.filter(lambda x: x["metric"]["__name__"] == metric)
-    assert len(authorized.metrics) == 1
-    assert authorized.values[0] == expected_value
+    assert len(calls.metrics) == 1
+    assert calls.values[0] == expected_value
 
 
-def test_limitador_status_metric(prometheus, limitador, pod_monitor):
+def test_limitador_status_metric(metrics):
     """Tests that `limitador_up` metric is emitted"""
-    # We have to use `PodMonitor` here. If `ServiceMonitor` is used, `job` label contains limitador service name,
-    # therefore it is not possible to test, if the metric was created by this test (by this monitor)
-    metrics = prometheus.get_metrics(
-        labels={"pod": limitador.pod.name(), "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}"}
-    )
-
     limitador_up = metrics.filter(lambda x: x["metric"]["__name__"] == "limitador_up")
     assert len(limitador_up.metrics) == 1
     assert limitador_up.values[0] == 1
@@ -9,6 +9,8 @@ from testsuite.kuadrant.policy import CelExpression, CelPredicate
 from testsuite.kuadrant.policy.authorization import JsonResponse, ValueFrom
 from testsuite.kuadrant.policy.rate_limit import Limit
 from testsuite.kuadrant.policy.token_rate_limit import TokenRateLimitPolicy
+from testsuite.kubernetes.monitoring import MetricsEndpoint
+from testsuite.kubernetes.monitoring.pod_monitor import PodMonitor
 
 FREE_USER_LIMIT = Limit(limit=15, window="30s")
 PAID_USER_LIMIT = Limit(limit=30, window="60s")
@@ -17,6 +19,22 @@ USERS = ("free", "paid")
 MODEL_NAME = "meta-llama/Llama-3.1-8B-Instruct"
 
 
+@pytest.fixture(scope="module")
+def pod_monitor(system_project, request, blame, limitador):
+    """Creates Pod Monitor object to watch over '/metrics' endpoint of limitador pod"""
+    endpoints = [MetricsEndpoint("/metrics", "http")]
+    monitor = PodMonitor.create_instance(system_project, blame("pd"), endpoints, match_labels={"app": limitador.name()})
+    request.addfinalizer(monitor.delete)
+    monitor.commit()
+    return monitor
+
+
+@pytest.fixture(scope="module", autouse=True)
+def wait_for_active_targets(prometheus, pod_monitor):
+    """Waits for all endpoints in Pod Monitor to become active targets"""
+    assert prometheus.is_reconciled(pod_monitor)
+
+
 @pytest.fixture(scope="module")
 def backend(request, cluster, blame, label, testconfig):
     """Deploys LlmSim backend"""
@@ -4,6 +4,7 @@ Tests that a single limit is enforced as expected over one iteration
 
 import pytest
 
+from testsuite.httpx.burst import WindowScheduler
 from testsuite.kuadrant.policy.rate_limit import Limit
 
 pytestmark = [pytest.mark.limitador]
@@ -33,6 +34,7 @@ def rate_limit(rate_limit, limit):
 @pytest.mark.flaky(reruns=3, reruns_delay=20)
 def test_limit(client, limit):
     """Tests that simple limit is applied successfully"""
-    responses = client.get_many("/get", limit.limit)
+    scheduler = WindowScheduler(client, limit)
+    responses = scheduler.burst("/get")
     responses.assert_all(status_code=200)
-    assert client.get("/get").status_code == 429
+    assert scheduler.get("/get").status_code == 429
@@ -5,10 +5,10 @@ TRLP User Guide:
 https://docs.kuadrant.io/dev/kuadrant-operator/doc/user-guides/tokenratelimitpolicy/authenticated-token-ratelimiting-tutorial/
 """
 
-from time import sleep
-
 import pytest
 
+from testsuite.httpx.probe import ConvergenceProbe
+
 from .conftest import FREE_USER_LIMIT, PAID_USER_LIMIT
 
 pytestmark = [pytest.mark.limitador, pytest.mark.authorino, pytest.mark.kuadrant_only]
@@ -66,10 +66,10 @@ def test_trlp_limit_and_reset_free_user(client, free_user_auth):
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{FREE_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
-    # Assert quota resets after wait period
-    sleep(30)
-    response = client.post("/v1/chat/completions", auth=free_user_auth, json={**basic_request})
-    assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
+    # Waits until the quota resets, the first successful request is counted in the new window
+    ConvergenceProbe(client, timeout=FREE_USER_LIMIT.window_seconds + 5).status(
+        200, "/v1/chat/completions", method="POST", auth=free_user_auth, json={**basic_request}
+    )
 
 
 @pytest.mark.flaky(reruns=3, reruns_delay=65)
@@ -101,6 +101,7 @@ def test_trlp_limit_and_reset_paid_user(client, paid_user_auth):
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{PAID_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
-    sleep(60)
-    response = client.post("/v1/chat/completions", auth=paid_user_auth, json={**basic_request})
-    assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
+    # Waits until the quota resets, the first successful request is counted in the new window
+    ConvergenceProbe(client, timeout=PAID_USER_LIMIT.window_seconds + 5).status(
+        200, "/v1/chat/completions", method="POST", auth=paid_user_auth, json={**basic_request}
+    )
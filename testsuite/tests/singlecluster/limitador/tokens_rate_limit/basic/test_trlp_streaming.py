@@ -3,10 +3,11 @@ Test TokenRateLimitPolicy functionality with streaming enabled
 """
 
 import json
-from time import sleep
 
 import pytest
 
+from testsuite.httpx.probe import ConvergenceProbe
+
 from .conftest import FREE_USER_LIMIT
 
 pytestmark = [pytest.mark.limitador, pytest.mark.authorino, pytest.mark.kuadrant_only]
@@ -62,7 +63,7 @@ def test_trlp_streaming_limit_and_reset(client, free_user_auth):
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{FREE_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
-    # Assert quota resets after wait period
-    sleep(30)
-    response = client.post("/v1/chat/completions", auth=free_user_auth, json={**streaming_request})
-    assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
+    # Waits until the quota resets, the first successful request is counted in the new window
+    ConvergenceProbe(client, timeout=FREE_USER_LIMIT.window_seconds + 5).status(
+        200, "/v1/chat/completions", method="POST", auth=free_user_auth, json={**streaming_request}
+    )
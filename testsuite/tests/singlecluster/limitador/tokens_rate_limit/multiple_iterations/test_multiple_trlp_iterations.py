@@ -2,9 +2,10 @@
 Tests that a TokenRateLimitPolicy limit is enforced and resets as expected over multiple iterations
 """
 
-from time import sleep
 import pytest
 
+from testsuite.httpx.probe import ConvergenceProbe
+
 from .conftest import LIMIT
 
 pytestmark = [pytest.mark.limitador]
@@ -41,8 +42,7 @@ def test_multiple_trlp_limit_iterations(client):
             response.status_code == 429
         ), f"Iteration {i+1}/10: Expected 429 after {total_tokens}/{LIMIT.limit} tokens, but got {response.status_code}"
 
-        sleep(20)
-        response = client.post("/v1/chat/completions", json={**basic_request})
-        assert (
-            response.status_code == 200
-        ), f"Iteration {i+1}/10: Expected 200 after reset, but got {response.status_code}"
+        # Waits until the quota resets, the first successful request is counted in the new window
+        ConvergenceProbe(client, timeout=LIMIT.window_seconds + 5).status(
+            200, "/v1/chat/completions", method="POST", json={**basic_request}
+        )
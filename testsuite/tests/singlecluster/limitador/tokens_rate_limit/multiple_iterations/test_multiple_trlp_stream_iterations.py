@@ -4,10 +4,11 @@ multiple iterations with streaming enabled
 """
 
 import json
-from time import sleep
 
 import pytest
 
+from testsuite.httpx.probe import ConvergenceProbe
+
 from .conftest import LIMIT
 
 pytestmark = [pytest.mark.limitador]
@@ -69,8 +70,7 @@ def test_multiple_trlp_streaming_iterations(client):
             response.status_code == 429
         ), f"Iteration {i+1}/5: Expected 429 after {total_tokens}/{LIMIT.limit} tokens, but got {response.status_code}"
 
-        sleep(20)
-        response = client.post("/v1/chat/completions", json={**streaming_request})
-        assert (
-            response.status_code == 200
-        ), f"Iteration {i+1}/5: Expected 200 after reset, but got {response.status_code}"
+        # Waits until the quota resets, the first successful request is counted in the new window
+        ConvergenceProbe(client, timeout=LIMIT.window_seconds + 5).status(
+            200, "/v1/chat/completions", method="POST", json={**streaming_request}
+        )
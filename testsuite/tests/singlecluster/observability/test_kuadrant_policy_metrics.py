@@ -5,7 +5,7 @@ import operator
 import pytest
 
 from testsuite.gateway import Exposer, TLSGatewayListener
-from testsuite.prometheus import has_label
+from testsuite.prometheus import has_label, metric_selector
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
 from testsuite.gateway.gateway_api.hostname import DNSPolicyExposer
 from testsuite.kuadrant.policy.rate_limit import Limit
@@ -116,16 +116,34 @@ def test_metric_kuadrant_policies_total(kuadrant_operator_metrics, policy_kind):
     ), f"Expected 'kuadrant_policies_total' for kind '{policy_kind}' to have value >= 1, but got: {metrics.values}"
 
 
+@pytest.fixture(scope="module")
+def enforced_selectors(system_project):
+    """PromQL selectors of kuadrant_policies_enforced metric for every policy kind"""
+    return {
+        kind: metric_selector(
+            "kuadrant_policies_enforced",
+            {
+                "service": "kuadrant-operator-metrics",
+                "namespace": system_project.project,
+                "kind": kind,
+                "status": "true",
+            },
+        )
+        for kind in POLICY_KINDS
+    }
+
+
+@pytest.fixture(scope="module")
+def policies_enforced(prometheus, enforced_selectors):
+    """Waits until all policy kinds are reported as enforced at once, returns True if they were in time"""
+    return prometheus.wait_for_metrics(dict.fromkeys(enforced_selectors.values(), 1), compare=operator.ge)
+
+
 @pytest.mark.parametrize("policy_kind", POLICY_KINDS)
-def test_metric_kuadrant_policies_enforced(prometheus, policy_kind, system_project):
+def test_metric_kuadrant_policies_enforced(prometheus, policies_enforced, enforced_selectors, policy_kind):
     """Tests that kuadrant_policies_enforced metric has value >= 1 for each enforced policy kind"""
-    labels = {
-        "service": "kuadrant-operator-metrics",
-        "namespace": system_project.project,
-        "kind": policy_kind,
-        "status": "true",
-    }
-    assert prometheus.wait_for_metric("kuadrant_policies_enforced", 1, labels=labels, compare=operator.ge), (
+    metrics = prometheus.query(enforced_selectors[policy_kind])
+    assert policies_enforced or (metrics.values and metrics.values[0] >= 1), (
         f"Expected 'kuadrant_policies_enforced' for kind '{policy_kind}' "
-        f"to have value >= 1, but got: {prometheus.get_metrics(key='kuadrant_policies_enforced', labels=labels).values}"
+        f"to have value >= 1, but got: {metrics.values}"
     )
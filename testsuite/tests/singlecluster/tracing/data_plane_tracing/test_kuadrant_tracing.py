@@ -8,6 +8,8 @@ Kuadrant stack, including wasm-shim, Authorino, Limitador, and gateway services.
 import os
 import pytest
 
+from testsuite.tracing import TraceQuery
+
 pytestmark = [pytest.mark.observability, pytest.mark.limitador, pytest.mark.authorino, pytest.mark.kuadrant_only]
 
 
@@ -39,21 +41,26 @@ def trace_request_ids(client, auth):
 
 
 @pytest.fixture(scope="module")
-def trace_200(trace_request_ids, tracing):
-    """Fetches and caches the full wasm-shim trace for the 200 response."""
-    request_id = trace_request_ids[0]
-    traces = tracing.get_traces(service="wasm-shim", min_processes=4, tags={"request_id": request_id})
-    assert len(traces) == 1, f"No trace was found in tracing backend with request_id: {request_id}"
-    return traces[0]
+def request_traces(trace_request_ids, tracing):
+    """Fetches full wasm-shim traces for the 200 and 429 responses at once"""
+    traces = tracing.search_many(
+        [TraceQuery("wasm-shim", tags={"request_id": request_id}, min_processes=4) for request_id in trace_request_ids]
+    )
+    for request_id, found in zip(trace_request_ids, traces):
+        assert len(found) == 1, f"No trace was found in tracing backend with request_id: {request_id}"
+    return [found[0] for found in traces]
 
 
 @pytest.fixture(scope="module")
-def trace_429(trace_request_ids, tracing):
-    """Fetches and caches the full wasm-shim trace for the 429 response."""
-    request_id = trace_request_ids[1]
-    traces = tracing.get_traces(service="wasm-shim", min_processes=4, tags={"request_id": request_id})
-    assert len(traces) == 1, f"No trace was found in tracing backend with request_id: {request_id}"
-    return traces[0]
+def trace_200(request_traces):
+    """Full wasm-shim trace for the 200 response"""
+    return request_traces[0]
+
+
+@pytest.fixture(scope="module")
+def trace_429(request_traces):
+    """Full wasm-shim trace for the 429 response"""
+    return request_traces[1]
 
 
 @pytest.fixture(scope="module")
@@ -1,7 +1,33 @@
 """Module with Abstract Tracing client for traces management"""
 
 import abc
-from typing import Any, Optional
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class TraceQuery(NamedTuple):
+    """Parameters of a single trace search"""
+
+    service: str
+    tags: Optional[dict[str, str]] = None
+    # Traces with fewer service processes are left out
+    min_processes: int = 0
+    # Traces missing any of these services in their processes are left out
+    services: frozenset[str] = frozenset()
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    limit: Optional[int] = None
+
+    def matches(self, processes: dict[str, Any]) -> bool:
+        """Returns True if the processes of a trace satisfy min_processes and services"""
+        if len(processes) < self.min_processes:
+            return False
+        return self.services <= {process.get("serviceName", "") for process in processes.values()}
 
 
 class TracingClient(abc.ABC):
@@ -23,6 +49,45 @@ class TracingClient(abc.ABC):
         """Returns URL for application to deposit traces"""
 
     @abc.abstractmethod
-    def get_traces(self, service: str, tags: Optional[dict[str, str]] = None, min_processes: int = 0) -> list[Any]:
-        """Search traces in tracing client by service name and tags.
+    def get_traces(
+        self,
+        service: str,
+        tags: Optional[dict[str, str]] = None,
+        min_processes: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Any]:
+        """Search traces in tracing client by service name and tags, optionally bounded by time and count.
         If min_processes is set, retries until at least that many service processes are present"""
+
+    @abc.abstractmethod
+    def search_traces(self, query: TraceQuery) -> list[Any]:
+        """Searches traces once, without any retries"""
+
+    @abc.abstractmethod
+    def get_trace(self, trace_id: str) -> Optional[Any]:
+        """Returns trace by its ID, None if it does not exist (yet)"""
+
+    def search_many(
+        self, queries: Sequence[TraceQuery], timeout: float = 30, max_interval: float = 5
+    ) -> list[list[Any]]:
+        """
+        Runs all queries concurrently and repeats the ones without results until each has some or until timeout.
+        Returns results in the order of the queries, queries without any traces found have empty list.
+        """
+        results: list[list[Any]] = [[] for _ in queries]
+        deadline = time.monotonic() + timeout
+        interval = 0.5
+        with ThreadPoolExecutor(max_workers=max(len(queries), 1)) as executor:
+            while True:
+                pending = [i for i, result in enumerate(results) if not result]
+                for i, traces in zip(pending, executor.map(lambda i: self.search_traces(queries[i]), pending)):
+                    results[i] = traces
+                if all(results):
+                    return results
+                if time.monotonic() + interval > deadline:
+                    logger.info("No traces found for queries %s", [queries[i] for i, r in enumerate(results) if not r])
+                    return results
+                time.sleep(interval)
+                interval = min(interval * 2, max_interval)
@@ -1,22 +1,34 @@
 """Jaeger Tracing client"""
 
 import json
-from typing import Optional
+from datetime import datetime
+from typing import Iterator, Optional
 
 import backoff
 from apyproxy import ApyProxy
 from httpx import Client
 
-from testsuite.tracing import TracingClient
+from testsuite.tracing import TraceQuery, TracingClient
 from testsuite.tracing.models import Trace
+from testsuite.tracing.stream import iter_json_array
 
 
 class JaegerClient(TracingClient):
     """Tracing client for traces management"""
 
+    # Search endpoint and the key of the traces array in its response
+    traces_path = "api/traces"
+    traces_key = "data"
+    # Endpoint returning single trace by its ID and the key of the array with the trace in its response
+    trace_path = "api/traces/{trace_id}"
+    trace_key = "data"
+    # Multiplier converting Unix time in seconds into start/end parameters of the search
+    time_unit = 1_000_000
+
     def __init__(self, collector_url: str, query_url: str, client: Client):
         self._collector_url = collector_url
         self._query_url = query_url
+        self.client = client
         self.query = ApyProxy(self.query_url, session=client)
 
     @property
@@ -32,27 +44,54 @@ class JaegerClient(TracingClient):
     def query_url(self):
         return self._query_url
 
+    def _search_params(self, query: TraceQuery) -> dict[str, str]:
+        """Returns query parameters of the trace search"""
+        params = {"service": query.service}
+        if query.tags:
+            params["tags"] = json.dumps(query.tags)
+        return params
+
+    def _stream_traces(self, path: str, key: str, params: dict[str, str], query: TraceQuery) -> Iterator[Trace]:
+        url = f"{self.query_url.rstrip('/')}/{path}"
+        with self.client.stream("GET", url, params=params) as response:
+            if response.status_code == 404:
+                return
+            for trace_data in iter_json_array(response.iter_text(), key):
+                if query.matches(trace_data.get("processes", {})):
+                    yield Trace.from_dict(trace_data)
+
+    def iter_traces(self, query: TraceQuery) -> Iterator[Trace]:
+        """Streams traces matching the query, each trace is parsed as soon as it is received and its spans
+        are created only when accessed"""
+        params = self._search_params(query)
+        for name, value in (("start", query.start), ("end", query.end)):
+            if value is not None:
+                params[name] = str(int(value.timestamp() * self.time_unit))
+        if query.limit is not None:
+            params["limit"] = str(query.limit)
+        return self._stream_traces(self.traces_path, self.traces_key, params, query)
+
+    def search_traces(self, query: TraceQuery) -> list[Trace]:
+        return list(self.iter_traces(query))
+
+    def get_trace(self, trace_id: str) -> Optional[Trace]:
+        path = self.trace_path.format(trace_id=trace_id)
+        return next(self._stream_traces(path, self.trace_key, {}, TraceQuery("")), None)
+
     @backoff.on_predicate(backoff.fibo, lambda x: x == [], max_tries=7, jitter=None)
-    def get_traces(self, service: str, tags: Optional[dict[str, str]] = None, min_processes: int = 0) -> list[Trace]:
+    def get_traces(
+        self,
+        service: str,
+        tags: Optional[dict[str, str]] = None,
+        min_processes: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Trace]:
         """Gets trace from tracing backend Tempo or Jaeger.
         If min_processes is set, retries until at least that many service processes are present.
 
         Returns:
             List of Trace objects
         """
-        params = {"service": service}
-        if tags:
-            params["tags"] = json.dumps(tags)
-
-        traces_data = self.query.api.traces.get(params=params).json()["data"]
-        if not traces_data:
-            return []
-
-        # Filter traces that meet min_processes requirement
-        if min_processes:
-            traces_data = [trace for trace in traces_data if len(trace.get("processes", {})) >= min_processes]
-            if not traces_data:
-                return []
-
-        # Convert to Trace objects
-        return [Trace.from_dict(trace_data) for trace_data in traces_data]
+        return self.search_traces(TraceQuery(service, tags, min_processes, start=start, end=end, limit=limit))
@@ -0,0 +1,392 @@
+"""
+In-process OTLP receiver, which stores spans in memory and makes them queryable the moment they arrive.
+Spans are stored in the same format as Jaeger returns them, so they are parsed into the same Trace objects.
+"""
+
+import base64
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Sequence
+
+import grpc
+from google.protobuf import json_format
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.trace.v1.trace_pb2 import Span as OTLPSpan, Status
+
+from testsuite.lifecycle import LifecycleObject
+from testsuite.tracing import TraceQuery, TracingClient
+from testsuite.tracing.models import Trace
+
+TRACE_SERVICE = "opentelemetry.proto.collector.trace.v1.TraceService"
+# Same values as Jaeger uses for the span.kind tag
+SPAN_KINDS = {
+    OTLPSpan.SPAN_KIND_INTERNAL: "internal",
+    OTLPSpan.SPAN_KIND_SERVER: "server",
+    OTLPSpan.SPAN_KIND_CLIENT: "client",
+    OTLPSpan.SPAN_KIND_PRODUCER: "producer",
+    OTLPSpan.SPAN_KIND_CONSUMER: "consumer",
+}
+STATUS_CODES = {Status.STATUS_CODE_OK: "OK", Status.STATUS_CODE_ERROR: "ERROR"}
+
+
+def _value(value: AnyValue) -> Any:
+    """Converts AnyValue into Python object"""
+    kind = value.WhichOneof("value")
+    if kind == "array_value":
+        return [_value(item) for item in value.array_value.values]
+    if kind == "kvlist_value":
+        return {item.key: _value(item.value) for item in value.kvlist_value.values}
+    if kind == "bytes_value":
+        return value.bytes_value.hex()
+    return getattr(value, kind) if kind else None
+
+
+def _tag(key: str, value: Any) -> dict:
+    """Returns tag in Jaeger format, arrays and maps are serialized into JSON strings same as in Jaeger"""
+    if isinstance(value, bool):
+        return {"key": key, "type": "bool", "value": value}
+    if isinstance(value, int):
+        return {"key": key, "type": "int64", "value": value}
+    if isinstance(value, float):
+        return {"key": key, "type": "float64", "value": value}
+    if isinstance(value, (list, dict)):
+        value = _tag_string(value)
+    return {"key": key, "type": "string", "value": value}
+
+
+def _tag_string(value: Any) -> str:
+    """
+    Returns tag value as string, the same way Jaeger stringifies tags when matching them against query tags,
+    e.g. booleans are `true` and `false`, floats have 10 significant digits and arrays and maps are compact JSON
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return format(value, ".10g")
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+def _tags(attributes: Sequence[KeyValue]) -> list[dict]:
+    return [_tag(attribute.key, _value(attribute.value)) for attribute in attributes]
+
+
+def _hex_to_base64(data: dict, *keys: str):
+    """OTLP/JSON encodes IDs as hex strings instead of base64 used by protobuf JSON mapping for bytes"""
+    for key in keys:
+        if data.get(key):
+            data[key] = base64.b64encode(bytes.fromhex(data[key])).decode()
+
+
+def parse_json_request(body: bytes) -> ExportTraceServiceRequest:
+    """Parses OTLP/JSON encoded ExportTraceServiceRequest"""
+    data = json.loads(body)
+    for resource_spans in data.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                _hex_to_base64(span, "traceId", "spanId", "parentSpanId")
+                for link in span.get("links", []):
+                    _hex_to_base64(link, "traceId", "spanId")
+    return json_format.ParseDict(data, ExportTraceServiceRequest(), ignore_unknown_fields=True)
+
+
+def _span(span: OTLPSpan, scope_tags: list[dict], process_id: str) -> dict:
+    """Converts OTLP span into Jaeger format"""
+    trace_id = span.trace_id.hex()
+    tags = _tags(span.attributes) + scope_tags
+    if span.kind in SPAN_KINDS:
+        tags.append(_tag("span.kind", SPAN_KINDS[span.kind]))
+    if span.status.code in STATUS_CODES:
+        tags.append(_tag("otel.status_code", STATUS_CODES[span.status.code]))
+        if span.status.code == Status.STATUS_CODE_ERROR:
+            tags.append(_tag("error", True))
+    if span.status.message:
+        tags.append(_tag("otel.status_description", span.status.message))
+
+    references = []
+    if span.parent_span_id:
+        references.append({"refType": "CHILD_OF", "traceID": trace_id, "spanID": span.parent_span_id.hex()})
+    for link in span.links:
+        references.append({"refType": "FOLLOWS_FROM", "traceID": link.trace_id.hex(), "spanID": link.span_id.hex()})
+
+    return {
+        "traceID": trace_id,
+        "spanID": span.span_id.hex(),
+        "operationName": span.name,
+        "references": references,
+        "startTime": span.start_time_unix_nano // 1000,
+        "duration": max(span.end_time_unix_nano - span.start_time_unix_nano, 0) // 1000,
+        "tags": tags,
+        "logs": [
+            {
+                "timestamp": event.time_unix_nano // 1000,
+                "fields": [_tag("event", event.name)] + _tags(event.attributes),
+            }
+            for event in span.events
+        ],
+        "processID": process_id,
+    }
+
+
+class SpanStore:
+    """Spans grouped into traces in Jaeger format, indexed by service and span tags"""
+
+    def __init__(self) -> None:
+        self.traces: dict[str, dict] = {}
+        self.by_service: dict[str, set[str]] = defaultdict(set)
+        self.by_tag: dict[tuple[str, str], set[str]] = defaultdict(set)
+        # Notified after every export, so waiting for traces does not need any polling
+        self.condition = threading.Condition()
+
+    def add(self, request: ExportTraceServiceRequest):
+        """Stores all spans from the export request"""
+        with self.condition:
+            for resource_spans in request.resource_spans:
+                resource_tags = _tags(resource_spans.resource.attributes)
+                service = next((t["value"] for t in resource_tags if t["key"] == "service.name"), "unknown_service")
+                for scope_spans in resource_spans.scope_spans:
+                    scope_tags = []
+                    if scope_spans.scope.name:
+                        scope_tags.append(_tag("otel.scope.name", scope_spans.scope.name))
+                    if scope_spans.scope.version:
+                        scope_tags.append(_tag("otel.scope.version", scope_spans.scope.version))
+                    for span in scope_spans.spans:
+                        self._add_span(span, service, resource_tags, scope_tags)
+            self.condition.notify_all()
+
+    def _add_span(self, span: OTLPSpan, service: str, resource_tags: list[dict], scope_tags: list[dict]):
+        trace_id = span.trace_id.hex()
+        trace = self.traces.setdefault(
+            trace_id, {"traceID": trace_id, "spans": [], "processes": {}, "process_ids": {}, "start": None}
+        )
+        if (process_id := trace["process_ids"].get(service)) is None:
+            process_id = trace["process_ids"][service] = f"p{len(trace['process_ids']) + 1}"
+            trace["processes"][process_id] = {"serviceName": service, "tags": resource_tags}
+        data = _span(span, scope_tags, process_id)
+        trace["spans"].append(data)
+        if trace["start"] is None or data["startTime"] < trace["start"]:
+            trace["start"] = data["startTime"]
+        self.by_service[service].add(trace_id)
+        for tag in data["tags"]:
+            self.by_tag[(tag["key"], _tag_string(tag["value"]))].add(trace_id)
+
+    def _matches(self, trace: dict, query: TraceQuery) -> bool:
+        if not query.matches(trace["processes"]):
+            return False
+        if query.start is not None and trace["start"] < query.start.timestamp() * 1_000_000:
+            return False
+        if query.end is not None and trace["start"] > query.end.timestamp() * 1_000_000:
+            return False
+        if not query.tags:
+            return True
+        # Jaeger matches traces with a single span of the service having all the tags
+        process_id = trace["process_ids"][query.service]
+        expected = {(key, _tag_string(value)) for key, value in query.tags.items()}
+        return any(
+            span["processID"] == process_id
+            and expected <= {(tag["key"], _tag_string(tag["value"])) for tag in span["tags"]}
+            for span in trace["spans"]
+        )
+
+    def search(self, query: TraceQuery) -> list[Trace]:
+        """Returns traces matching the query, the most recent first"""
+        with self.condition:
+            candidates = set(self.by_service.get(query.service, ()))
+            for key, value in (query.tags or {}).items():
+                candidates &= self.by_tag.get((key, _tag_string(value)), set())
+            traces = [self.traces[trace_id] for trace_id in candidates]
+            traces = [trace for trace in traces if self._matches(trace, query)]
+            traces.sort(key=lambda trace: trace["start"], reverse=True)
+            if query.limit is not None:
+                traces = traces[: query.limit]
+            return [self._trace(trace) for trace in traces]
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        """Returns trace by its ID"""
+        with self.condition:
+            trace = self.traces.get(trace_id)
+            return None if trace is None else self._trace(trace)
+
+    @staticmethod
+    def _trace(trace: dict) -> Trace:
+        """Creates Trace from the current spans, spans arriving later are not part of it"""
+        return Trace.from_dict({"traceID": trace["traceID"], "spans": trace["spans"], "processes": trace["processes"]})
+
+    def wait_for(self, predicate: Callable[[], Any], timeout: float) -> Any:
+        """Waits until the predicate returns a truthy value, re-evaluated after every export"""
+        with self.condition:
+            return self.condition.wait_for(predicate, timeout)
+
+    def clear(self):
+        """Removes all stored spans"""
+        with self.condition:
+            self.traces.clear()
+            self.by_service.clear()
+            self.by_tag.clear()
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """Receives OTLP/HTTP exports in both protobuf and JSON encoding"""
+
+    server: "_HTTPServer"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Stores spans sent to /v1/traces"""
+        if self.path.split("?")[0] != "/v1/traces":
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content_type = self.headers.get("Content-Type", "")
+        try:
+            if content_type.startswith("application/json"):
+                request = parse_json_request(body)
+                response = b"{}"
+            else:
+                request = ExportTraceServiceRequest.FromString(body)
+                response = ExportTraceServiceResponse().SerializeToString()
+        except (ValueError, json_format.ParseError) as exc:
+            self.send_error(400, str(exc))
+            return
+        self.server.store.add(request)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type or "application/x-protobuf")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Requests are not logged"""
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store: SpanStore):
+        super().__init__(address, _HTTPHandler)
+        self.store = store
+
+
+# pylint: disable=too-many-instance-attributes
+class LocalTracingClient(TracingClient, LifecycleObject):
+    """
+    TracingClient backed by an in-process OTLP receiver (OTLP/gRPC and OTLP/HTTP) instead of Jaeger or Tempo.
+    Receivers listen on `bind` (random ports if 0), `host` is the address under which they are reachable
+    from the instrumented components, if it differs from the bound address.
+    get_traces and search_many wait (up to `timeout` seconds) for the spans to arrive instead of polling.
+    """
+
+    def __init__(
+        self,
+        bind: str = "127.0.0.1",
+        grpc_port: int = 0,
+        http_port: int = 0,
+        host: Optional[str] = None,
+        timeout: float = 30,
+    ):
+        self.bind = bind
+        self.grpc_port = grpc_port
+        self.http_port = http_port
+        self.host = host or bind
+        self.timeout = timeout
+        self.store = SpanStore()
+        self.grpc_server: Optional[grpc.Server] = None
+        self.http_server: Optional[_HTTPServer] = None
+
+    def commit(self):
+        self.grpc_server = grpc.server(ThreadPoolExecutor(max_workers=8))
+        self.grpc_server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    TRACE_SERVICE,
+                    {
+                        "Export": grpc.unary_unary_rpc_method_handler(
+                            self._export,
+                            request_deserializer=ExportTraceServiceRequest.FromString,
+                            response_serializer=ExportTraceServiceResponse.SerializeToString,
+                        )
+                    },
+                ),
+            )
+        )
+        self.grpc_port = self.grpc_server.add_insecure_port(f"{self.bind}:{self.grpc_port}")
+        self.grpc_server.start()
+
+        self.http_server = _HTTPServer((self.bind, self.http_port), self.store)
+        self.http_port = self.http_server.server_address[1]
+        threading.Thread(target=self.http_server.serve_forever, name="otlp-http", daemon=True).start()
+
+    def delete(self):
+        if self.grpc_server is not None:
+            self.grpc_server.stop(None)
+            self.grpc_server = None
+        if self.http_server is not None:
+            self.http_server.shutdown()
+            self.http_server.server_close()
+            self.http_server = None
+
+    def _export(self, request: ExportTraceServiceRequest, _context) -> ExportTraceServiceResponse:
+        self.store.add(request)
+        return ExportTraceServiceResponse()
+
+    @property
+    def insecure(self):
+        return True
+
+    @property
+    def collector_url(self):
+        """OTLP/gRPC endpoint"""
+        return f"rpc://{self.host}:{self.grpc_port}"
+
+    @property
+    def http_collector_url(self):
+        """OTLP/HTTP endpoint"""
+        return f"http://{self.host}:{self.http_port}/v1/traces"
+
+    @property
+    def query_url(self):
+        return f"http://{self.host}:{self.http_port}"
+
+    def search_traces(self, query: TraceQuery) -> list[Trace]:
+        return self.store.search(query)
+
+    def get_trace(self, trace_id: str) -> Optional[Trace]:
+        return self.store.get(trace_id)
+
+    def get_traces(
+        self,
+        service: str,
+        tags: Optional[dict[str, str]] = None,
+        min_processes: int = 0,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Trace]:
+        """Returns matching traces, waits for them to arrive if there are none yet"""
+        query = TraceQuery(service, tags, min_processes, start=start, end=end, limit=limit)
+        return self.store.wait_for(lambda: self.search_traces(query), self.timeout) or []
+
+    def search_many(
+        self, queries: Sequence[TraceQuery], timeout: float = 30, max_interval: float = 5
+    ) -> list[list[Trace]]:
+        """Waits until every query has some traces (or until timeout), max_interval is not used as nothing polls"""
+        results: list[list[Trace]] = []
+
+        def _all_found():
+            results[:] = [self.search_traces(query) for query in queries]
+            return all(results)
+
+        self.store.wait_for(_all_found, timeout)
+        return results
+
+    def clear(self):
+        """Removes all received spans"""
+        self.store.clear()
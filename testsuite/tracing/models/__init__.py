@@ -2,7 +2,7 @@
 
 from .logs import LogEntry, LogField
 from .spans import Span, SpanReference
-from .traces import Trace
+from .traces import SpanList, Trace, TraceIndex
 
 __all__ = [
     # Logs
@@ -12,5 +12,7 @@ __all__ = [
     "SpanReference",
     "Span",
     # Traces
+    "SpanList",
     "Trace",
+    "TraceIndex",
 ]
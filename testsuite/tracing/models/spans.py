@@ -1,13 +1,13 @@
 """Span-related data models for distributed tracing"""
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .logs import LogEntry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpanReference:
     """Represents a reference to another span"""
 
@@ -25,53 +25,51 @@ class SpanReference:
         )
 
 
-@dataclass(frozen=True)
+def _decode_tag_value(value: Any) -> Any:
+    """Parses JSON strings (arrays/objects) into Python objects, other values are returned as they are"""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped.startswith("[") or stripped.startswith("{"):
+            try:
+                return json.loads(stripped)
+            except json.JSONDecodeError:
+                pass  # Keep as string if not valid JSON
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class Span:  # pylint: disable=too-many-instance-attributes
-    """Represents a single span in a distributed trace"""
+    """
+    Represents a single span in a distributed trace.
+    Tags and logs are kept in their raw form and decoded only when accessed for the first time.
+    """
 
     operation_name: str
     span_id: str
     trace_id: str
     start_time: int
     duration: int  # Duration in microseconds (must be non-negative)
-    tags: dict[str, Any]
-    logs: list[LogEntry]
-    references: list[SpanReference]
+    # Tag keys and raw values, duplicate keys included
+    raw_tags: tuple[tuple[str, Any], ...] = field(repr=False, compare=False)
+    raw_logs: list[dict] = field(repr=False, compare=False)
+    references: tuple[SpanReference, ...]
     process_id: str
+    parent_id: str | None = None
+    _tags: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _logs: list[LogEntry] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create Span from Jaeger API response dict"""
-        # Convert tags list to dict, parsing JSON strings into Python objects
-        # Note: If duplicate keys exist, we keep the first occurrence
-        tags_dict = {}
+        raw_tags = []
         for tag in data.get("tags", []):
             key = tag.get("key", "").strip()
             if not key:  # Skip malformed tags without keys or whitespace-only keys
                 continue
+            raw_tags.append((key, tag.get("value", "")))
 
-            # Skip duplicate keys - keep first occurrence
-            if key in tags_dict:
-                continue
-
-            value = tag.get("value", "")
-
-            # Try to parse JSON strings (arrays/objects) into Python objects
-            if isinstance(value, str):
-                stripped = value.strip()
-                if stripped.startswith("[") or stripped.startswith("{"):
-                    try:
-                        value = json.loads(stripped)
-                    except json.JSONDecodeError:
-                        pass  # Keep as string if not valid JSON
-
-            tags_dict[key] = value
-
-        # Convert logs list to LogEntry objects
-        logs = [LogEntry.from_dict(log_data) for log_data in data.get("logs", [])]
-
-        # Convert references list to SpanReference objects
-        references = [SpanReference.from_dict(ref_data) for ref_data in data.get("references", [])]
+        references = tuple(SpanReference.from_dict(ref_data) for ref_data in data.get("references", []))
+        parent_id = next((ref.span_id for ref in references if ref.ref_type == "CHILD_OF"), None)
 
         duration = data.get("duration", 0)
         # Negative durations don't make sense, but we don't fail on them
@@ -84,15 +82,45 @@ class Span:  # pylint: disable=too-many-instance-attributes
             trace_id=data.get("traceID", ""),
             start_time=data.get("startTime", 0),
             duration=duration,
-            tags=tags_dict,
-            logs=logs,
+            raw_tags=tuple(raw_tags),
+            raw_logs=data.get("logs", []),
             references=references,
             process_id=data.get("processID", ""),
+            parent_id=parent_id,
         )
 
+    @property
+    def tags(self) -> dict[str, Any]:
+        """Tags as a dict with JSON strings parsed into Python objects, first occurrence of duplicate keys is kept"""
+        if self._tags is None:
+            tags: dict[str, Any] = {}
+            for key, value in self.raw_tags:
+                if key not in tags:
+                    tags[key] = _decode_tag_value(value)
+            object.__setattr__(self, "_tags", tags)
+        return self._tags  # type: ignore[return-value]
+
+    @property
+    def tag_keys(self) -> set[str]:
+        """Keys of all tags, without decoding their values"""
+        return {key for key, _ in self.raw_tags}
+
+    @property
+    def logs(self) -> list[LogEntry]:
+        """Log entries of the span"""
+        if self._logs is None:
+            object.__setattr__(self, "_logs", [LogEntry.from_dict(log_data) for log_data in self.raw_logs])
+        return self._logs  # type: ignore[return-value]
+
     def get_tag(self, key: str, default=None) -> Any:
         """Get tag value by key"""
-        return self.tags.get(key, default)
+        if self._tags is not None:
+            return self._tags.get(key, default)
+        # Decodes only the requested tag
+        for tag_key, value in self.raw_tags:
+            if tag_key == key:
+                return _decode_tag_value(value)
+        return default
 
     def has_tag(self, key: str, value: Any = None) -> bool:  # pylint: disable=too-many-return-statements
         """
@@ -109,13 +137,13 @@ class Span:  # pylint: disable=too-many-instance-attributes
         Returns:
             True if tag exists (and matches value if provided)
         """
-        if key not in self.tags:
+        missing = object()
+        tag_value = self.get_tag(key, missing)
+        if tag_value is missing:
             return False
         if value is None:
             return True
 
-        tag_value = self.tags[key]
-
         # If tag value is a list, check exact membership
         if isinstance(tag_value, list):
             return value in tag_value
@@ -145,10 +173,7 @@ class Span:  # pylint: disable=too-many-instance-attributes
 
     def get_parent_id(self) -> str | None:
         """Get parent span ID from CHILD_OF reference"""
-        for ref in self.references:
-            if ref.ref_type == "CHILD_OF":
-                return ref.span_id
-        return None
+        return self.parent_id
 
     def has_log_field(self, key: str, value: str | None = None) -> bool:
         """Check if any log entry has a field with exact value match"""
@@ -1,11 +1,85 @@
 """Trace-related data models for distributed tracing"""
 
-from dataclasses import dataclass
-from typing import Any, Callable
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, overload
 
 from .spans import Span
 
 
+class SpanList(Sequence[Span]):
+    """Spans of a trace, each one is created from its raw dict only when it is accessed for the first time"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[dict | Span]) -> None:
+        self._items: list[dict | Span] = list(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> Span: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Span]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if isinstance(item, dict):
+            # Raw dict is replaced, so it can be garbage collected
+            item = self._items[index] = Span.from_dict(item)
+        return item
+
+    def __iter__(self) -> Iterator[Span]:
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"SpanList({len(self)} spans)"
+
+
+@dataclass(frozen=True)
+class TraceIndex:
+    """Lookup tables of a Trace, built in a single pass over its spans. Lists keep the order of spans in the Trace"""
+
+    spans_by_id: dict[str, Span]
+    children: dict[str, list[Span]]
+    parents: dict[str, str]
+    by_operation: dict[str, list[Span]]
+    by_tag: dict[str, list[Span]]
+    # Spans without parent or with parent missing from the trace
+    roots: list[Span] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, spans: Sequence[Span]) -> "TraceIndex":
+        """Indexes the spans"""
+        spans_by_id: dict[str, Span] = {}
+        children: dict[str, list[Span]] = defaultdict(list)
+        parents: dict[str, str] = {}
+        by_operation: dict[str, list[Span]] = defaultdict(list)
+        by_tag: dict[str, list[Span]] = defaultdict(list)
+        for span in spans:
+            # First occurrence wins, same as in linear lookup
+            spans_by_id.setdefault(span.span_id, span)
+            if (parent_id := span.get_parent_id()) is not None:
+                children[parent_id].append(span)
+                parents[span.span_id] = parent_id
+            by_operation[span.operation_name].append(span)
+            for key in span.tag_keys:
+                by_tag[key].append(span)
+        roots = [span for span in spans if parents.get(span.span_id) not in spans_by_id]
+        return cls(spans_by_id, dict(children), parents, dict(by_operation), dict(by_tag), roots)
+
+
 @dataclass(frozen=True)
 class Trace:
     """
@@ -16,16 +90,15 @@ class Trace:
     """
 
     trace_id: str
-    spans: list[Span]
+    spans: Sequence[Span]
     processes: dict[str, Any]
 
     @classmethod
     def from_dict(cls, data: dict) -> "Trace":
         """Create Trace from Jaeger API response dict"""
-        spans = [Span.from_dict(span_data) for span_data in data.get("spans", [])]
         return cls(
             trace_id=data.get("traceID", ""),
-            spans=spans,
+            spans=SpanList(data.get("spans", [])),
             processes=data.get("processes", {}),
         )
 
@@ -73,13 +146,100 @@ class Trace:
         """Get set of service names from all processes"""
         return {process.get("serviceName", "") for process in self.processes.values()}
 
+    @cached_property
+    def index(self) -> TraceIndex:
+        """Lookup tables of the spans, built on first use"""
+        return TraceIndex.build(self.spans)
+
     def get_span_by_id(self, span_id: str) -> Span | None:
         """Look up a span by its span ID"""
-        for span in self.spans:
-            if span.span_id == span_id:
-                return span
-        return None
+        return self.index.spans_by_id.get(span_id)
 
     def get_children(self, span_id: str) -> list[Span]:
         """Get all direct child spans of the given span"""
-        return [span for span in self.spans if span.get_parent_id() == span_id]
+        return list(self.index.children.get(span_id, []))
+
+    def get_parent(self, span: Span) -> Span | None:
+        """Get parent span of the given span, None if it is a root or the parent is not part of the trace"""
+        parent_id = self.index.parents.get(span.span_id)
+        return None if parent_id is None else self.index.spans_by_id.get(parent_id)
+
+    def get_roots(self) -> list[Span]:
+        """Get spans without parent in this trace"""
+        return list(self.index.roots)
+
+    def get_spans_by_operation(self, operation_name: str) -> list[Span]:
+        """Get all spans with the operation name"""
+        return list(self.index.by_operation.get(operation_name, []))
+
+    def get_spans_with_tag(self, key: str, value: Any = None) -> list[Span]:
+        """Get all spans with the tag, value is matched the same way as in Span.has_tag"""
+        spans = self.index.by_tag.get(key, [])
+        if value is None:
+            return list(spans)
+        return [span for span in spans if span.has_tag(key, value)]
+
+    def get_service(self, span: Span) -> str:
+        """Get service name of the process which emitted the span"""
+        return self.processes.get(span.process_id, {}).get("serviceName", "")
+
+    def iter_descendants(self, span_id: str) -> Iterator[Span]:
+        """Iterate over all spans below the given span in depth-first order"""
+        children = self.index.children
+        stack = list(reversed(children.get(span_id, [])))
+        visited = {span_id}
+        while stack:
+            span = stack.pop()
+            # Guards against cycles in malformed traces
+            if span.span_id in visited:
+                continue
+            visited.add(span.span_id)
+            yield span
+            stack.extend(reversed(children.get(span.span_id, [])))
+
+    def get_descendants(self, span_id: str) -> list[Span]:
+        """Get all spans below the given span in depth-first order"""
+        return list(self.iter_descendants(span_id))
+
+    def critical_path(self, span_id: Optional[str] = None) -> list[Span]:
+        """
+        Get chain of spans from the given span (longest root span by default) down to a leaf,
+        following the child which finishes last at every level, as that one delays its parent the most
+        """
+        if span_id is None:
+            if not self.index.roots:
+                return []
+            span = max(self.index.roots, key=lambda s: s.duration)
+        elif (found := self.get_span_by_id(span_id)) is None:
+            return []
+        else:
+            span = found
+
+        path = [span]
+        visited = {span.span_id}
+        while children := [
+            child for child in self.index.children.get(span.span_id, []) if child.span_id not in visited
+        ]:
+            span = max(children, key=lambda s: s.start_time + s.duration)
+            visited.add(span.span_id)
+            path.append(span)
+        return path
+
+    def self_time(self, span: Span) -> int:
+        """Get time of the span (in microseconds) not covered by any of its children"""
+        start, end = span.start_time, span.start_time + span.duration
+        covered = 0
+        cursor = start
+        for child in sorted(self.index.children.get(span.span_id, []), key=lambda s: s.start_time):
+            child_start, child_end = max(child.start_time, cursor), min(child.start_time + child.duration, end)
+            if child_end > child_start:
+                covered += child_end - child_start
+                cursor = child_end
+        return span.duration - covered
+
+    def self_time_by_service(self) -> dict[str, int]:
+        """Get sum of self times (in microseconds) of all spans per service"""
+        result: dict[str, int] = defaultdict(int)
+        for span in self.index.spans_by_id.values():
+            result[self.get_service(span)] += self.self_time(span)
+        return dict(result)
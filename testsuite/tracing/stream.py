@@ -0,0 +1,96 @@
+"""Incremental parsing of large JSON responses from tracing backends"""
+
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+# Brackets and complete strings, a lone quote is an unterminated string at the end of the buffer
+_TOKENS = re.compile(r'[{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*"|"', re.DOTALL)
+_ARRAY_START = re.compile(r"\s*:\s*\[")
+_PARTIAL_ARRAY_START = re.compile(r"\s*(?::\s*)?")
+_SEPARATORS = re.compile(r"[\s,]*")
+# Characters which can follow an array element
+_ELEMENT_ENDS = frozenset(" \t\r\n,]")
+
+
+def _seek_array(chunks: Iterator[str], key: str) -> Optional[str]:
+    """Consumes chunks until the start of the array under `key`, returns rest of the buffer after the `[`"""
+    buffer = ""
+    # Position up to which the buffer was tokenized and bracket depth at that position
+    pos, depth = 0, 0
+    for chunk in chunks:
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        for match in _TOKENS.finditer(buffer):
+            token = match.group()
+            if token == '"':
+                break
+            if token in "{[":
+                depth += 1
+            elif token in "}]":
+                depth -= 1
+            elif depth == 1 and token == f'"{key}"':
+                if array := _ARRAY_START.match(buffer, match.end()):
+                    return buffer[array.end() :]
+                if _PARTIAL_ARRAY_START.fullmatch(buffer, match.end()):
+                    # Rest of the buffer may be followed by the array
+                    break
+                # Otherwise it is a string value or key with a different value than an array
+            pos = match.end()
+    return None
+
+
+def iter_json_array(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """
+    Yields elements of the array stored under `key` of the top-level JSON object as soon as each one is complete.
+    Only the current element is held in memory, the rest of the document is skipped.
+    Scalar elements (e.g. numbers) are yielded only once the following separator is seen, as their prefix,
+    e.g. `2.` from `2.5`, can be decoded on its own.
+    """
+    chunks = iter(chunks)
+    if (buffer := _seek_array(chunks, key)) is None:
+        return
+    decoder = json.JSONDecoder()
+    pending: list[str] = []
+    pending_size = 0
+    # Decoding of incomplete element fails, so it is attempted only once the buffer is as large as the previous element
+    # and after a failure again only once the buffer doubles in size
+    attempt_size = 0
+    exhausted = False
+    while True:
+        if pending:
+            buffer += "".join(pending)
+            pending.clear()
+            pending_size = 0
+        pos = _SEPARATORS.match(buffer).end()  # type: ignore[union-attr]
+        if buffer[pos : pos + 1] == "]":
+            return
+        while pos < len(buffer) and (len(buffer) - pos >= attempt_size or exhausted):
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                attempt_size = 2 * (len(buffer) - pos)
+                break
+            if not isinstance(element, (dict, list)) and buffer[end : end + 1] not in _ELEMENT_ENDS and not exhausted:
+                # Scalar might continue in the next chunk
+                attempt_size = len(buffer) - pos + 1
+                break
+            yield element
+            attempt_size = end - pos
+            pos = _SEPARATORS.match(buffer, end).end()  # type: ignore[union-attr]
+            if buffer[pos : pos + 1] == "]":
+                return
+        buffer = buffer[pos:]
+
+        if exhausted:
+            if buffer.strip():
+                # Reports the actual error
+                decoder.raw_decode(buffer)
+            raise ValueError("Unexpected end of JSON document")
+        while len(buffer) + pending_size < attempt_size or not pending:
+            try:
+                pending.append(next(chunks))
+            except StopIteration:
+                exhausted = True
+                break
+            pending_size += len(pending[-1])
@@ -0,0 +1 @@
+"""Unit tests of the testsuite itself, they do not need any cluster"""
@@ -0,0 +1,60 @@
+"""Tests of ConvergenceProbe against a client returning prepared responses"""
+
+import pytest
+from httpx import Response, ConnectError
+
+from testsuite.httpx import Result
+from testsuite.httpx.probe import ConvergenceProbe
+
+
+class StubClient:
+    """Client which answers requests with the prepared status codes (or errors), repeating the last one"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request_once(self, method, url, **kwargs):
+        """Records the request and returns the next prepared Result"""
+        self.requests.append((method, url, kwargs))
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, Exception):
+            return Result(retry_codes=set(), error=response)
+        return Result(retry_codes=set(), response=Response(response))
+
+
+def probe(client):
+    """Probe which gives up quickly"""
+    return ConvergenceProbe(client, timeout=0.5, initial_interval=0.001, max_interval=0.01)
+
+
+def test_status():
+    """Probe repeats the request until it returns the status code"""
+    client = StubClient(503, ConnectError("Connection refused"), 200)
+    result = probe(client).status(200, "/anything", headers={"key": "value"})
+
+    assert result.status_code == 200
+    assert len(client.requests) == 3
+    assert client.requests[0] == ("GET", "/anything", {"headers": {"key": "value"}})
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_denied(status_code):
+    """Both authentication and authorization failures count as denied"""
+    client = StubClient(200, status_code)
+    assert probe(client).denied().status_code == status_code
+
+
+def test_limited():
+    """Probe sends `count` + 1 requests per attempt"""
+    client = StubClient(200, 200, 200, 429)
+    probe(client).limited(2)
+
+    assert len(client.requests) == 6
+
+
+def test_timeout():
+    """Probe fails with AssertionError if the expected response does not come in time"""
+    client = StubClient(503)
+    with pytest.raises(AssertionError, match="did not converge"):
+        probe(client).status(200)
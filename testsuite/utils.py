@@ -2,23 +2,27 @@
 
 import csv
 import enum
+import functools
 import json
+import multiprocessing
 import os
 import getpass
+import ipaddress
 import secrets
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from time import sleep
 from collections.abc import Collection
 from copy import deepcopy
 from dataclasses import is_dataclass, fields
 from importlib import resources
 from io import StringIO
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 from urllib.parse import urlparse, ParseResult
 
 import dns.resolver
 from weakget import weakget
 
-from testsuite.certificates import Certificate, CFSSLClient, CertInfo
+from testsuite.certificates import Certificate, CertificateSigner, CertInfo
 
 MESSAGE_1KB = resources.files("testsuite.resources.performance.files").joinpath("message_1kb.txt")
 
@@ -55,13 +59,28 @@ def _whoami():
         return str(os.getuid())
 
 
+# Smaller certificate trees are generated in the current process, as starting the pool would take longer
+PARALLEL_CERTIFICATES_THRESHOLD = 3
+
+
+@functools.cache
+def _certificate_executor() -> ProcessPoolExecutor:
+    """Process pool shared by all cert_builder calls, key generation is CPU-bound"""
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
+
+
+def _count_certificates(chain: dict) -> int:
+    return sum(1 + _count_certificates(info.children or {}) if info else 1 for info in chain.values())
+
+
 def cert_builder(
-    cfssl: CFSSLClient, chain: dict, hosts: Union[str, Collection[str]] = None, parent: Certificate = None
+    cfssl: CertificateSigner, chain: dict, hosts: Union[str, Collection[str]] = None, parent: Certificate = None
 ) -> Dict[str, Certificate]:
     """
-    Recursively create certificates based on their given CertInfo.
+    Create certificates based on their given CertInfo.
     If CertInfo has children or is marked as CA, it will be generated as a Certificate Authority,
      otherwise it will be a Certificate.
+    Siblings are generated concurrently in a process pool, every Certificate Authority before its children.
     Example input:
         {"envoy_ca": CertInfo(children={
             "envoy_cert": None,
@@ -70,23 +89,39 @@ def cert_builder(
         }
     Will generate envoy_ca as a Certificate Authority with two certificate (envoy_cert, valid_cert) signed by it
     """
-    result = {}
-    for name, info in chain.items():
-        if info is None:
-            info = CertInfo()
+    if _count_certificates(chain) < PARALLEL_CERTIFICATES_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return _build_certificates(executor, cfssl, chain, hosts, parent)
+    return _build_certificates(_certificate_executor(), cfssl, chain, hosts, parent)
 
-        parsed_hosts: Collection[str] = info.hosts or hosts  # type: ignore
-        if isinstance(parsed_hosts, str):
-            parsed_hosts = [parsed_hosts]  # type: ignore
-
-        if info.ca or info.children:
-            cert = cfssl.create_authority(name, names=info.names, hosts=parsed_hosts, certificate_authority=parent)
-        else:
-            cert = cfssl.create(name, names=info.names, hosts=parsed_hosts, certificate_authority=parent)
 
-        if info.children is not None:
-            result.update(cert_builder(cfssl, info.children, parsed_hosts, cert))
-        result[name] = cert
+def _build_certificates(
+    executor: Executor, cfssl: CertificateSigner, chain: dict, hosts, parent: Optional[Certificate]
+) -> Dict[str, Certificate]:
+    """Generates certificates of the tree in the executor, submitting children once their parent is ready"""
+    result = {}
+    pending: dict[Future, tuple[str, CertInfo, Collection[str]]] = {}
+
+    def _submit(nodes: dict, hosts, parent):
+        for name, info in nodes.items():
+            if info is None:
+                info = CertInfo()
+
+            parsed_hosts: Collection[str] = info.hosts or hosts  # type: ignore
+            if isinstance(parsed_hosts, str):
+                parsed_hosts = [parsed_hosts]  # type: ignore
+
+            future = executor.submit(cfssl.create_from_info, name, info, parsed_hosts, parent)
+            pending[future] = (name, info, parsed_hosts)
+
+    _submit(chain, hosts, parent)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, info, parsed_hosts = pending.pop(future)
+            result[name] = future.result()
+            if info.children is not None:
+                _submit(info.children, parsed_hosts, result[name])
     return result
 
 
@@ -191,6 +226,20 @@ def hostname_to_ip(address: str) -> str:
     return address
 
 
+def is_local_address(address: Optional[str]) -> bool:
+    """
+    Returns True if nothing outside of this machine can connect to the address, i.e. it is a loopback address,
+    unspecified (0.0.0.0) address or not set at all
+    """
+    if not address or address == "localhost":
+        return True
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return ip.is_loopback or ip.is_unspecified
+
+
 def is_nxdomain(hostname: str):
     """
     Returns True if hostname has no `A` or `AAAA` records in DNS. False otherwise.